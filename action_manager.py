@@ -1,14 +1,18 @@
 # -*- coding: utf-8 -*-
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog # simpledialog for prompt_compression_options (though not directly used there)
+from tkinter import ttk, messagebox, simpledialog, filedialog # simpledialog for prompt_compression_options (though not directly used there)
 import os
 import shutil
-import threading
 from datetime import datetime
 
 import operations # For calling threaded operations
-from utils import BACKUP_FOLDER_BASENAME # Yedekleme klasörü adı için
+from job_scheduler import PRIORITY_LOW # Sıkıştırma ve EXE çevirme arka plan işleri olarak çalışır
+from parallel_zip import CompressionPolicy # Zaten sıkıştırılmış dosyaları saklamak için
+from cancellation import OperationCancelled # Geri yükleme iptali için
+import differential_backup # Fark yedeklerinin zincirle geri yüklenmesi için
+from backup_store import BackupStore # İçerik adresli yedek deposu
+from utils import BACKUP_FOLDER_BASENAME, BACKUP_STORE_DIRNAME # Yedekleme klasörü adı için
 
 class ActionManager:
     def __init__(self, app_instance):
@@ -31,6 +35,20 @@ class ActionManager:
         include_subfolders_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(main_frame, text="Alt klasörleri dahil et", variable=include_subfolders_var).pack(pady=5, anchor='w')
 
+        # Zip, mp3, png, exe, db gibi dosyaları tekrar sıkıştırmak zaman kaybıdır
+        store_compressed_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(main_frame, text="Zaten sıkıştırılmış dosyaları sıkıştırmadan sakla (zip, mp3, png, exe...)",
+                        variable=store_compressed_var).pack(pady=(0, 5), anchor='w')
+
+        # Yedek türü: tam ZIP, fark ZIP'i (son yedekten beri değişenler) veya içerik adresli depo
+        backup_mode_var = tk.StringVar(value="full")
+        ttk.Radiobutton(main_frame, text="Tam yedek (ZIP)", value="full",
+                        variable=backup_mode_var).pack(anchor='w')
+        ttk.Radiobutton(main_frame, text="Fark yedeği (yalnızca son yedekten beri değişen dosyalar)", value="differential",
+                        variable=backup_mode_var).pack(anchor='w')
+        ttk.Radiobutton(main_frame, text="Yedek deposu (aynı içerik yalnızca bir kez saklanır)", value="store",
+                        variable=backup_mode_var).pack(pady=(0, 5), anchor='w')
+
         ttk.Label(main_frame, text="Dosya Deseni (örn: *.*, *.txt, resim_*.jpg):").pack(anchor='w', pady=(5,0))
         file_pattern_var = tk.StringVar(value="*.*")
         ttk.Entry(main_frame, textvariable=file_pattern_var, width=40).pack(fill='x', expand=True, pady=(0,5))
@@ -82,7 +100,9 @@ class ActionManager:
             print(f"🔧 DEBUG: Birleştirilmiş exclusion: '{combined_exclusion}'")
             
             dialog.destroy()
-            self._execute_compression(folder_path, include_subfolders_var.get(), file_pattern_var.get(), zip_name_var.get(), combined_exclusion)
+            self._execute_compression(folder_path, include_subfolders_var.get(), file_pattern_var.get(), zip_name_var.get(), combined_exclusion,
+                                      store_compressed_var.get(), backup_mode_var.get() == "differential",
+                                      backup_mode_var.get() == "store")
 
         def on_cancel():
             dialog.destroy()
@@ -104,7 +124,8 @@ class ActionManager:
             patterns.update([p.strip() for p in global_pattern.split(',') if p.strip()])
         return ", ".join(sorted(patterns))
 
-    def _execute_compression(self, source_folder_path, include_subfolders, file_pattern, user_zip_filename, exclusion_pattern=""):
+    def _execute_compression(self, source_folder_path, include_subfolders, file_pattern, user_zip_filename, exclusion_pattern="",
+                             store_compressed=True, differential=False, use_store=False):
         # backup_dir_name = "backups" # utils'den BACKUP_FOLDER_BASENAME kullanılacak
         abs_source_folder_path = os.path.abspath(source_folder_path)
         abs_backup_dir_path = os.path.abspath(os.path.join(self.app.base_path, BACKUP_FOLDER_BASENAME))
@@ -118,58 +139,245 @@ class ActionManager:
         normcase_abs_zip_file_path = os.path.normcase(abs_zip_file_path)
 
         self.app.status_label.config(text=f"'{folder_name}' sıkıştırılıyor...")
-        self.app.activity_progressbar.pack(side=tk.RIGHT, padx=5, pady=2)
-        self.app.activity_progressbar.start(10)
-        self.app.update_idletasks()
-        self.app.long_operation_in_progress = True
         
         print(f"🔧 DEBUG: Sıkıştırma başlatılıyor - Kaynak: {abs_source_folder_path}")
         print(f"🔧 DEBUG: Exclusion pattern: '{exclusion_pattern}'")
+        print(f"🔧 DEBUG: Sıkıştırılmış dosyaları sakla: {store_compressed}, fark yedeği: {differential}, depo: {use_store}")
+        
+        # Politika her dosya için uzantıya ve ilk bloğun entropisine göre STORED/DEFLATED seçer
+        compression_policy = CompressionPolicy() if store_compressed else None
+        
+        if use_store:
+            # Depoda ZIP yerine anlık görüntü oluşur; adı ZIP adından türetilir
+            snapshot_name = os.path.splitext(zip_filename)[0]
+            self.app.job_scheduler.submit(
+                f"Depo yedeği: {folder_name}",
+                lambda job: operations.perform_store_backup_in_thread(self.app, abs_source_folder_path, include_subfolders,
+                                                                      snapshot_name, self.get_backup_store().root,
+                                                                      normcase_abs_backup_dir_path, folder_name,
+                                                                      file_pattern, exclusion_pattern,
+                                                                      job.cancel_token, job.report_progress,
+                                                                      compression_policy),
+                root=abs_source_folder_path, priority=PRIORITY_LOW)
+            return
         
-        thread = threading.Thread(target=operations.perform_compression_in_thread,
-                                   args=(self.app, abs_source_folder_path, include_subfolders,
-                                         abs_zip_file_path, normcase_abs_zip_file_path,
-                                         abs_backup_dir_path, normcase_abs_backup_dir_path, folder_name,
-                                         BACKUP_FOLDER_BASENAME, file_pattern, exclusion_pattern))
-        thread.daemon = True
-        thread.start()
-
-    def _handle_compression_success(self, folder_name, abs_zip_file_path, abs_backup_dir_path):
-        self.app.activity_progressbar.stop()
+        # Sıkıştırma uzun süren bir arka plan işi olduğundan düşük öncelikle çalışır
+        self.app.job_scheduler.submit(
+            f"Sıkıştırma: {folder_name}",
+            lambda job: operations.perform_compression_in_thread(self.app, abs_source_folder_path, include_subfolders,
+                                                                 abs_zip_file_path, normcase_abs_zip_file_path,
+                                                                 abs_backup_dir_path, normcase_abs_backup_dir_path, folder_name,
+                                                                 BACKUP_FOLDER_BASENAME, file_pattern, exclusion_pattern,
+                                                                 job.cancel_token, job.report_progress,
+                                                                 compression_policy=compression_policy,
+                                                                 differential=differential),
+            root=abs_source_folder_path, priority=PRIORITY_LOW)
+
+    def _handle_compression_success(self, folder_name, abs_zip_file_path, abs_backup_dir_path, compression_stats=None):
         self.app.status_label.config(text=f"'{folder_name}' başarıyla sıkıştırıldı.")
         self.app.update_idletasks()
-        self.app.long_operation_in_progress = False
         history_message = f"'{folder_name}' -> '{os.path.basename(abs_zip_file_path)}' ({abs_backup_dir_path})"
-        self.app.db.add_history(f"Sıkıştırıldı: {history_message}", event_type="compress")
+        # Son ölçümler kapasite planlaması için geçmişe yazılır
+        throughput = (compression_stats or {}).get("throughput")
+        self.app.db.add_history(f"Sıkıştırıldı: {history_message}", event_type="compress", details=throughput)
         messagebox.showinfo("Sıkıştırma Başarılı",
                             f"'{folder_name}' klasörü başarıyla sıkıştırıldı.\n\n"
-                            f"Kaydedilen yer: {abs_zip_file_path}",
+                            f"Kaydedilen yer: {abs_zip_file_path}"
+                            f"{self._format_throughput_summary(throughput)}"
+                            f"{self._format_differential_summary(compression_stats)}"
+                            f"{self._format_stored_members_summary(compression_stats)}",
                             parent=self.app)
-        self.app.activity_progressbar.pack_forget()
         self.app.file_browser.populate_file_list(abs_backup_dir_path) # Call via app.file_browser
         self.app.status_label.config(text="Hazır.")
         self.app.update_idletasks()
 
+    def _format_throughput_summary(self, throughput):
+        """Süre, hız ve sıkıştırma oranı özetini oluşturur."""
+        if not throughput:
+            return ""
+        summary = (f"\n\n{throughput['files_done']} dosya, {self.app.format_file_size(throughput['bytes_done'])} "
+                   f"→ {self.app.format_file_size(throughput['zip_size'])}\n"
+                   f"Süre: {throughput['elapsed_seconds']:.1f} sn, "
+                   f"{self.app.format_file_size(int(throughput['bytes_per_second']))}/sn, "
+                   f"{throughput['files_per_second']:.1f} dosya/sn")
+        if throughput.get("compression_ratio") is not None:
+            summary += f"\nSıkıştırma oranı: %{throughput['compression_ratio'] * 100:.0f}"
+        return summary
+
+    def _format_differential_summary(self, compression_stats):
+        """Fark yedeği istendiyse başarı mesajına eklenecek özeti oluşturur."""
+        differential_stats = (compression_stats or {}).get("differential")
+        if not differential_stats or not differential_stats.get("requested"):
+            return ""
+        if not differential_stats.get("base"):
+            return "\n\nBu klasörün önceki yedeği bulunamadı; tam yedek alındı."
+        return (f"\n\nFark yedeği (temel: {differential_stats['base']})\n"
+                f"Yeni/değişen: {differential_stats['added']}, değişmeyen: {differential_stats['unchanged']}, "
+                f"silinen: {differential_stats['deleted']}")
+
+    def _format_stored_members_summary(self, compression_stats, max_listed=15):
+        """Sıkıştırılmadan saklanan üyeler için başarı mesajına eklenecek özeti oluşturur.
+
+        Args:
+            compression_stats: ParallelZipWriter.stats sözlüğü (None olabilir).
+            max_listed: Adı listelenecek en fazla üye sayısı.
+
+        Returns:
+            str: Özet metni; saklanan üye yoksa boş string.
+        """
+        if not compression_stats or not compression_stats.get("stored_members"):
+            return ""
+        stored_members = compression_stats["stored_members"]
+        summary = (f"\n\nSıkıştırılmadan saklanan dosyalar: {len(stored_members)} "
+                   f"({self.app.format_file_size(compression_stats['stored_bytes'])})\n"
+                   f"Tahmini kazanılan süre: {compression_stats['estimated_saved_seconds']:.1f} sn\n")
+        summary += "\n".join(f"  • {name}" for name in sorted(stored_members)[:max_listed])
+        if len(stored_members) > max_listed:
+            summary += f"\n  ... ve {len(stored_members) - max_listed} dosya daha"
+        return summary
+
     def _handle_compression_error(self, folder_name, e, abs_zip_file_path):
-        self.app.activity_progressbar.stop()
         self.app.status_label.config(text="Sıkıştırma hatası!")
         self.app.update_idletasks()
-        self.app.long_operation_in_progress = False
         messagebox.showerror("Sıkıştırma Hatası",
                              f"'{folder_name}' klasörü sıkıştırılırken bir hata oluştu:\n{e}",
                              parent=self.app)
-        self.app.activity_progressbar.pack_forget()
         self.app.status_label.config(text="Hazır.")
         self.app.update_idletasks()
-        if os.path.exists(abs_zip_file_path):
+        # Depo yedeğinde ZIP dosyası yoktur (None)
+        if abs_zip_file_path and os.path.exists(abs_zip_file_path):
+            try: os.remove(abs_zip_file_path)
+            except OSError: pass
+
+    def _handle_compression_cancelled(self, folder_name, abs_zip_file_path):
+        """Sıkıştırma iptal edildiğinde yarım kalan ZIP dosyasını siler ve UI'ı sıfırlar."""
+        if abs_zip_file_path and os.path.exists(abs_zip_file_path):
             try: os.remove(abs_zip_file_path)
             except OSError: pass
+        self.app.status_label.config(text=f"'{folder_name}' sıkıştırması iptal edildi.")
+        self.app.update_idletasks()
+
+    # --- Backup Store Methods ---
+    def get_backup_store(self):
+        """Yedekler klasöründeki içerik adresli yedek deposunu döndürür."""
+        return BackupStore(os.path.join(self.app.base_path, BACKUP_FOLDER_BASENAME, BACKUP_STORE_DIRNAME))
+
+    def open_backup_store_window(self):
+        """Depodaki anlık görüntüleri listeleyen pencereyi açar."""
+        from ui_dialogs import BackupStoreWindow
+        BackupStoreWindow(self.app, self.get_backup_store())
+
+    def _handle_store_backup_success(self, folder_name, snapshot_name, stats):
+        self.app.db.add_history(f"Depoya yedeklendi: '{folder_name}' -> '{snapshot_name}' "
+                                f"({stats['new_blobs']} yeni içerik)", event_type="compress")
+        self.app.status_label.config(text="Hazır.")
+        messagebox.showinfo("Depo Yedeği Başarılı",
+                            f"'{folder_name}' klasörü '{snapshot_name}' adıyla yedek deposuna kaydedildi.\n\n"
+                            f"Dosya: {stats['file_count']}\n"
+                            f"Değişmediği için okunmayan: {stats['reused_files']}\n"
+                            f"Depoda zaten bulunan içerik: {stats['deduplicated_files']}\n"
+                            f"Yeni içerik: {stats['new_blobs']} ({self.app.format_file_size(stats['new_blob_bytes'])})",
+                            parent=self.app)
+
+    def restore_store_snapshot(self, store, snapshot_name, parent=None):
+        """Depodaki anlık görüntüyü seçilen klasöre geri yükler (arka plan işi olarak)."""
+        target_dir = filedialog.askdirectory(title="Geri yükleme klasörünü seçin", parent=parent or self.app)
+        if not target_dir:
+            return
+        self.app.status_label.config(text=f"'{snapshot_name}' geri yükleniyor...")
+
+        def run(job):
+            try:
+                restored_count = store.restore_snapshot(snapshot_name, target_dir, job.cancel_token, job.report_progress)
+            except OperationCancelled:
+                self.app.after(0, lambda: self.app.status_label.config(text="Geri yükleme iptal edildi."))
+                raise
+            except Exception as e:
+                error_message = str(e)
+                self.app.after(0, self._handle_restore_error, snapshot_name, error_message)
+                raise
+            self.app.after(0, self._handle_restore_success, snapshot_name, target_dir, restored_count)
+
+        self.app.job_scheduler.submit(f"Geri yükleme: {snapshot_name}", run, root=target_dir, priority=PRIORITY_LOW)
+
+    def delete_store_snapshot(self, store, snapshot_name, on_deleted=None):
+        """Anlık görüntüyü siler ve kullanılmayan içerikleri temizler (arka plan işi olarak)."""
+        def run(job):
+            try:
+                removed_count, removed_bytes = store.delete_snapshot(snapshot_name)
+            except Exception as e:
+                error_message = str(e)
+                self.app.after(0, lambda: messagebox.showerror("Silme Hatası", error_message, parent=self.app))
+                # Manifest silinip temizlik yapılamadıysa liste yine de güncellenmeli
+                if on_deleted is not None and not os.path.exists(store.snapshot_path(snapshot_name)):
+                    self.app.after(0, on_deleted)
+                raise
+            print(f"🔧 DEBUG: '{snapshot_name}' silindi; {removed_count} blob ({removed_bytes} bayt) temizlendi")
+            self.app.after(0, lambda: self.app.status_label.config(
+                text=f"'{snapshot_name}' silindi, {self.app.format_file_size(removed_bytes)} boşaltıldı."))
+            if on_deleted is not None:
+                self.app.after(0, on_deleted)
+
+        self.app.job_scheduler.submit(f"Depo temizliği: {snapshot_name}", run, root=store.root, priority=PRIORITY_LOW)
+
+    # --- Backup Restore Methods ---
+    def prompt_restore_backup(self, zip_file_path):
+        """Yedeğin tam anlık görüntüsünü (fark yedeklerinde zinciriyle) seçilen klasöre geri yükler."""
+        try:
+            chain = differential_backup.resolve_chain(zip_file_path)
+        except differential_backup.BackupChainError as e:
+            messagebox.showerror("Geri Yükleme Hatası", f"Yedek zinciri çözülemedi:\n{e}", parent=self.app)
+            return
+
+        target_dir = filedialog.askdirectory(title="Geri yükleme klasörünü seçin", parent=self.app)
+        if not target_dir:
+            return
+        zip_name = os.path.basename(zip_file_path)
+        if len(chain) > 1 and not messagebox.askyesno(
+                "Yedeği Geri Yükle",
+                f"'{zip_name}' bir fark yedeğidir; {len(chain)} yedekten oluşan zincir birleştirilerek "
+                f"'{target_dir}' klasörüne geri yüklenecek.\n\nDevam edilsin mi?",
+                parent=self.app):
+            return
+
+        self.app.status_label.config(text=f"'{zip_name}' geri yükleniyor...")
+        self.app.job_scheduler.submit(
+            f"Geri yükleme: {zip_name}",
+            lambda job: self._run_restore_job(job, zip_file_path, target_dir),
+            root=target_dir, priority=PRIORITY_LOW)
+
+    def _run_restore_job(self, job, zip_file_path, target_dir):
+        """Geri yükleme işini çalıştırır (worker thread'i); sonucu arayüz thread'ine iletir."""
+        try:
+            restored_count = differential_backup.restore_snapshot(zip_file_path, target_dir, job.cancel_token,
+                                                                  job.report_progress)
+        except OperationCancelled:
+            self.app.after(0, lambda: self.app.status_label.config(text="Geri yükleme iptal edildi."))
+            raise
+        except Exception as e:
+            error_message = str(e)
+            self.app.after(0, self._handle_restore_error, zip_file_path, error_message)
+            raise
+        self.app.after(0, self._handle_restore_success, zip_file_path, target_dir, restored_count)
+
+    def _handle_restore_success(self, backup_path, target_dir, restored_count):
+        """Geri yükleme sonucunu bildirir; backup_path ZIP yolu veya depo anlık görüntüsü adıdır."""
+        backup_name = os.path.basename(backup_path)
+        self.app.db.add_history(f"Yedek geri yüklendi: '{backup_name}' -> '{target_dir}' ({restored_count} dosya)",
+                                event_type="zip_extraction")
+        self.app.status_label.config(text="Hazır.")
+        messagebox.showinfo("Geri Yükleme Başarılı",
+                            f"'{backup_name}' yedeğinden {restored_count} dosya geri yüklendi.\n\nHedef: {target_dir}",
+                            parent=self.app)
+
+    def _handle_restore_error(self, backup_path, error_message):
+        self.app.status_label.config(text="Geri yükleme hatası!")
+        messagebox.showerror("Geri Yükleme Hatası",
+                             f"'{os.path.basename(backup_path)}' geri yüklenirken bir hata oluştu:\n{error_message}",
+                             parent=self.app)
 
     # --- EXE Conversion Methods ---
     def convert_py_to_exe(self, py_file_path):
-        if self.app.long_operation_in_progress:
-            messagebox.showwarning("İşlem Devam Ediyor", "Başka bir uzun süreli işlem (sıkıştırma veya EXE çevirme) zaten devam ediyor.", parent=self.app)
-            return
         py_file_name = os.path.basename(py_file_path)
         if not messagebox.askyesno("EXE'ye Çevir",
                                    f"'{py_file_name}' dosyasını tek bir EXE dosyasına çevirmek istediğinizden emin misiniz?\n\n"
@@ -181,14 +389,11 @@ class ActionManager:
             messagebox.showerror("Hata", "PyInstaller bulunamadı.\nLütfen PyInstaller'ı kurun ve PATH ortam değişkeninize ekleyin.", parent=self.app)
             return
         self.app.status_label.config(text=f"'{py_file_name}' EXE'ye çevriliyor...")
-        self.app.activity_progressbar.pack(side=tk.RIGHT, padx=5, pady=2)
-        self.app.activity_progressbar.start(10)
-        self.app.update_idletasks()
-        self.app.long_operation_in_progress = True
-        thread = threading.Thread(target=operations.perform_exe_conversion_in_thread,
-                                   args=(self.app, py_file_path, pyinstaller_exe))
-        thread.daemon = True
-        thread.start()
+        self.app.job_scheduler.submit(
+            f"EXE çevirme: {py_file_name}",
+            lambda job: operations.perform_exe_conversion_in_thread(self.app, py_file_path, pyinstaller_exe,
+                                                                    job.cancel_token, job.report_progress),
+            root=os.path.dirname(os.path.abspath(py_file_path)), priority=PRIORITY_LOW)
 
     def _handle_exe_conversion_success(self, original_py_name, exe_path):
         messagebox.showinfo("Başarılı", f"'{original_py_name}' başarıyla '{os.path.basename(exe_path)}' olarak EXE'ye çevrildi.\n\nKaydedilen yer: {exe_path}", parent=self.app)
@@ -197,9 +402,9 @@ class ActionManager:
     def _handle_exe_conversion_error(self, original_py_name, error_message):
         messagebox.showerror("EXE Çevirme Hatası", f"'{original_py_name}' dosyası EXE'ye çevrilirken hata oluştu:\n\n{error_message}", parent=self.app)
 
+    def _handle_exe_conversion_cancelled(self, original_py_name):
+        print(f"🔧 DEBUG: '{original_py_name}' EXE çevirme işlemi iptal edildi")
+
     def _finalize_exe_conversion_ui(self):
-        self.app.activity_progressbar.stop()
-        self.app.activity_progressbar.pack_forget()
         self.app.status_label.config(text="Hazır.")
-        self.app.update_idletasks()
-        self.app.long_operation_in_progress = False
\ No newline at end of file
+        self.app.update_idletasks()
\ No newline at end of file
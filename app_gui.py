@@ -12,8 +12,10 @@ from datetime import datetime
 import sys
 
 # Yerel modüllerden importlar
-from utils import DB_NAME, DEFAULT_DARK_THEME_COLORS, ICON_FOLDER, ICON_PYTHON_FILE, ICON_COMPRESS, ICON_EXECUTABLE, ICON_UNKNOWN, ICON_DATABASE_FILE, ICON_ARROW_UP, ICON_ARROW_DOWN, BACKUP_FOLDER_BASENAME, ICON_MP3_FILE, ICON_PLAY_BUTTON, ICON_PAUSE_BUTTON, ICON_STOP_BUTTON
+from utils import DB_NAME, FILE_INDEX_DB_NAME, DEFAULT_DARK_THEME_COLORS, ICON_FOLDER, ICON_PYTHON_FILE, ICON_COMPRESS, ICON_EXECUTABLE, ICON_UNKNOWN, ICON_DATABASE_FILE, ICON_ARROW_UP, ICON_ARROW_DOWN, BACKUP_FOLDER_BASENAME, ICON_MP3_FILE, ICON_PLAY_BUTTON, ICON_PAUSE_BUTTON, ICON_STOP_BUTTON
 from db_manager import DatabaseManager
+from file_index import FileIndex # Kalıcı dosya arama indeksi
+from job_scheduler import JobScheduler, PRIORITY_NORMAL # Eş zamanlı uzun işlemler için
 from ui_dialogs import SearchResultsWindow, WordSearchResultsWindow # WordSearchResultsWindow'ı da ekleyin
 from favorites_manager import FavoritesManager # Yeni import
 from theme_manager import ThemeManager # Yeni import
@@ -42,6 +44,8 @@ class App(tk.Tk):
     Attributes:
         base_path: Uygulamanın çalıştığı temel dizin.
         db: Veritabanı yöneticisi (DatabaseManager).
+        file_index: Kalıcı dosya arama indeksi (FileIndex).
+        job_scheduler: Uzun işlemleri çalıştıran iş zamanlayıcısı (JobScheduler).
         style: ttk stil nesnesi.
         file_browser: Dosya tarayıcı yöneticisi.
         search_manager: Arama yöneticisi.
@@ -93,6 +97,10 @@ class App(tk.Tk):
             temp_db_check.set_setting("favorites_panel_visible", "0") # Varsayılan olarak gizli
         temp_db_check._close()
         self.db = DatabaseManager(self.db_path)
+        # Global exclusion listesindeki klasörler (.git, venv...) indekslenmez
+        self.file_index = FileIndex(os.path.join(self.base_path, FILE_INDEX_DB_NAME),
+                                    exclusion_source=self.db.get_global_exclusion_list)
+        self.job_scheduler = JobScheduler(self) # Arama, sıkıştırma, analiz gibi uzun işler
 
         self.style = ttk.Style(self)
         # Windows temalarını önceliklendir ('vista', 'xpnative'), sonra diğerleri ('clam', 'alt', 'default')
@@ -139,7 +147,7 @@ class App(tk.Tk):
         self.ui_manager = UIManager(self) # UIManager örneği
         self.execution_manager = ExecutionManager(self) # ExecutionManager örneği
         self.python_analyzer = PythonAnalyzer(self) # PythonAnalyzer örneği
-        self.dependency_analyzer = DependencyAnalyzer() # DependencyAnalyzer örneği
+        self.dependency_analyzer = DependencyAnalyzer(self.file_index) # DependencyAnalyzer örneği
 
         self.ui_manager._setup_ui() # UI kurulumu UIManager üzerinden
 
@@ -234,6 +242,9 @@ class App(tk.Tk):
         # manage_visibility=True ile çağırarak başlangıçta panel görünürlüğünü de yönetmesini sağla
         self.after_idle(lambda: self._apply_saved_sash_position(manage_visibility=True))
 
+        # Saklama süresini aşan geçmiş kayıtlarını açılıştan bir süre sonra arka planda özetle
+        self.history_manager.schedule_history_compaction()
+
     def _on_favorite_click(self, event):
         selected_item_id = self.favorites_list_treeview.focus()
         if not selected_item_id:
@@ -293,6 +304,7 @@ class App(tk.Tk):
                 current_col_widths = {
                     "#0": self.file_list.column("#0", "width"),
                     "description": self.file_list.column("description", "width"),
+                    "size": self.file_list.column("size", "width"),
                     "date_modified": self.file_list.column("date_modified", "width")
                 }
 
@@ -388,8 +400,12 @@ class App(tk.Tk):
         self.db.set_setting("favorites_panel_visible", fav_panel_is_visible_db_val)
         print(f"🔸 BİLGİ: Favori paneli görünürlüğü kaydedildi: {fav_panel_is_visible_db_val}")
 
+        self.job_scheduler.shutdown() # Süren işleri iptal et
+        self.file_browser.stop_watching() # Dosya izleyiciyi durdur
+
         print("🚩 Uygulama kapatılıyor, veritabanı bağlantısı kapatılıyor.")
         if hasattr(self, 'db') and self.db: # db örneği varsa kapat
+            self.db.flush_history() # Arka planda bekleyen geçmiş kayıtlarını yaz
             self.db._close() # Veritabanı bağlantısını kapat
         self.destroy()   # Pencereyi yok et
 
@@ -582,48 +598,15 @@ class App(tk.Tk):
             self.file_list_sort_order_asc = True
         self.file_list_sort_column = column_id
 
-        # 2. Treeview'den verileri al
-        items_data = []
-        for item_id_str in self.file_list.get_children(''):
-            item_info = self.file_list.item(item_id_str)
-            items_data.append({
-                'text': item_info['text'],
-                'values': item_info['values'], # (description, date_modified, fullpath)
-                'image': item_info['image'],
-                'tags': item_info['tags']
-            })
-
-        # 3. Sıralama anahtar fonksiyonunu tanımla
-        def get_sort_key(item):
-            if column_id == "#0":  # Dosya Adı
-                return item.get('text', '').lower()
-            elif column_id == "description": # Açıklama
-                desc = item['values'][0] if item.get('values') and len(item['values']) > 0 else ""
-                return desc.lower() if desc else ""
-            elif column_id == "date_modified": # Değiştirme Tarihi
-                date_str = item['values'][1] if item.get('values') and len(item['values']) > 1 else "N/A"
-                if date_str == "N/A":
-                    # "N/A" değerlerini sıralamanın bir ucuna yerleştir
-                    return "" if self.file_list_sort_order_asc else "~~~~~~~~~~~~~~~~~"
-                return date_str # 'YYYY-MM-DD HH:MM:SS' formatı zaten string olarak sıralanabilir
-            return item.get('text', '').lower() # Varsayılan
-
-        # 4. Sırala
-        items_data.sort(key=get_sort_key, reverse=not self.file_list_sort_order_asc)
-
-        # 5. Yeniden doldur
-        for item_id_old in self.file_list.get_children(''):
-            self.file_list.delete(item_id_old)
-
-        for data in items_data:
-            self.file_list.insert('', tk.END, text=data['text'], values=data['values'], image=data['image'], tags=data['tags'])
+        # 2. Satırları FileBrowser'daki tipli modele göre yerinde sırala
+        self.file_browser.sort_file_list(column_id, self.file_list_sort_order_asc)
 
         self._update_file_list_header_indicators()
 
     def _update_file_list_header_indicators(self):
         """Dosya listesi başlıklarındaki sıralama göstergelerini günceller."""
         if not hasattr(self, 'file_list') or not self.file_list.winfo_exists(): return
-        headers_config = {"#0": "Dosya Adı", "description": "Açıklama", "date_modified": "Değiştirme Tarihi"}
+        headers_config = {"#0": "Dosya Adı", "description": "Açıklama", "size": "Boyut", "date_modified": "Değiştirme Tarihi"}
         for col_id_key, base_text in headers_config.items():
             text_to_display = base_text
             if col_id_key == self.file_list_sort_column:
@@ -673,10 +656,7 @@ class App(tk.Tk):
                     try:
                         os.rename(p, new_path)
                         # Dosya listesinde güncelle
-                        self.file_list.item(item, text=new_name)
-                        values = list(self.file_list.item(item, "values"))
-                        values[2] = new_path
-                        self.file_list.item(item, values=values)
+                        self.file_browser.refresh_renamed_row(p, new_path)
                         self.status_label.config(text=f"Dosya adı değiştirildi: {new_name}")
                         self.db.add_history(f"Yeniden adlandırıldı: '{current_name}' -> '{new_name}' ({os.path.dirname(p)})", event_type="rename")
                     except Exception as e:
@@ -780,6 +760,11 @@ class App(tk.Tk):
                                 color="#F57C00", 
                                 bg_color="#FFF3E0",
                                 hover_color="#FFE0B2")
+                context_menu.add_command("♻️ Yedeği Geri Yükle...", 
+                                lambda p=file_path: self.action_manager.prompt_restore_backup(p),
+                                color="#F57C00", 
+                                bg_color="#FFF3E0",
+                                hover_color="#FFE0B2")
             
             elif "other_file" in item_tags:
                 context_menu.add_command("🔗 Aç (Varsayılan)", 
@@ -1621,6 +1606,7 @@ class App(tk.Tk):
             return f"{size_bytes / (1024 ** 3):,.2f} GB"
         
     def show_folder_properties(self, folder_path):
+        """Klasör özelliklerini iş olarak hesaplar; sonuç hazır olunca gösterilir."""
         # Global exclusion list'i al ve ExclusionManager oluştur
         global_exclusion = self.db.get_global_exclusion_list() or ""
         exclusion_manager = ExclusionManager(global_exclusion)
@@ -1629,7 +1615,7 @@ class App(tk.Tk):
         print(f"🔧 DEBUG: Klasör pattern'leri: {debug_info['dir_patterns']}")
         print(f"🔧 DEBUG: Dosya pattern'leri: {debug_info['file_patterns']}")
         
-        def calculate_folder_size(folder_path):
+        def calculate_folder_size(folder_path, job):
             def count_lines_in_a_file(file_number, file_path):
                 """Belirtilen dosyadaki toplam satır sayısını döner."""
                 try:
@@ -1657,57 +1643,77 @@ class App(tk.Tk):
             excluded_file_count = 0
             excluded_dir_count = 0
             
-            for dirpath, dirnames, filenames in os.walk(folder_path, topdown=True):
-                # Hariç tutulan klasörleri dirnames listesinden çıkar
-                dirs_to_remove = []
-                for dir_name in dirnames:
-                    if exclusion_manager.should_exclude_dir(dir_name):
-                        dirs_to_remove.append(dir_name)
-                        excluded_dir_count += 1
-                        print(f"🔧 DEBUG: Klasör hariç tutuluyor: {os.path.join(dirpath, dir_name)}")
-                        excluded_dir_path = os.path.join(dirpath, dir_name)
-                        # Hariç tutulan klasördeki dosyaları da say
-                        excluded_file_count += exclusion_manager.count_files_in_dir(excluded_dir_path)
-                        # print(f"🔧 DEBUG: Klasör hariç tutuluyor (Özellikler): {excluded_dir_path}")
-                
-                for d in dirs_to_remove:
-                    dirnames.remove(d)
+            # Dosya indeksini eşitle: yalnızca mtime değeri değişen klasörler yeniden listelenir
+            job.report_progress("Dosya indeksi güncelleniyor...")
+            self.file_index.refresh(folder_path, cancel_token=job.cancel_token)
+            # Yerinde düzenlenen dosyaların boyutu ve satır sayısı için kayıtlar diskle doğrulanır
+            job.report_progress("Dosyalar doğrulanıyor...")
+            self.file_index.verify_files(folder_path, [row[0] for row in self.file_index.iter_files(folder_path)],
+                                         cancel_token=job.cancel_token)
+            
+            # Hariç tutulan klasörler indekse alınmaz; dosyaları sadece sayılır
+            for excluded_dir in self.file_index.iter_excluded_dirs(folder_path):
+                excluded_dir_count += 1
+                excluded_file_count += exclusion_manager.count_files_in_dir(excluded_dir)
+                print(f"🔧 DEBUG: Klasör hariç tutuluyor: {excluded_dir}")
+            
+            job.report_progress("Dosyalar sayılıyor...")
+            new_line_counts = []
+            for file_path, _dir_path, file, size, _mtime, line_count in self.file_index.iter_files(folder_path):
+                if file_count % 256 == 0:
+                    job.cancel_token.raise_if_cancelled()
+                # Exclusion kontrolü (sadece dosya adı pattern'leri için)
+                if exclusion_manager.should_exclude_file(file):
+                    excluded_file_count += 1
+                    continue
                 
-                for file in filenames:
-                    file_path = os.path.join(dirpath, file)
-                    
-                    # Exclusion kontrolü (sadece dosya adı pattern'leri için)
-                    if exclusion_manager.should_exclude_file(file):
-                        excluded_file_count += 1
-                        # print(f"🔧 DEBUG: Dosya hariç tutuluyor (Özellikler): {file_path}")
-                        continue
-                    
-                    if os.path.isfile(file_path):
-                        total_size += os.path.getsize(file_path)
-                        file_count += 1
-                    if os.path.splitext(file)[1].lower() == ".py":
-                        py_file_count += 1
-                        py_line_count += count_lines_in_a_file(py_file_count, file_path)
-                        total_python_size += os.path.getsize(file_path)
-                    if os.path.splitext(file)[1].lower() == ".zip":
-                        zip_file_count += 1
-                        total_zip_size += os.path.getsize(file_path)
-                    if os.path.splitext(file)[1].lower() == ".html":
-                        HTML_file_count += 1
-                        HTML_line_count += count_lines_in_a_file(HTML_file_count, file_path)
-                        total_HTML_size += os.path.getsize(file_path)
+                total_size += size
+                file_count += 1
+                extension = os.path.splitext(file)[1].lower()
+                if extension in (".py", ".html") and line_count is None:
+                    # Satır sayısı önbellekte yoksa hesapla ve indekse yaz
+                    line_count = count_lines_in_a_file(file_count, file_path)
+                    new_line_counts.append((file_path, line_count))
+                if extension == ".py":
+                    py_file_count += 1
+                    py_line_count += line_count
+                    total_python_size += size
+                if extension == ".zip":
+                    zip_file_count += 1
+                    total_zip_size += size
+                if extension == ".html":
+                    HTML_file_count += 1
+                    HTML_line_count += line_count
+                    total_HTML_size += size
+            
+            self.file_index.set_line_counts(folder_path, new_line_counts)
             
             return (total_size, total_python_size, total_HTML_size, file_count, py_file_count, 
                     HTML_file_count, py_line_count, HTML_line_count, zip_file_count, total_zip_size, 
                     HTML_file_count, total_HTML_size, excluded_file_count, excluded_dir_count)
 
-        """Open a folder dialog, calculate its size, and display the result."""
+        def run(job):
+            try:
+                result = calculate_folder_size(folder_path, job)
+            except Exception as e:
+                error_message = str(e)
+                if not job.cancel_token.is_cancelled:
+                    self.after(0, lambda: messagebox.showerror("Klasör Özellikleri Hatası",
+                                                               f"Klasör özellikleri hesaplanırken hata oluştu:\n{error_message}",
+                                                               parent=self))
+                raise
+            self.after(0, self._finish_folder_properties, folder_path, result)
+
         print(f"🔧 DEBUG: '{folder_path}' Klasör özellikleri hesaplanıyor...")
         print(f"🔧 DEBUG: Global exclusion list: {exclusion_manager.raw_patterns}")
-        
+        self.job_scheduler.submit(f"Klasör özellikleri: {os.path.basename(folder_path) or folder_path}", run,
+                                  root=folder_path, priority=PRIORITY_NORMAL)
+
+    def _finish_folder_properties(self, folder_path, result):
+        """Klasör özellikleri hesaplandığında sonucu gösterir."""
         (folder_size, total_python_size, total_HTML_size, file_count, py_file_count, 
          HTML_file_count, py_line_count, HTML_line_count, zip_file_count, total_zip_size, 
-         _, _, excluded_file_count, excluded_dir_count) = calculate_folder_size(folder_path)
+         _, _, excluded_file_count, excluded_dir_count) = result
         
         result_HTML = f"HTML Dosya Sayısı: {HTML_file_count:,}\nToplam HTML Boyutu: {self.format_file_size(total_HTML_size)}\n" + \
                 f"Toplam HTML Satır Sayısı: {HTML_line_count:,}" if HTML_file_count > 0 else ""
@@ -1727,7 +1733,7 @@ class App(tk.Tk):
                  f"{result_HTML}" + \
                  f"{exclusion_info}"
 
-        messagebox.showinfo("Klasör Özellikleri",  sonuc)
+        messagebox.showinfo("Klasör Özellikleri",  sonuc, parent=self)
 
     def show_dir_context_menu(self, event):
         """Klasör ağacında sağ tıklandığında içerik menüsünü gösterir."""
@@ -1755,18 +1761,25 @@ class App(tk.Tk):
     # Sıkıştırma ve EXE'ye çevirme metodları ActionManager sınıfına taşındı.
     # Aşağıdakiler, operations.py'den geri çağrılar için delegasyon metodlarıdır.
 
-    def _handle_compression_success(self, folder_name, abs_zip_file_path, abs_backup_dir_path):
-        self.action_manager._handle_compression_success(folder_name, abs_zip_file_path, abs_backup_dir_path)
+    def _handle_compression_success(self, folder_name, abs_zip_file_path, abs_backup_dir_path, compression_stats=None):
+        self.action_manager._handle_compression_success(folder_name, abs_zip_file_path, abs_backup_dir_path,
+                                                        compression_stats)
 
     def _handle_compression_error(self, folder_name, e, abs_zip_file_path):
         self.action_manager._handle_compression_error(folder_name, e, abs_zip_file_path)
 
+    def _handle_compression_cancelled(self, folder_name, abs_zip_file_path):
+        self.action_manager._handle_compression_cancelled(folder_name, abs_zip_file_path)
+
     def _handle_exe_conversion_success(self, original_py_name, exe_path):
         self.action_manager._handle_exe_conversion_success(original_py_name, exe_path)
 
     def _handle_exe_conversion_error(self, original_py_name, error_message):
         self.action_manager._handle_exe_conversion_error(original_py_name, error_message)
 
+    def _handle_exe_conversion_cancelled(self, original_py_name):
+        self.action_manager._handle_exe_conversion_cancelled(original_py_name)
+
     def _finalize_exe_conversion_ui(self):
         self.action_manager._finalize_exe_conversion_ui()
 
@@ -1796,6 +1809,15 @@ class App(tk.Tk):
         from ui_dialogs import GeneralSettingsWindow
         GeneralSettingsWindow(self)
 
+    def open_jobs_window(self):
+        """Bekleyen, çalışan ve son biten işleri gösteren İşler panelini açar."""
+        from ui_dialogs import JobsWindow
+        JobsWindow(self)
+
+    def open_backup_store_window(self):
+        """İçerik adresli yedek deposundaki anlık görüntüleri listeleyen pencereyi açar."""
+        self.action_manager.open_backup_store_window()
+
     def open_window_settings_dialog(self):
         """Pencere geometrisi ayarlarını yönetmek için pencere açar. (Eski adı: show_window_settings)"""
         settings_win = tk.Toplevel(self)
@@ -2026,23 +2048,37 @@ class App(tk.Tk):
         )
 
     def show_dependency_analysis(self, file_path):
-        """Python dosyası için dependency analizi yapıp sonuçları gösterir."""
-        try:
-            # Proje dosyalarını keşfet
-            project_files = self.python_analyzer._discover_project_files(file_path)
-            
-            # Dependency analizi yap
-            dependency_results = self.dependency_analyzer.analyze_project_dependencies(project_files)
-            
-            # Analiz penceresini göster
-            self._show_dependency_analysis_results(file_path, dependency_results, project_files)
-            
-            # History'ye kaydet
-            self.db.add_history(f"Dependency Analizi: {file_path}", "method_analysis")            
-        except Exception as e:
-            messagebox.showerror("Dependency Analizi Hatası", 
-                               f"Dependency analizi yapılırken hata oluştu:\n{e}", 
-                               parent=self)
+        """Python dosyası için dependency analizini iş olarak başlatır; sonuçlar hazır olunca gösterilir."""
+        def run(job):
+            try:
+                # Proje dosyalarını keşfet
+                job.report_progress("Proje dosyaları keşfediliyor...")
+                project_files = self.python_analyzer._discover_project_files(file_path)
+                job.cancel_token.raise_if_cancelled()
+                
+                # Dependency analizi yap
+                job.report_progress(f"{len(project_files)} dosyanın bağımlılıkları inceleniyor...")
+                dependency_results = self.dependency_analyzer.analyze_project_dependencies(project_files)
+                job.cancel_token.raise_if_cancelled()
+            except Exception as e:
+                error_message = str(e)
+                if not job.cancel_token.is_cancelled:
+                    self.after(0, lambda: messagebox.showerror("Dependency Analizi Hatası",
+                                                               f"Dependency analizi yapılırken hata oluştu:\n{error_message}",
+                                                               parent=self))
+                raise
+            self.after(0, self._finish_dependency_analysis, file_path, dependency_results, project_files)
+        
+        self.job_scheduler.submit(f"Dependency analizi: {os.path.basename(file_path)}", run,
+                                  root=os.path.dirname(os.path.abspath(file_path)), priority=PRIORITY_NORMAL)
+    
+    def _finish_dependency_analysis(self, file_path, dependency_results, project_files):
+        """Dependency analizi bittiğinde sonuç penceresini açar ve geçmişe kaydeder."""
+        # Analiz penceresini göster
+        self._show_dependency_analysis_results(file_path, dependency_results, project_files)
+        
+        # History'ye kaydet
+        self.db.add_history(f"Dependency Analizi: {file_path}", "method_analysis")
     
     def _show_dependency_analysis_results(self, file_path, results, project_files):
         """Dependency analizi sonuçlarını 4 sekmeli bir pencerede gösterir."""
@@ -0,0 +1,435 @@
+# -*- coding: utf-8 -*-
+"""
+Backup Store - İçerik Adresli Yedek Deposu Modülü
+
+Aynı projenin tekrar tekrar alınan ZIP yedekleri neredeyse aynı içeriği
+defalarca saklar. Bu depo her dosya içeriğini SHA-256 özetiyle adlandırılmış
+tek bir blob olarak (bir kez sıkıştırarak) saklar; her yedek (anlık görüntü)
+yalnızca dosya yolu -> özet eşlemesini tutan küçük bir JSON manifest'tir.
+Çoğu değişmemiş büyük bir klasörün tekrar yedeklenmesi yalnızca yeni
+blob'ların yazılması kadar zaman ve yer tutar.
+
+Klasör yapısı:
+    <depo>/objects/ab/abcdef...   zlib akışı olarak saklanan içerik (blob)
+    <depo>/snapshots/<ad>.json    anlık görüntü manifest'i
+
+Bir önceki anlık görüntüde boyutu ve değiştirilme zamanı aynı olan
+dosyaların özeti yeniden hesaplanmaz; bu dosyalar hiç okunmaz.
+
+Kullanım:
+    from backup_store import BackupStore
+
+    store = BackupStore("backups/store")
+    stats = store.create_snapshot("proje_20240101_1200", "C:\\proje", files)
+    for snapshot in store.list_snapshots():
+        print(snapshot["name"], snapshot["file_count"])
+    store.restore_snapshot("proje_20240101_1200", "C:\\geri_yukleme")
+"""
+
+import os
+import json
+import zlib
+import zipfile
+import hashlib
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from parallel_zip import DEFAULT_COMPRESSION_WORKERS, PENDING_PER_WORKER, READ_CHUNK_SIZE
+
+
+SNAPSHOT_VERSION = 1
+OBJECTS_DIRNAME = "objects"
+SNAPSHOTS_DIRNAME = "snapshots"
+SNAPSHOT_SUFFIX = ".json"
+TEMP_SUFFIX = ".tmp"
+
+# Aynı depoda yedek alma ile çöp toplamanın çakışmaması için depo başına kilit
+_store_locks = {}
+_store_locks_guard = threading.Lock()
+
+
+def _lock_for(root):
+    """Depo kökü için paylaşılan kilidi döndürür."""
+    with _store_locks_guard:
+        return _store_locks.setdefault(os.path.normcase(root), threading.Lock())
+
+
+class BackupStoreError(Exception):
+    """Depo işlemleri (eksik anlık görüntü, bozuk blob vb.) başarısız olduğunda fırlatılır."""
+
+
+class BackupStore:
+    """SHA-256 ile adreslenen blob'lar ve anlık görüntü manifest'lerinden oluşan yedek deposu.
+
+    Attributes:
+        root: Deponun kök klasörü.
+        objects_dir: Blob'ların saklandığı klasör.
+        snapshots_dir: Anlık görüntü manifest'lerinin saklandığı klasör.
+    """
+
+    def __init__(self, root):
+        """BackupStore'u başlatır; klasörler ilk yazmada oluşturulur.
+
+        Args:
+            root: Deponun kök klasörü.
+        """
+        self.root = os.path.abspath(root)
+        self.objects_dir = os.path.join(self.root, OBJECTS_DIRNAME)
+        self.snapshots_dir = os.path.join(self.root, SNAPSHOTS_DIRNAME)
+        self._stats_lock = threading.Lock()
+        self._store_lock = _lock_for(self.root)
+
+    # --- Blob'lar ---
+    def blob_path(self, digest):
+        """Özeti verilen blob'un dosya yolunu döndürür."""
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def has_blob(self, digest):
+        """Blob depoda varsa True döndürür."""
+        return os.path.isfile(self.blob_path(digest))
+
+    def _write_blob(self, file_path, policy=None, cancel_token=None):
+        """Dosyayı tek okumada özetler, sıkıştırır ve blob olarak yazar.
+
+        Özet ve sıkıştırılmış içerik aynı okumadan üretilir; dosya okuma
+        sırasında değişse bile blob her zaman adındaki özetle eşleşir. Blob
+        önce geçici dosyaya yazılır ve özet belli olunca os.replace ile yerine
+        taşınır; aynı blob'u aynı anda yazan iki iş birbirini bozmaz.
+
+        Args:
+            file_path: Depoya eklenecek dosya.
+            policy: İlk bloğa bakarak sıkıştırma yöntemini seçen CompressionPolicy (opsiyonel).
+            cancel_token: İptal kontrolü için CancellationToken (opsiyonel).
+
+        Returns:
+            tuple: (SHA-256 özeti, yazılan blob'un diskteki boyutu); blob depoda
+                   zaten varsa boyut None olur.
+        """
+        os.makedirs(self.objects_dir, exist_ok=True)
+        sha256 = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(dir=self.objects_dir, suffix=TEMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as out, open(file_path, "rb") as src:
+                chunk = src.read(READ_CHUNK_SIZE)
+                compresslevel = 6
+                # Zaten sıkıştırılmış içerik için seviye 0: zlib yalnızca sarmalar, CPU harcanmaz
+                if policy is not None and policy.choose(os.path.basename(file_path), chunk) == zipfile.ZIP_STORED:
+                    compresslevel = 0
+                compressor = zlib.compressobj(compresslevel)
+                while chunk:
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
+                    sha256.update(chunk)
+                    out.write(compressor.compress(chunk))
+                    chunk = src.read(READ_CHUNK_SIZE)
+                out.write(compressor.flush())
+
+            digest = sha256.hexdigest()
+            final_path = self.blob_path(digest)
+            if os.path.isfile(final_path):
+                os.remove(temp_path)
+                return digest, None
+            os.makedirs(os.path.dirname(final_path), exist_ok=True)
+            os.replace(temp_path, final_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        return digest, os.path.getsize(final_path)
+
+    def _store_file(self, file_path, arcname, previous_entry, policy, cancel_token, stats):
+        """Dosyayı depoya ekler ve manifest girdisini döndürür (worker thread'i)."""
+        stat_result = os.stat(file_path)
+        entry = {"path": arcname, "size": stat_result.st_size, "mtime": stat_result.st_mtime}
+
+        # Boyutu ve zamanı önceki anlık görüntüyle aynı dosya okunmaz
+        if (previous_entry is not None and previous_entry.get("size") == entry["size"]
+                and previous_entry.get("mtime") == entry["mtime"] and self.has_blob(previous_entry["sha256"])):
+            entry["sha256"] = previous_entry["sha256"]
+            with self._stats_lock:
+                stats["reused_files"] += 1
+            return entry
+
+        entry["sha256"], blob_size = self._write_blob(file_path, policy, cancel_token)
+        with self._stats_lock:
+            if blob_size is None:
+                stats["deduplicated_files"] += 1
+            else:
+                stats["new_blobs"] += 1
+                stats["new_blob_bytes"] += blob_size
+        return entry
+
+    def open_blob(self, digest):
+        """Blob'un açılmış (sıkıştırılmamış) içeriğini parça parça döndüren üreteç."""
+        path = self.blob_path(digest)
+        if not os.path.isfile(path):
+            raise BackupStoreError(f"Blob bulunamadı: {digest}")
+        decompressor = zlib.decompressobj()
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield decompressor.decompress(chunk)
+        yield decompressor.flush()
+
+    def extract_file(self, entry, target_path):
+        """Manifest girdisindeki dosyayı hedef yola çıkartır ve özetini doğrular."""
+        os.makedirs(os.path.dirname(os.path.abspath(target_path)), exist_ok=True)
+        sha256 = hashlib.sha256()
+        with open(target_path, "wb") as out:
+            for data in self.open_blob(entry["sha256"]):
+                sha256.update(data)
+                out.write(data)
+        if sha256.hexdigest() != entry["sha256"]:
+            raise BackupStoreError(f"Blob bozuk: {entry['path']}")
+        os.utime(target_path, (entry["mtime"], entry["mtime"]))
+
+    # --- Anlık görüntüler ---
+    def snapshot_path(self, name):
+        """Anlık görüntü manifest'inin dosya yolunu döndürür."""
+        return os.path.join(self.snapshots_dir, name + SNAPSHOT_SUFFIX)
+
+    def load_snapshot(self, name):
+        """Anlık görüntü manifest'ini okur.
+
+        Raises:
+            BackupStoreError: Anlık görüntü yoksa veya okunamazsa.
+        """
+        try:
+            with open(self.snapshot_path(name), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            raise BackupStoreError(f"Anlık görüntü okunamadı ({name}): {e}")
+
+    def list_snapshots(self):
+        """Depodaki anlık görüntüleri en yeniden eskiye döndürür.
+
+        Returns:
+            list: 'name', 'source', 'created', 'file_count', 'total_size' ve
+                  'new_blob_bytes' anahtarlı sözlükler.
+        """
+        snapshots = []
+        try:
+            file_names = os.listdir(self.snapshots_dir)
+        except FileNotFoundError:
+            return snapshots
+        for file_name in file_names:
+            if not file_name.endswith(SNAPSHOT_SUFFIX):
+                continue
+            name = file_name[:-len(SNAPSHOT_SUFFIX)]
+            try:
+                manifest = self.load_snapshot(name)
+            except BackupStoreError as e:
+                print(f"❗ {e}")
+                continue
+            snapshots.append({
+                "name": name,
+                "source": manifest.get("source", ""),
+                "created": manifest.get("created", ""),
+                "file_count": len(manifest.get("files", [])),
+                "total_size": sum(entry.get("size", 0) for entry in manifest.get("files", [])),
+                "new_blob_bytes": manifest.get("stats", {}).get("new_blob_bytes", 0),
+            })
+        snapshots.sort(key=lambda s: (s["created"], s["name"]), reverse=True)
+        return snapshots
+
+    def find_latest_snapshot(self, abs_source_folder_path):
+        """Kaynak klasörün en yeni anlık görüntüsünü (manifest) döndürür; yoksa None."""
+        normcase_source = os.path.normcase(abs_source_folder_path)
+        for snapshot in self.list_snapshots():
+            if os.path.normcase(snapshot["source"]) == normcase_source:
+                return self.load_snapshot(snapshot["name"])
+        return None
+
+    def create_snapshot(self, name, abs_source_folder_path, files, policy=None, max_workers=None,
+                        cancel_token=None, progress_callback=None):
+        """Dosyaları depoya ekler ve anlık görüntü manifest'ini yazar.
+
+        Özet hesaplama ve sıkıştırma thread havuzunda yapılır (hashlib ve zlib
+        GIL'i bırakır). Manifest en son yazılır; iptal edilen bir yedek yarım
+        anlık görüntü bırakmaz (yazılmış blob'lar sonraki yedeklerde kullanılır).
+
+        Args:
+            name: Anlık görüntü adı (dosya adı olarak kullanılır).
+            abs_source_folder_path: Yedeklenen klasörün mutlak yolu.
+            files: (dosya yolu, depo içi ad) çiftleri üreten yinelenebilir.
+            policy: Yeni blob'ların sıkıştırılıp sıkıştırılmayacağını seçen CompressionPolicy (opsiyonel).
+            max_workers: Thread sayısı (varsayılan DEFAULT_COMPRESSION_WORKERS).
+            cancel_token: İptal kontrolü için CancellationToken (opsiyonel).
+            progress_callback: progress_callback(metin) ile işlenen dosya sayısını bildirir (opsiyonel).
+
+        Returns:
+            dict: 'file_count', 'reused_files', 'deduplicated_files', 'new_blobs'
+                  ve 'new_blob_bytes' anahtarlı istatistikler.
+
+        Raises:
+            BackupStoreError: Aynı adlı bir anlık görüntü zaten varsa.
+        """
+        with self._store_lock:
+            return self._create_snapshot(name, abs_source_folder_path, files, policy, max_workers, cancel_token,
+                                         progress_callback)
+
+    def _create_snapshot(self, name, abs_source_folder_path, files, policy, max_workers, cancel_token,
+                         progress_callback):
+        """create_snapshot'ın depo kilidi alınmış gövdesi."""
+        if os.path.exists(self.snapshot_path(name)):
+            raise BackupStoreError(f"'{name}' adlı bir anlık görüntü zaten var.")
+
+        previous = self.find_latest_snapshot(abs_source_folder_path)
+        previous_entries = {entry["path"]: entry for entry in previous.get("files", [])} if previous else {}
+        stats = {"file_count": 0, "reused_files": 0, "deduplicated_files": 0, "new_blobs": 0, "new_blob_bytes": 0}
+        entries = []
+        pending = deque()
+        max_workers = max_workers or DEFAULT_COMPRESSION_WORKERS
+
+        def collect_next():
+            entries.append(pending.popleft().result())
+            stats["file_count"] = len(entries)
+            if progress_callback is not None:
+                progress_callback(f"{len(entries)} dosya işlendi, {stats['new_blobs']} yeni blob")
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="store") as executor:
+            try:
+                for file_path, arcname in files:
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
+                    arcname = arcname.replace(os.sep, "/")
+                    pending.append(executor.submit(self._store_file, file_path, arcname, previous_entries.get(arcname),
+                                                   policy, cancel_token, stats))
+                    while len(pending) >= max_workers * PENDING_PER_WORKER:
+                        collect_next()
+                while pending:
+                    collect_next()
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        manifest = {
+            "version": SNAPSHOT_VERSION,
+            "name": name,
+            "source": abs_source_folder_path,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "files": entries,
+            "stats": stats,
+        }
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        temp_path = self.snapshot_path(name) + TEMP_SUFFIX
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(temp_path, self.snapshot_path(name))
+        return stats
+
+    def restore_snapshot(self, name, target_dir, cancel_token=None, progress_callback=None):
+        """Anlık görüntüdeki tüm dosyaları hedef klasöre geri yükler.
+
+        Returns:
+            int: Geri yüklenen dosya sayısı.
+        """
+        entries = self.load_snapshot(name).get("files", [])
+        abs_target_dir = os.path.abspath(target_dir)
+        for index, entry in enumerate(entries, 1):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            target_path = os.path.abspath(os.path.join(abs_target_dir, *entry["path"].split("/")))
+            # Manifest'teki yol hedef klasörün dışına çıkamaz
+            if os.path.commonpath([abs_target_dir, target_path]) != abs_target_dir:
+                raise BackupStoreError(f"Geçersiz dosya yolu: {entry['path']}")
+            self.extract_file(entry, target_path)
+            if progress_callback is not None:
+                progress_callback(f"{index}/{len(entries)} dosya geri yüklendi", index / len(entries))
+        return len(entries)
+
+    def delete_snapshot(self, name):
+        """Anlık görüntüyü siler ve artık hiçbir anlık görüntünün kullanmadığı blob'ları temizler.
+
+        Returns:
+            tuple: (silinen blob sayısı, boşaltılan bayt).
+        """
+        try:
+            os.remove(self.snapshot_path(name))
+        except FileNotFoundError:
+            raise BackupStoreError(f"Anlık görüntü bulunamadı: {name}")
+        try:
+            return self.collect_garbage()
+        except BackupStoreError as e:
+            raise BackupStoreError(f"'{name}' silindi ancak kullanılmayan içerikler temizlenmedi: {e}")
+
+    def collect_garbage(self):
+        """Hiçbir anlık görüntünün kullanmadığı blob'ları siler.
+
+        Okunamayan bir manifest varsa hiçbir blob silinmez.
+
+        Returns:
+            tuple: (silinen blob sayısı, boşaltılan bayt).
+
+        Raises:
+            BackupStoreError: Manifest'lerden biri okunamazsa.
+        """
+        with self._store_lock:
+            return self._collect_garbage()
+
+    def _referenced_blobs(self):
+        """Tüm manifest'lerin kullandığı blob özetlerini döndürür.
+
+        list_snapshots okunamayan manifest'leri atladığından burada kullanılmaz;
+        atlanan bir manifest'in blob'ları silinirdi.
+
+        Raises:
+            BackupStoreError: Manifest'lerden biri okunamazsa veya bozuksa.
+        """
+        referenced = set()
+        try:
+            file_names = os.listdir(self.snapshots_dir)
+        except FileNotFoundError:
+            return referenced
+        except OSError as e:
+            raise BackupStoreError(f"Anlık görüntüler listelenemedi: {e}")
+        for file_name in file_names:
+            if not file_name.endswith(SNAPSHOT_SUFFIX):
+                continue
+            name = file_name[:-len(SNAPSHOT_SUFFIX)]
+            manifest = self.load_snapshot(name)
+            try:
+                referenced.update(entry["sha256"] for entry in manifest.get("files", []))
+            except (AttributeError, KeyError, TypeError) as e:
+                raise BackupStoreError(f"Anlık görüntü manifest'i bozuk ({name}): {e}")
+        return referenced
+
+    def _collect_garbage(self):
+        """collect_garbage'ın depo kilidi alınmış gövdesi."""
+        referenced = self._referenced_blobs()
+
+        removed_count = 0
+        removed_bytes = 0
+        if not os.path.isdir(self.objects_dir):
+            return removed_count, removed_bytes
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            if not os.path.isdir(prefix_dir):
+                # Yarıda kalmış bir yedekten arta kalan geçici blob (depo kilidi alınmışken yazan yoktur)
+                if prefix.endswith(TEMP_SUFFIX):
+                    try:
+                        os.remove(prefix_dir)
+                    except OSError as e:
+                        print(f"❗ Geçici blob silinemedi ({prefix_dir}): {e}")
+                continue
+            for blob_name in os.listdir(prefix_dir):
+                if blob_name in referenced or blob_name.endswith(TEMP_SUFFIX):
+                    continue
+                blob_path = os.path.join(prefix_dir, blob_name)
+                try:
+                    removed_bytes += os.path.getsize(blob_path)
+                    os.remove(blob_path)
+                    removed_count += 1
+                except OSError as e:
+                    print(f"❗ Blob silinemedi ({blob_path}): {e}")
+            if not os.listdir(prefix_dir):
+                os.rmdir(prefix_dir)
+        return removed_count, removed_bytes
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Cancellation - İşbirlikçi İptal Modülü
+
+Uzun süren arka plan işlemleri (dosya arama, kelime arama, sıkıştırma,
+EXE çevirme) bir CancellationToken alır ve klasörler/dosyalar arasında
+token'ı kontrol eder. Kullanıcı İptal butonuna bastığında token iptal
+edilir ve işlem bir sonraki kontrol noktasında OperationCancelled ile
+sonlanır.
+
+Kullanım:
+    from cancellation import CancellationToken, OperationCancelled
+
+    token = CancellationToken()
+
+    # Arka plan thread'inde
+    try:
+        for path in paths:
+            token.raise_if_cancelled()
+            process(path)
+    except OperationCancelled:
+        print("İşlem iptal edildi")
+
+    # Arayüz thread'inde (İptal butonu)
+    token.cancel()
+"""
+
+import threading
+
+
+class OperationCancelled(Exception):
+    """İşlem kullanıcı tarafından iptal edildiğinde fırlatılır."""
+
+
+class CancellationToken:
+    """Thread'ler arası paylaşılan iptal işareti.
+
+    Attributes:
+        is_cancelled: İptal istenip istenmediği.
+    """
+
+    def __init__(self):
+        """CancellationToken'ı başlatır."""
+        self._event = threading.Event()
+
+    def cancel(self):
+        """İptal isteğinde bulunur (birden fazla çağrılabilir)."""
+        self._event.set()
+
+    @property
+    def is_cancelled(self):
+        """İptal istenmişse True döndürür."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """İptal istenmişse OperationCancelled fırlatır."""
+        if self._event.is_set():
+            raise OperationCancelled()
+
+    def wait(self, timeout):
+        """İptal istenene veya süre dolana kadar bekler.
+
+        Returns:
+            bool: İptal istendiyse True.
+        """
+        return self._event.wait(timeout)
@@ -53,6 +53,7 @@ class EventType(Enum):
         DECOMPRESS: Sıkıştırılmış dosya açma
         CONVERT_EXE: EXE'ye dönüştürme
         SEARCH: Arama işlemi başlatma
+        SEARCH_COMPLETED: Arama tamamlandı (sonuç sayısı ve ilk sonuç süresi ile)
         WORD_SEARCH: Kelime arama işlemi
         RENAME: Dosya yeniden adlandırma
         DELETE: Dosya silme
@@ -68,6 +69,7 @@ class EventType(Enum):
     DECOMPRESS = "decompress"
     CONVERT_EXE = "convert_exe"
     SEARCH = "search_initiated"
+    SEARCH_COMPLETED = "search_completed"
     WORD_SEARCH = "word_search"
     RENAME = "rename"
     DELETE = "delete"
@@ -1,3 +1,5 @@
+import heapq
+from operator import itemgetter
 import tkinter as tk
 from tkinter import ttk
 
@@ -86,4 +88,248 @@ class ColoredContextMenu:
     
     def clear(self):
         """Menü öğelerini temizler."""
-        self.items.clear()
\ No newline at end of file
+        self.items.clear()
+
+class VirtualTreeview(ttk.Frame):
+    """Çok sayıda satırı sanal olarak gösteren Treeview.
+
+    Kayıtlar bir Python listesinde (backing array) tutulur; Treeview'da sadece
+    görünen satırlar kadar (artı birkaç satır) öğe bulunur. Kaydırma ve
+    sıralamada bu öğelerin değerleri yeniden yazılır, böylece yüz binlerce
+    sonuçta da pencere akıcı kalır.
+
+    Sıralama etkinken kayıtların anahtarları bir kez hesaplanıp saklanır;
+    akışla gelen her parti kendi içinde sıralanıp mevcut listeyle tek geçişte
+    birleştirilir, liste yeniden sıralanmaz.
+
+    Kayıtlar satıra row_builder ile çevrilir; row_builder(kayıt) 'text',
+    'values', 'tags' ve 'image' anahtarlarından istediklerini içeren bir
+    sözlük döndürür.
+
+    Attributes:
+        tree: İçteki ttk.Treeview (başlık, sütun ve olay bağlamaları için).
+        records: Gösterilen kayıtlar (filtrelenmiş ve sıralı).
+    """
+    OVERSCAN_ROWS = 2          # Yarım görünen son satır ve yeniden boyutlandırma için ek satır
+    WHEEL_SCROLL_ROWS = 3      # Fare tekerleğinin her adımında kaydırılacak satır sayısı
+    DEFAULT_ROW_HEIGHT = 25
+    DEFAULT_HEADING_HEIGHT = 25
+
+    def __init__(self, parent, row_builder, **tree_options):
+        """VirtualTreeview'ı oluşturur.
+
+        Args:
+            parent: Üst widget.
+            row_builder: Kaydı satır sözlüğüne çeviren fonksiyon.
+            **tree_options: ttk.Treeview'a aktarılacak seçenekler (columns, show, ...).
+        """
+        super().__init__(parent)
+        self.row_builder = row_builder
+        self.records = []
+        self.offset = 0              # İlk görünen kaydın indeksi
+        self.visible_rows = 20
+        self.selected_index = None   # Seçili kaydın records içindeki indeksi
+        self._sort_key = None
+        self._sort_reverse = False
+        self._keys = []              # Sıralama etkinken kayıtların anahtarları (records ile aynı sırada)
+        self._pool = []              # Treeview'daki (yeniden kullanılan) öğe id'leri
+
+        tree_options.setdefault("selectmode", "browse")
+        self.tree = ttk.Treeview(self, **tree_options)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_rows(-self.WHEEL_SCROLL_ROWS))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_rows(self.WHEEL_SCROLL_ROWS))
+        for key, handler in (("<Up>", lambda: self._move_selection(-1)),
+                             ("<Down>", lambda: self._move_selection(1)),
+                             ("<Prior>", lambda: self._move_selection(-self.visible_rows)),
+                             ("<Next>", lambda: self._move_selection(self.visible_rows)),
+                             ("<Home>", lambda: self._move_selection(-len(self.records))),
+                             ("<End>", lambda: self._move_selection(len(self.records)))):
+            self.tree.bind(key, lambda e, handler=handler: (handler(), "break")[1])
+
+    # --- Veri ---
+    def set_records(self, records):
+        """Gösterilecek kayıtları değiştirir (etkin sıralama korunur)."""
+        self.records = list(records)
+        self._keys = []
+        if self._sort_key is not None:
+            self._sort_records()
+        self.offset = 0
+        self.selected_index = None
+        self.refresh()
+
+    def append_records(self, records):
+        """Kayıt ekler (akışlı sonuçlar için).
+
+        Sıralama etkinse parti sıralanıp mevcut kayıtlarla heapq.merge ile
+        birleştirilir (eşit anahtarlı kayıtlarda mevcutlar önde kalır); seçili
+        kayıt seçili kalır.
+        """
+        if not records:
+            return
+        if self._sort_key is None:
+            self.records.extend(records)
+        else:
+            by_key = itemgetter(0)
+            # (anahtar, eski indeks, kayıt); yeni kayıtların eski indeksi yoktur
+            batch = sorted(((self._sort_key(record), None, record) for record in records),
+                           key=by_key, reverse=self._sort_reverse)
+            current = zip(self._keys, range(len(self.records)), self.records)
+            merged = list(heapq.merge(current, batch, key=by_key, reverse=self._sort_reverse))
+            if self.selected_index is not None:
+                old_selected = self.selected_index
+                self.selected_index = next((index for index, item in enumerate(merged) if item[1] == old_selected), None)
+            self._keys = [item[0] for item in merged]
+            self.records = [item[2] for item in merged]
+        self.refresh()
+
+    def sort_by(self, key, reverse=False):
+        """Kayıtları verilen anahtara göre sıralar; seçili kayıt seçili kalır.
+
+        Args:
+            key: Kayıttan sıralama değeri üreten fonksiyon (None: sıralamayı kaldırır).
+            reverse: True ise azalan sıralama.
+        """
+        self._sort_key = key
+        self._sort_reverse = reverse
+        if key is None:
+            self._keys = []
+            return
+        order = self._sort_records()
+        if self.selected_index is not None:
+            self.selected_index = order.index(self.selected_index)
+            self._ensure_visible(self.selected_index)
+        self.refresh()
+
+    def _sort_records(self):
+        """records'u anahtarları bir kez hesaplayarak (kararlı) sıralar.
+
+        Returns:
+            list: Yeni sıradaki her kaydın eski indeksi.
+        """
+        keys = [self._sort_key(record) for record in self.records]
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=self._sort_reverse)
+        self.records = [self.records[i] for i in order]
+        self._keys = [keys[i] for i in order]
+        return order
+
+    def selected_record(self):
+        """Seçili kaydı döndürür (seçim yoksa None)."""
+        if self.selected_index is None or self.selected_index >= len(self.records):
+            return None
+        return self.records[self.selected_index]
+
+    def record_at(self, y):
+        """Treeview içindeki y koordinatındaki kaydı döndürür (yoksa None)."""
+        item_id = self.tree.identify_row(y)
+        index = self._record_index_of_item(item_id)
+        return self.records[index] if index is not None else None
+
+    # --- Görüntüleme ---
+    def refresh(self):
+        """Görünen satırları backing array'den yeniden yazar ve kaydırma çubuğunu günceller."""
+        total = len(self.records)
+        max_offset = max(total - self.visible_rows, 0)
+        self.offset = min(max(self.offset, 0), max_offset)
+
+        pool_size = self.visible_rows + self.OVERSCAN_ROWS
+        while len(self._pool) < pool_size:
+            self._pool.append(self.tree.insert("", tk.END))
+        while len(self._pool) > pool_size:
+            self.tree.delete(self._pool.pop())
+
+        selected_item = None
+        for slot, item_id in enumerate(self._pool):
+            index = self.offset + slot
+            if index >= total:
+                self.tree.detach(item_id)
+                continue
+            row = self.row_builder(self.records[index])
+            self.tree.item(item_id, text=row.get("text", ""), values=row.get("values", ()),
+                           tags=row.get("tags", ()), image=row.get("image", ""))
+            self.tree.move(item_id, "", slot)
+            if index == self.selected_index:
+                selected_item = item_id
+
+        if selected_item is not None:
+            if tuple(self.tree.selection()) != (selected_item,):
+                self.tree.selection_set(selected_item)
+            self.tree.focus(selected_item)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+        self.tree.yview_moveto(0)
+
+        if total:
+            self.scrollbar.set(self.offset / total, min((self.offset + self.visible_rows) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_rows(self, delta):
+        """Görünümü delta satır kaydırır."""
+        self.offset += delta
+        self.refresh()
+
+    def _ensure_visible(self, index):
+        """İndeksteki kaydın görünür olması için offset'i ayarlar."""
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self.visible_rows:
+            self.offset = index - self.visible_rows + 1
+
+    def _record_index_of_item(self, item_id):
+        """Treeview öğesinin gösterdiği kaydın indeksini döndürür."""
+        if not item_id or item_id not in self._pool:
+            return None
+        index = self.offset + self._pool.index(item_id)
+        return index if index < len(self.records) else None
+
+    # --- Olaylar ---
+    def _on_configure(self, event):
+        """Pencere boyutu değişince görünen satır sayısını yeniden hesaplar."""
+        row_height = self.DEFAULT_ROW_HEIGHT
+        heading_height = self.DEFAULT_HEADING_HEIGHT if "headings" in str(self.tree.cget("show")) else 0
+        if self._pool and self.tree.exists(self._pool[0]):
+            bbox = self.tree.bbox(self._pool[0])
+            if bbox:
+                heading_height, row_height = bbox[1], bbox[3]
+        visible_rows = max(int((event.height - heading_height) // max(row_height, 1)), 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.refresh()
+
+    def _on_scrollbar(self, *args):
+        """Kaydırma çubuğu komutlarını (moveto/scroll) offset'e çevirir."""
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.records))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self.offset += step * self.visible_rows if args[2] == "pages" else step
+        self.refresh()
+
+    def _on_mousewheel(self, event):
+        """Fare tekerleği ile kaydırır (Windows/macOS)."""
+        self.scroll_rows(-self.WHEEL_SCROLL_ROWS if event.delta > 0 else self.WHEEL_SCROLL_ROWS)
+        return "break"
+
+    def _on_tree_select(self, event):
+        """Treeview'da tıklanan satırın kayıt indeksini saklar."""
+        selection = self.tree.selection()
+        if selection:
+            index = self._record_index_of_item(selection[0])
+            if index is not None:
+                self.selected_index = index
+
+    def _move_selection(self, delta):
+        """Klavye ile seçimi delta kadar taşır ve görünür tutar."""
+        if not self.records:
+            return
+        current = self.selected_index if self.selected_index is not None else self.offset - (1 if delta > 0 else 0)
+        self.selected_index = min(max(current + delta, 0), len(self.records) - 1)
+        self._ensure_visible(self.selected_index)
+        self.refresh()
@@ -2,10 +2,171 @@
 
 import sqlite3
 import json
-from datetime import datetime
+import calendar
+from datetime import datetime, timedelta
 import os
+import time
+import queue
+import threading
 from tkinter import messagebox # Hata durumlarında kullanıcıyı bilgilendirmek için
 
+
+HISTORY_FLUSH_INTERVAL_SECONDS = 0.5  # Geçmiş kayıtlarının en fazla bekleyeceği süre
+HISTORY_BATCH_SIZE = 100              # Bu kadar kayıt birikince beklemeden yazılır
+HISTORY_FLUSH_TIMEOUT_SECONDS = 5.0   # flush/stop çağrılarının en fazla bekleyeceği süre
+HISTORY_BUSY_TIMEOUT_SECONDS = 30     # Yazıcı bağlantısının kilitli veritabanını bekleme süresi
+HISTORY_RETRY_DELAY_SECONDS = 2.0     # Kilit nedeniyle yazılamayan kayıtların yeniden deneme aralığı
+
+# get_history_counts için gruplama ifadeleri (kullanıcı girdisi SQL'e eklenmez)
+HISTORY_COUNT_GROUPINGS = {
+    "event_type": "event_type",
+    "path": "path",
+    "day": "date(ts, 'unixepoch')",
+    "week": "strftime('%Y-%W', ts, 'unixepoch')",
+    "month": "strftime('%Y-%m', ts, 'unixepoch')",
+}
+# history_rollup tablosundaki karşılıkları
+HISTORY_ROLLUP_GROUPINGS = {
+    "event_type": "event_type",
+    "path": "path",
+    "day": "day",
+    "week": "strftime('%Y-%W', day)",
+    "month": "strftime('%Y-%m', day)",
+}
+
+DEFAULT_HISTORY_RETENTION_DAYS = 0              # Ham geçmiş kayıtlarının varsayılan saklama süresi (0: sınırsız, özetleme kapalı)
+ROLLUP_PATH_EVENT_TYPES = ("run_normal", "run_search")  # Özetlerde program yolu korunan olay türleri
+
+
+def history_epoch(moment):
+    """Geçmiş kayıtlarının ts sütunu için tamsayı zaman değerini döndürür.
+
+    timestamp metin sütunundaki yerel saat, saat dilimi dönüşümü yapılmadan
+    UTC gibi yorumlanır. Böylece değer SQLite'ın strftime('%s', timestamp)
+    sonucuyla aynıdır (eski kayıtlar SQL ile doldurulabilir), yaz saati
+    geçişlerinde belirsizlik olmaz ve datetime(ts, 'unixepoch') metni geri verir.
+
+    Args:
+        moment: datetime nesnesi.
+    """
+    return calendar.timegm(moment.timetuple())
+
+
+class HistoryWriter:
+    """execution_history kayıtlarını arka plan thread'inde toplu yazar.
+
+    Kayıtlar bir kuyruğa eklenir; thread, HISTORY_FLUSH_INTERVAL_SECONDS
+    dolduğunda veya HISTORY_BATCH_SIZE kayıt biriktiğinde hepsini tek bir
+    transaction ile yazar. Böylece arayüz thread'i her çalıştırma, arama veya
+    yeniden adlandırmada commit (fsync) beklemez. Thread kendi SQLite
+    bağlantısını kullanır; WAL modunda ana bağlantının okumalarını engellemez.
+
+    Veritabanı başka bir bağlantı tarafından kilitli tutulursa ("database is
+    locked") kayıtlar atılmaz; kuyrukta kalır ve HISTORY_RETRY_DELAY_SECONDS
+    sonra yeniden denenir. flush() bekleyenleri kayıtlar yazılana kadar bekler.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_path, flush_interval=HISTORY_FLUSH_INTERVAL_SECONDS, batch_size=HISTORY_BATCH_SIZE):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def add(self, row):
+        """(path, timestamp, ts, event_type, details_json) kaydını yazılmak üzere kuyruğa ekler."""
+        self._queue.put(row)
+
+    def flush(self, timeout=HISTORY_FLUSH_TIMEOUT_SECONDS):
+        """Kuyruktaki kayıtlar yazılana kadar bekler.
+
+        Returns:
+            bool: Kayıtlar süre dolmadan yazıldıysa True.
+        """
+        if not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def stop(self, timeout=HISTORY_FLUSH_TIMEOUT_SECONDS):
+        """Kalan kayıtları yazar ve thread'i durdurur."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=HISTORY_BUSY_TIMEOUT_SECONDS)
+            conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error as e:
+            print(f"❗ Geçmiş yazıcısı veritabanına bağlanamadı: {e}")
+            return
+
+        pending = []
+        waiters = []
+        deadline = None
+        stopping = False
+        while not stopping:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is self._STOP:
+                stopping = True
+            elif isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item is not None:
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append(item)
+
+            if pending and (stopping or waiters or len(pending) >= self.batch_size or time.monotonic() >= deadline):
+                if self._write(conn, pending):
+                    pending = []
+                elif stopping:
+                    print(f"❗ Veritabanı kilitli kaldı; {len(pending)} geçmiş kaydı kapanırken yazılamadı")
+                    pending = []
+                else:
+                    # Kilit açılınca aynı kayıtlar (ve bu arada gelenler) birlikte yazılır
+                    deadline = time.monotonic() + HISTORY_RETRY_DELAY_SECONDS
+            if not pending:
+                for waiter in waiters:
+                    waiter.set()
+                waiters = []
+        conn.close()
+
+    @staticmethod
+    def _write(conn, rows):
+        """Kayıtları tek transaction ile yazar.
+
+        Returns:
+            bool: Kayıtlar yazıldıysa veya yeniden denemenin anlamı yoksa True;
+                  veritabanı kilitli olduğu için yeniden denenmeleri gerekiyorsa False.
+        """
+        try:
+            with conn:
+                conn.executemany("INSERT INTO execution_history (path, timestamp, ts, event_type, details) "
+                                 "VALUES (?, ?, ?, ?, ?)", rows)
+        except sqlite3.OperationalError as e:
+            message = str(e).lower()
+            if "locked" in message or "busy" in message:
+                print(f"🔸 UYARI: Veritabanı kilitli, {len(rows)} geçmiş kaydı yeniden denenecek: {e}")
+                return False
+            print(f"❗ {len(rows)} geçmiş kaydı yazılamadı: {e}")
+        except sqlite3.Error as e:
+            print(f"❗ {len(rows)} geçmiş kaydı yazılamadı: {e}")
+        return True
+
+
 # --- Veritabanı Yönetimi Sınıfı ---
 class DatabaseManager:
     """SQLite veritabanı işlemlerini yönetir.
@@ -17,6 +178,8 @@ class DatabaseManager:
         db_path: Veritabanı dosyasının yolu.
         conn: SQLite bağlantı nesnesi.
     """
+    MAX_QUERY_PARAMS = 900  # Tek sorguda bağlanacak en fazla parametre
+
     def __init__(self, db_path):
         """DatabaseManager'ı başlatır.
         
@@ -25,26 +188,47 @@ class DatabaseManager:
         """
         self.db_path = db_path
         self.conn = None  # Tutarlı olarak conn kullanılıyor
+        self._history_writer = None  # İlk geçmiş kaydında başlatılır (HistoryWriter)
         self._connect()
         self._create_tables()
         self._migrate_favorites_order_index() # Favoriler için sıralama indeksi göçünü yap
+        self._migrate_history_details_column() # Geçmiş kayıtlarına ölçüm detayları sütunu ekle
+        self._migrate_history_ts_column() # Geçmiş için tamsayı zaman sütunu ve indeksler
 
     def _connect(self):
         """Veritabanına bağlanır."""
         try:
             self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
             self.conn.row_factory = sqlite3.Row
+            # Yeni veritabanlarında silinen sayfalar incremental_vacuum ile geri verilebilsin
+            # (mevcut veritabanları ilk geçmiş sıkıştırmasında bir kez VACUUM ile dönüştürülür)
+            self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL: commit'ler tüm veritabanı yerine yalnızca günlük dosyasına eklenir ve
+            # okumalar yazmaları beklemez; NORMAL ile her commit'te fsync yapılmaz
+            # (elektrik kesintisinde yalnızca son commit'ler kaybolabilir, veritabanı bozulmaz).
+            journal_mode = self.conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if str(journal_mode).lower() != "wal":
+                print(f"🔸 UYARI: Veritabanı WAL moduna alınamadı (journal_mode={journal_mode}).")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
         except sqlite3.Error as e:
             print(f"Veritabanı bağlantı hatası: {e}")
             messagebox.showerror("Veritabanı Hatası", f"Veritabanına bağlanılamadı:\n{e}\nProgram düzgün çalışmayabilir.")
             self.conn = None
 
     def _close(self):
-        """Veritabanı bağlantısını kapatır."""
+        """Bekleyen geçmiş kayıtlarını yazar ve veritabanı bağlantısını kapatır."""
+        if self._history_writer is not None:
+            self._history_writer.stop()
+            self._history_writer = None
         if self.conn:
             self.conn.close()
             self.conn = None
 
+    def flush_history(self):
+        """Arka planda bekleyen geçmiş kayıtlarının yazılmasını bekler."""
+        if self._history_writer is not None:
+            self._history_writer.flush()
+
     def _execute(self, query, params=(), fetchone=False, fetchall=False, commit=False):
         """SQL sorgularını güvenli bir şekilde çalıştırır."""
         if not self.conn:
@@ -86,7 +270,18 @@ class DatabaseManager:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 path TEXT NOT NULL,
                 timestamp TEXT NOT NULL,
-                event_type TEXT DEFAULT 'run_normal' NOT NULL
+                event_type TEXT DEFAULT 'run_normal' NOT NULL,
+                details TEXT,
+                ts INTEGER
+            );
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS history_rollup (
+                day TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                path TEXT NOT NULL DEFAULT '',
+                count INTEGER NOT NULL,
+                PRIMARY KEY (day, event_type, path)
             );
             """,
             """
@@ -153,14 +348,18 @@ class DatabaseManager:
         if not paths:
             return {}
         
-        # SQL IN clause için placeholder'lar oluştur
-        placeholders = ','.join(['?' for _ in paths])
-        query = f"SELECT path, description FROM file_descriptions WHERE path IN ({placeholders})"
-        rows = self._execute(query, tuple(paths), fetchall=True)
-        
-        if rows:
-            return {row['path']: row['description'] for row in rows}
-        return {}
+        # Eski SQLite sürümlerinin parametre sınırını (999) aşmamak için parçalar halinde sorgula
+        paths = list(paths)
+        descriptions = {}
+        for start in range(0, len(paths), self.MAX_QUERY_PARAMS):
+            chunk = paths[start:start + self.MAX_QUERY_PARAMS]
+            # SQL IN clause için placeholder'lar oluştur
+            placeholders = ','.join(['?' for _ in chunk])
+            query = f"SELECT path, description FROM file_descriptions WHERE path IN ({placeholders})"
+            rows = self._execute(query, tuple(chunk), fetchall=True)
+            if rows:
+                descriptions.update({row['path']: row['description'] for row in rows})
+        return descriptions
 
     def set_description(self, path, description):
         """Dosya için açıklama kaydeder veya günceller.
@@ -182,16 +381,50 @@ class DatabaseManager:
         """
         self._execute("DELETE FROM file_descriptions WHERE path = ?", (path,), commit=True)
 
-    def add_history(self, path, event_type="run_normal"):
+    def add_history(self, path, event_type="run_normal", details=None):
         """Çalıştırma geçmişine yeni kayıt ekler.
         
         Args:
             path: Çalıştırılan dosyanın yolu veya işlem açıklaması.
             event_type: Olay türü (varsayılan: "run_normal").
+            details: İşleme ait ölçümler (örn: sıkıştırma hızı); JSON olarak saklanır (opsiyonel).
+
+        Kayıt hemen değil, HistoryWriter tarafından kısa süre içinde diğer
+        kayıtlarla birlikte yazılır; geçmişi okuyan metodlar önce bekleyen
+        kayıtları yazdırır.
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self._execute("INSERT INTO execution_history (path, timestamp, event_type) VALUES (?, ?, ?)",
-                      (path, timestamp, event_type), commit=True)
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+        details_json = json.dumps(details, ensure_ascii=False) if details is not None else None
+        if not self.conn:
+            print("Veritabanı bağlı değil.")
+            return
+        # Kayıt arka planda toplu yazılır; arayüz thread'i commit beklemez
+        if self._history_writer is None or not self._history_writer.is_alive():
+            self._history_writer = HistoryWriter(self.db_path)
+        self._history_writer.add((path, timestamp, history_epoch(now), event_type, details_json))
+
+    def get_history_details(self, event_type, limit=100):
+        """Belirli türdeki son kayıtların ölçüm detaylarını döndürür (örn: kapasite planlaması için).
+        
+        Args:
+            event_type: Olay türü (örn: "compress").
+            limit: Maksimum sonuç sayısı.
+            
+        Returns:
+            list: (zaman_damgası, yol, detay sözlüğü) tuple'ları, en yeniden eskiye.
+        """
+        self.flush_history()
+        rows = self._execute("SELECT timestamp, path, details FROM execution_history "
+                             "WHERE event_type = ? AND details IS NOT NULL ORDER BY ts DESC, id DESC LIMIT ?",
+                             (event_type, limit), fetchall=True)
+        result = []
+        for row in rows or []:
+            try:
+                result.append((row['timestamp'], row['path'], json.loads(row['details'])))
+            except ValueError:
+                continue
+        return result
 
     def get_history(self):
         """Tüm çalıştırma geçmişini döndürür.
@@ -199,9 +432,75 @@ class DatabaseManager:
         Returns:
             list: (zaman_damgası, yol, olay_türü) tuple'larının listesi.
         """
-        rows = self._execute("SELECT timestamp, path, event_type FROM execution_history ORDER BY timestamp DESC", fetchall=True)
+        self.flush_history()
+        rows = self._execute("SELECT timestamp, path, event_type FROM execution_history ORDER BY ts DESC, id DESC", fetchall=True)
         return [(row['timestamp'], row['path'], row['event_type']) for row in rows] if rows else []
 
+    @staticmethod
+    def _history_filter_clause(start_date=None, end_date=None, event_types=None):
+        """Geçmiş sorguları için tarih aralığı ve olay türü WHERE koşulunu oluşturur.
+
+        Birden fazla olay türünde her tür için (event_type, ts) indeksi aralık
+        olarak taranır (sayım sorguları). Sıralı sayfa sorguları için
+        _history_rows_query kullanılır.
+
+        Returns:
+            tuple: (" AND ..." koşul metni, parametre listesi).
+        """
+        clause = ""
+        params = []
+        # Tarih aralığı (event_type, ts) / (ts) indeksleriyle aranır
+        if start_date:
+            clause += " AND ts >= ?"
+            params.append(history_epoch(datetime.strptime(start_date, "%Y-%m-%d")))
+        if end_date:
+            clause += " AND ts < ?"
+            params.append(history_epoch(datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)))
+        if event_types:
+            event_types = list(event_types)
+            if len(event_types) == 1:
+                clause += " AND event_type = ?"
+            else:
+                placeholders = ','.join(['?' for _ in event_types])
+                clause += f" AND event_type IN ({placeholders})"
+            params.extend(event_types)
+        return clause, params
+
+    def _history_rows_query(self, columns, start_date=None, end_date=None, event_types=None, before=None, limit=200):
+        """En yeniden eskiye sıralı, LIMIT'li geçmiş sorgusunu oluşturur.
+
+        Tek olay türünde (event_type, ts) indeksi hem filtreyi hem sıralamayı
+        karşılar. Birden fazla türde her tür kendi (event_type, ts) aralığından
+        en fazla limit kayıt okur ve sonuçlar UNION ALL ile birleştirilip
+        yeniden sıralanır; seçilen türler ne kadar seyrek olursa olsun bir
+        sayfa en fazla tür sayısı * limit kayıt okur.
+
+        Args:
+            columns: id ve ts dışında seçilecek sütunlar (virgülle ayrılmış).
+            before: Bu (ts, id) değerinden eski kayıtlar (keyset sayfalama, opsiyonel).
+
+        Returns:
+            tuple: (sorgu metni, parametre listesi); satırlar id, ts ve columns sütunlarını içerir.
+        """
+        clause, params = self._history_filter_clause(start_date, end_date)
+        if before is not None:
+            clause += " AND (ts, id) < (?, ?)"
+            params.extend(before)
+        select = f"SELECT id, ts, {columns} FROM execution_history"
+        event_types = list(event_types or [])
+        if len(event_types) <= 1:
+            type_clause = " AND event_type = ?" if event_types else ""
+            return (f"{select} WHERE 1=1{type_clause}{clause} ORDER BY ts DESC, id DESC LIMIT ?",
+                    event_types + params + [limit])
+
+        parts = []
+        query_params = []
+        for event_type in event_types:
+            parts.append(f"SELECT * FROM ({select} WHERE event_type = ?{clause} ORDER BY ts DESC, id DESC LIMIT ?)")
+            query_params.extend([event_type, *params, limit])
+        query_params.append(limit)
+        return " UNION ALL ".join(parts) + " ORDER BY ts DESC, id DESC LIMIT ?", query_params
+
     def get_history_batch(self, start_date=None, end_date=None, event_types=None, limit=100):
         """Filtrelenmiş çalıştırma geçmişini toplu olarak döndürür.
         
@@ -214,27 +513,167 @@ class DatabaseManager:
         Returns:
             list: Filtrelenmiş (zaman_damgası, yol, olay_türü) tuple'ları.
         """
-        query = "SELECT timestamp, path, event_type FROM execution_history WHERE 1=1"
-        params = []
+        self.flush_history()
+        query, params = self._history_rows_query("timestamp, path, event_type", start_date, end_date, event_types,
+                                                 limit=limit)
         
+        rows = self._execute(query, tuple(params), fetchall=True)
+        return [(row['timestamp'], row['path'], row['event_type']) for row in rows] if rows else []
+
+    def get_history_page(self, start_date=None, end_date=None, event_types=None, before=None, limit=200):
+        """Filtrelenmiş geçmişin bir sayfasını keyset sayfalama ile döndürür.
+
+        OFFSET yerine önceki sayfanın son kaydından (ts, id) devam edilir;
+        her sayfa indeks üzerinden en fazla (seçilen tür sayısı * limit) kayıt
+        okur (bkz. _history_rows_query).
+
+        Args:
+            start_date: Başlangıç tarihi (YYYY-MM-DD formatında).
+            end_date: Bitiş tarihi (YYYY-MM-DD formatında).
+            event_types: Filtrelenecek olay türlerinin listesi.
+            before: Önceki sayfanın son kaydının (ts, id) değeri; ilk sayfa için None.
+            limit: Sayfadaki en fazla kayıt sayısı.
+
+        Returns:
+            list: (id, ts, zaman_damgası, yol, olay_türü) tuple'ları, en yeniden eskiye.
+        """
+        self.flush_history()
+        query, params = self._history_rows_query("timestamp, path, event_type", start_date, end_date, event_types,
+                                                 before, limit)
+
+        rows = self._execute(query, tuple(params), fetchall=True)
+        return [(row['id'], row['ts'], row['timestamp'], row['path'], row['event_type']) for row in rows] if rows else []
+
+    def get_history_counts(self, grouping, start_date=None, end_date=None, event_types=None, limit=None):
+        """Filtrelenmiş geçmiş kayıtlarını SQL'de gruplayıp sayar (kayıtlar belleğe alınmaz).
+
+        Saklama süresi dolup günlük özetlere (history_rollup) taşınmış
+        kayıtlar da sayıma eklenir; istatistikler tüm zamanları kapsar.
+
+        Args:
+            grouping: HISTORY_COUNT_GROUPINGS anahtarı ("event_type", "path", "day", "week", "month").
+            start_date: Başlangıç tarihi (YYYY-MM-DD formatında).
+            end_date: Bitiş tarihi (YYYY-MM-DD formatında).
+            event_types: Sayılacak olay türlerinin listesi.
+            limit: En fazla grup sayısı (opsiyonel).
+
+        Returns:
+            list: (grup, sayı) tuple'ları; "path" için çoktan aza, zaman dilimleri
+            için en yeniden eskiye sıralı.
+        """
+        group_expression = HISTORY_COUNT_GROUPINGS[grouping]
+        rollup_expression = HISTORY_ROLLUP_GROUPINGS[grouping]
+        self.flush_history()
+        clause, params = self._history_filter_clause(start_date, end_date, event_types)
+
+        # Özet tablosu gün metniyle filtrelenir
+        rollup_clause = " AND path != ''" if grouping == "path" else ""
         if start_date:
-            query += " AND timestamp >= ?"
+            rollup_clause += " AND day >= ?"
             params.append(start_date)
-        
         if end_date:
-            query += " AND timestamp <= ?"
-            params.append(end_date + " 23:59:59")
-        
+            rollup_clause += " AND day <= ?"
+            params.append(end_date)
         if event_types:
             placeholders = ','.join(['?' for _ in event_types])
-            query += f" AND event_type IN ({placeholders})"
+            rollup_clause += f" AND event_type IN ({placeholders})"
             params.extend(event_types)
-        
-        query += " ORDER BY timestamp DESC LIMIT ?"
-        params.append(limit)
-        
+
+        order = "total DESC, grp" if grouping == "path" else "grp DESC"
+        query = (f"SELECT grp, SUM(total) AS total FROM ("
+                 f"SELECT {group_expression} AS grp, COUNT(*) AS total FROM execution_history "
+                 f"WHERE 1=1{clause} GROUP BY grp "
+                 f"UNION ALL SELECT {rollup_expression} AS grp, SUM(count) AS total FROM history_rollup "
+                 f"WHERE 1=1{rollup_clause} GROUP BY grp"
+                 f") GROUP BY grp ORDER BY {order}")
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
         rows = self._execute(query, tuple(params), fetchall=True)
-        return [(row['timestamp'], row['path'], row['event_type']) for row in rows] if rows else []
+        return [(row['grp'], row['total']) for row in rows] if rows else []
+
+    def compact_history(self, retention_days, cancel_token=None):
+        """Saklama süresini aşan ham geçmiş kayıtlarını günlük özetlere taşır ve yer açar.
+
+        Kesim noktasından (bugün - retention_days, gün başı) eski kayıtlar
+        history_rollup tablosuna gün, olay türü ve (çalıştırmalarda) program
+        yolu bazında sayı olarak eklenir, ardından silinir. Boşalan sayfalar
+        incremental_vacuum ile dosyadan geri verilir; incremental moda
+        geçmemiş eski veritabanları bu sırada bir kez VACUUM edilir.
+
+        İş thread'inden çağrılır; arayüzün bağlantısını engellememek için
+        kendi bağlantısını kullanır.
+
+        Args:
+            retention_days: Ham kayıtların saklanacağı gün sayısı (0 veya daha azı: sınırsız).
+            cancel_token: Adımlar arasında kontrol edilen CancellationToken (opsiyonel).
+
+        Returns:
+            dict: cutoff_day, rollup_groups, deleted_rows ve freed_bytes; saklama sınırsızsa None.
+
+        Raises:
+            sqlite3.Error: Veritabanı işlemi başarısız olursa (özetleme geri alınır).
+            OperationCancelled: cancel_token iptal edilirse.
+        """
+        if not retention_days or retention_days <= 0:
+            return None
+        cutoff_day = datetime.now().date() - timedelta(days=retention_days)
+        cutoff_ts = history_epoch(datetime.combine(cutoff_day, datetime.min.time()))
+        path_placeholders = ','.join(['?' for _ in ROLLUP_PATH_EVENT_TYPES])
+
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            size_before = self._database_size()
+            with conn: # Özetleme ve silme tek transaction'dır; hata/iptal durumunda geri alınır
+                rollup_groups = conn.execute(
+                    "INSERT INTO history_rollup (day, event_type, path, count) "
+                    f"SELECT date(ts, 'unixepoch'), event_type, "
+                    f"CASE WHEN event_type IN ({path_placeholders}) THEN path ELSE '' END, COUNT(*) "
+                    "FROM execution_history WHERE ts < ? GROUP BY 1, 2, 3 "
+                    "ON CONFLICT (day, event_type, path) DO UPDATE SET count = count + excluded.count",
+                    (*ROLLUP_PATH_EVENT_TYPES, cutoff_ts)).rowcount
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                deleted_rows = conn.execute("DELETE FROM execution_history WHERE ts < ?", (cutoff_ts,)).rowcount
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2: # 2: INCREMENTAL
+                print("Veritabanı incremental auto_vacuum moduna dönüştürülüyor (tek seferlik VACUUM)...")
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+            elif deleted_rows:
+                # execute() deyimi tek adım çalıştırır (tek sayfa); executescript sonuna kadar yürütür
+                conn.executescript("PRAGMA incremental_vacuum;")
+            # WAL'daki değişiklikleri ana dosyaya yaz ki dosya gerçekten küçülsün
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+            freed_bytes = max(0, size_before - self._database_size())
+        finally:
+            conn.close()
+
+        return {"cutoff_day": cutoff_day.isoformat(), "rollup_groups": rollup_groups,
+                "deleted_rows": deleted_rows, "freed_bytes": freed_bytes}
+
+    def _database_size(self):
+        """Veritabanı ve WAL dosyalarının toplam boyutu (bayt)."""
+        total = 0
+        for path in (self.db_path, self.db_path + "-wal"):
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                pass
+        return total
+
+    def get_history_retention_days(self):
+        """Ham geçmiş kayıtlarının saklanacağı gün sayısını döndürür (0: sınırsız)."""
+        try:
+            return int(self.get_setting("history_retention_days", DEFAULT_HISTORY_RETENTION_DAYS))
+        except (TypeError, ValueError):
+            return DEFAULT_HISTORY_RETENTION_DAYS
+
+    def set_history_retention_days(self, days):
+        """Ham geçmiş kayıtlarının saklanacağı gün sayısını kaydeder (0: sınırsız)."""
+        self.set_setting("history_retention_days", str(max(0, int(days))))
 
     def save_theme(self, name, config_dict):
         config_json = json.dumps(config_dict)
@@ -325,6 +764,32 @@ class DatabaseManager:
                 self.update_favorites_order(paths_to_order)
                 print(f"{len(paths_to_order)} favori için order_index güncellendi.")
 
+    def _migrate_history_details_column(self):
+        """Eski veritabanlarındaki execution_history tablosuna details sütununu ekler."""
+        columns = self._execute("PRAGMA table_info(execution_history)", fetchall=True)
+        if columns and "details" not in {column['name'] for column in columns}:
+            print("Geçmiş tablosuna details sütunu ekleniyor...")
+            self._execute("ALTER TABLE execution_history ADD COLUMN details TEXT", commit=True)
+
+    def _migrate_history_ts_column(self):
+        """execution_history'ye tamsayı zaman sütunu (ts) ve sorgu indekslerini ekler.
+
+        Metin timestamp sütunu korunur; ts eski kayıtlar için SQL ile
+        doldurulur (history_epoch ile aynı değer). Tarih aralığı ve olay türü
+        filtreleri (event_type, ts) ve (ts) indeksleriyle tam tablo taraması
+        ve sıralama yapmadan çalışır.
+        """
+        columns = self._execute("PRAGMA table_info(execution_history)", fetchall=True)
+        if columns and "ts" not in {column['name'] for column in columns}:
+            print("Geçmiş tablosuna ts sütunu ekleniyor...")
+            self._execute("ALTER TABLE execution_history ADD COLUMN ts INTEGER", commit=True)
+        cursor = self._execute("UPDATE execution_history SET ts = CAST(strftime('%s', timestamp) AS INTEGER) "
+                               "WHERE ts IS NULL", commit=True)
+        if cursor is not None and cursor.rowcount > 0:
+            print(f"{cursor.rowcount} geçmiş kaydı için ts değeri dolduruldu.")
+        self._execute("CREATE INDEX IF NOT EXISTS idx_history_type_ts ON execution_history (event_type, ts)", commit=True)
+        self._execute("CREATE INDEX IF NOT EXISTS idx_history_ts ON execution_history (ts)", commit=True)
+
     # --- Compression Exclusions ---
     def get_compression_exclusion(self, folder_path):
         """Belirli bir klasör için kaydedilmiş exclusion pattern'ini döndürür."""
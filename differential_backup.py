@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+Differential Backup - Fark Yedekleme Modülü
+
+Bir klasör her sıkıştırıldığında tam kopya almak yerine, aynı klasörün
+yedekler klasöründeki en yeni yedeğine göre yalnızca yeni ve değişen
+dosyalar ZIP'e yazılır. Silinen dosyalar ZIP içindeki küçük bir manifest'e
+(MANIFEST_NAME) kaydedilir. Tam anlık görüntü, fark yedeklerinden ilk tam
+yedeğe kadar zincir takip edilerek geri yüklenir.
+
+Karşılaştırma önceki yedeklerin merkezi dizininden (ad, boyut, CRC, tarih)
+yapılır; dosya içerikleri yalnızca boyut aynı ama tarih farklıysa CRC için
+okunur.
+
+Zincir MAX_DIFFERENTIAL_CHAIN_LENGTH yedeğe ulaştığında, temel yedek
+bulunamadığında veya zincir okunamadığında yeni bir tam yedek alınır.
+Manifest'i olmayan (eski sürümlerle alınmış) yedekler geri yüklenebilir,
+fakat hangi klasöre ait oldukları bilinmediğinden temel yedek olarak
+kullanılmaz.
+
+Kullanım:
+    from differential_backup import load_base_snapshot, is_unchanged
+
+    base_zip, snapshot = load_base_snapshot(backup_dir, source_folder)
+    if not is_unchanged(snapshot.get(arcname), file_path):
+        writer.add(file_path, arcname)
+
+    restore_snapshot("backups/proje_20240101_1200.zip", "C:\\geri_yukleme")
+"""
+
+import os
+import json
+import time
+import zlib
+import zipfile
+from datetime import datetime
+
+
+MANIFEST_NAME = ".pymanager_backup.json"   # Her yedeğin içine yazılan manifest
+MANIFEST_VERSION = 1
+BACKUP_TYPE_FULL = "full"
+BACKUP_TYPE_DIFFERENTIAL = "differential"
+CRC_CHUNK_SIZE = 1024 * 1024               # CRC hesaplanırken okunacak parça boyutu
+MAX_CHAIN_LENGTH = 1000                    # Bozuk manifest'lerde sonsuz döngüye karşı sınır
+MAX_DIFFERENTIAL_CHAIN_LENGTH = 20         # Zincir bu uzunluğa ulaşınca yeni tam yedek alınır
+
+
+class BackupChainError(Exception):
+    """Fark yedeği zinciri çözülemediğinde (eksik temel yedek vb.) fırlatılır."""
+
+
+class SnapshotEntry:
+    """Anlık görüntüdeki bir dosyanın hangi yedekte ve hangi ZipInfo ile bulunduğu."""
+
+    def __init__(self, zip_path, zinfo):
+        self.zip_path = zip_path
+        self.zinfo = zinfo
+
+
+def zip_date_time(mtime):
+    """Değiştirilme zamanını ZIP'in (DOS) 2 saniyelik çözünürlüğüne indirger.
+
+    Returns:
+        tuple: ZipInfo.date_time ile karşılaştırılabilir (yıl, ay, gün, saat, dakika, saniye).
+    """
+    date_time = time.localtime(mtime)[:6]
+    return date_time[:5] + (date_time[5] // 2 * 2,)
+
+
+def file_crc32(file_path, cancel_token=None):
+    """Dosyanın CRC-32 değerini parça parça okuyarak hesaplar."""
+    crc = 0
+    with open(file_path, "rb") as f:
+        while True:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            chunk = f.read(CRC_CHUNK_SIZE)
+            if not chunk:
+                return crc
+            crc = zlib.crc32(chunk, crc)
+
+
+def read_manifest(zip_path):
+    """ZIP içindeki yedek manifest'ini okur.
+
+    Returns:
+        dict: Manifest; dosya uygulama tarafından oluşturulmamışsa veya okunamazsa None.
+    """
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            with zf.open(MANIFEST_NAME) as f:
+                manifest = json.load(f)
+    except (KeyError, OSError, ValueError, zipfile.BadZipFile):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def build_manifest(abs_source_folder_path, base_zip_path=None, deleted=(), unchanged_count=0):
+    """Yeni bir yedeğe yazılacak manifest'i oluşturur.
+
+    Args:
+        abs_source_folder_path: Yedeklenen klasörün mutlak yolu.
+        base_zip_path: Fark yedeğinin temel aldığı yedek (tam yedek için None).
+        deleted: Temel yedekten bu yana silinen dosyaların ZIP içi adları.
+        unchanged_count: Değişmediği için yazılmayan dosya sayısı.
+
+    Returns:
+        dict: JSON olarak yazılabilir manifest.
+    """
+    return {
+        "version": MANIFEST_VERSION,
+        "type": BACKUP_TYPE_DIFFERENTIAL if base_zip_path else BACKUP_TYPE_FULL,
+        "source": abs_source_folder_path,
+        "base": os.path.basename(base_zip_path) if base_zip_path else None,
+        "deleted": sorted(deleted),
+        "unchanged_count": unchanged_count,
+        "created": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def find_latest_backup(backup_dir, abs_source_folder_path, exclude_path=None):
+    """Klasörün yedekler klasöründeki en yeni yedeğini bulur.
+
+    Yedekler manifest'teki kaynak klasör yoluna göre eşleştirilir. Manifest'siz
+    eski yedekler dikkate alınmaz: dosya adından hangi klasöre ait oldukları
+    güvenilir şekilde anlaşılamaz (aynı adlı iki klasör, "proje" ve "proje_eski").
+
+    Args:
+        backup_dir: Yedekler klasörü.
+        abs_source_folder_path: Yedeklenen klasörün mutlak yolu.
+        exclude_path: Dikkate alınmayacak ZIP (örn: şu an yazılan dosya).
+
+    Returns:
+        str: En yeni yedeğin yolu; yoksa None.
+    """
+    normcase_source = os.path.normcase(abs_source_folder_path)
+    normcase_exclude = os.path.normcase(os.path.abspath(exclude_path)) if exclude_path else None
+
+    candidates = []
+    try:
+        with os.scandir(backup_dir) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(".zip") or not entry.is_file():
+                    continue
+                if normcase_exclude and os.path.normcase(os.path.abspath(entry.path)) == normcase_exclude:
+                    continue
+                candidates.append((entry.stat().st_mtime, entry.path))
+    except OSError as e:
+        print(f"❗ Yedekler klasörü okunamadı ({backup_dir}): {e}")
+        return None
+
+    # En yeni yedekten geriye doğru ilk eşleşen yedek kullanılır
+    for _mtime, zip_path in sorted(candidates, reverse=True):
+        manifest = read_manifest(zip_path)
+        if manifest is not None and os.path.normcase(manifest.get("source") or "") == normcase_source:
+            return zip_path
+    return None
+
+
+def resolve_chain(zip_path):
+    """Yedeğin geri yüklenmesi için gereken yedek zincirini çözer.
+
+    Returns:
+        list: İlk tam yedekten verilen yedeğe kadar sıralı ZIP yolları.
+
+    Raises:
+        BackupChainError: Temel yedeklerden biri bulunamazsa, zincir döngü içeriyorsa
+                          veya MAX_CHAIN_LENGTH sınırını aşıyorsa.
+    """
+    chain = []
+    seen = set()
+    current = os.path.abspath(zip_path)
+    while current is not None:
+        normcase_current = os.path.normcase(current)
+        if normcase_current in seen:
+            raise BackupChainError(f"Yedek zinciri döngü içeriyor: {os.path.basename(current)}")
+        if len(chain) >= MAX_CHAIN_LENGTH:
+            raise BackupChainError(f"Yedek zinciri çok uzun ({MAX_CHAIN_LENGTH} yedekten fazla): "
+                                   f"{os.path.basename(zip_path)}")
+        if not os.path.isfile(current):
+            raise BackupChainError(f"Temel yedek bulunamadı: {os.path.basename(current)}")
+        seen.add(normcase_current)
+        chain.append(current)
+
+        manifest = read_manifest(current)
+        base_name = manifest.get("base") if manifest else None
+        current = os.path.join(os.path.dirname(current), base_name) if base_name else None
+
+    chain.reverse()
+    return chain
+
+
+def load_snapshot(zip_path):
+    """Yedeğin temsil ettiği tam anlık görüntüyü zincirdeki merkezi dizinlerden oluşturur.
+
+    Returns:
+        dict: ZIP içi ad -> SnapshotEntry (klasör girdileri ve manifest hariç).
+    """
+    return _snapshot_from_chain(resolve_chain(zip_path))
+
+
+def load_base_snapshot(backup_dir, abs_source_folder_path, exclude_path=None):
+    """Yeni bir fark yedeğinin temel alacağı yedeği ve anlık görüntüsünü döndürür.
+
+    Temel yedek yoksa, zinciri okunamıyorsa veya zincir
+    MAX_DIFFERENTIAL_CHAIN_LENGTH yedeğe ulaştıysa tam yedek alınmalıdır.
+
+    Args:
+        backup_dir: Yedekler klasörü.
+        abs_source_folder_path: Yedeklenen klasörün mutlak yolu.
+        exclude_path: Dikkate alınmayacak ZIP (örn: şu an yazılan dosya).
+
+    Returns:
+        tuple: (temel yedeğin yolu, anlık görüntü); tam yedek gerekiyorsa (None, {}).
+    """
+    base_zip_path = find_latest_backup(backup_dir, abs_source_folder_path, exclude_path)
+    if base_zip_path is None:
+        print("🔧 DEBUG: Önceki yedek bulunamadı, tam yedek alınacak")
+        return None, {}
+    try:
+        chain = resolve_chain(base_zip_path)
+        if len(chain) >= MAX_DIFFERENTIAL_CHAIN_LENGTH:
+            print(f"🔧 DEBUG: Yedek zinciri {len(chain)} yedeğe ulaştı, yeni tam yedek alınacak")
+            return None, {}
+        return base_zip_path, _snapshot_from_chain(chain)
+    except (BackupChainError, OSError, zipfile.BadZipFile) as e:
+        print(f"❗ Önceki yedek zinciri okunamadı, tam yedek alınacak: {e}")
+        return None, {}
+
+
+def _snapshot_from_chain(chain):
+    """İlk tam yedekten başlayan zincirin merkezi dizinlerinden anlık görüntü oluşturur."""
+    snapshot = {}
+    for chain_zip_path in chain:
+        with zipfile.ZipFile(chain_zip_path, "r") as zf:
+            manifest = None
+            if MANIFEST_NAME in zf.NameToInfo:
+                try:
+                    manifest = json.loads(zf.read(MANIFEST_NAME))
+                except ValueError:
+                    manifest = None
+            if manifest and manifest.get("type") == BACKUP_TYPE_DIFFERENTIAL:
+                for deleted_name in manifest.get("deleted", []):
+                    snapshot.pop(deleted_name, None)
+            else:
+                # Tam yedek önceki her şeyin yerini alır
+                snapshot.clear()
+            for zinfo in zf.infolist():
+                if zinfo.is_dir() or zinfo.filename == MANIFEST_NAME:
+                    continue
+                snapshot[zinfo.filename] = SnapshotEntry(chain_zip_path, zinfo)
+    return snapshot
+
+
+def is_unchanged(snapshot_entry, file_path, stat_result=None, cancel_token=None):
+    """Dosyanın anlık görüntüdeki haliyle aynı olup olmadığını kontrol eder.
+
+    Boyut farklıysa değişmiştir; boyut ve tarih aynıysa değişmemiş kabul
+    edilir; yalnızca tarih farklıysa CRC karşılaştırılır (örn: dosyaya
+    dokunulmuş ama içeriği değişmemiş).
+
+    Args:
+        snapshot_entry: load_snapshot'tan gelen SnapshotEntry (yeni dosyada None).
+        file_path: Diskteki dosya.
+        stat_result: Dosyanın os.stat sonucu (verilmezse okunur).
+        cancel_token: CRC hesaplanırken kontrol edilecek CancellationToken (opsiyonel).
+
+    Returns:
+        bool: Dosya değişmemişse True.
+    """
+    if snapshot_entry is None:
+        return False
+    if stat_result is None:
+        stat_result = os.stat(file_path)
+    zinfo = snapshot_entry.zinfo
+    if zinfo.file_size != stat_result.st_size:
+        return False
+    if zinfo.date_time == zip_date_time(stat_result.st_mtime):
+        return True
+    return file_crc32(file_path, cancel_token) == zinfo.CRC
+
+
+def restore_snapshot(zip_path, target_dir, cancel_token=None, progress_callback=None):
+    """Yedeğin tam anlık görüntüsünü zinciri takip ederek hedef klasöre çıkartır.
+
+    Args:
+        zip_path: Geri yüklenecek (tam veya fark) yedek.
+        target_dir: Dosyaların çıkartılacağı klasör.
+        cancel_token: Dosyalar arasında kontrol edilen CancellationToken (opsiyonel).
+        progress_callback: progress_callback(metin, oran) ile ilerleme bildirir (opsiyonel).
+
+    Returns:
+        int: Geri yüklenen dosya sayısı.
+    """
+    snapshot = load_snapshot(zip_path)
+    entries_by_zip = {}
+    for entry in snapshot.values():
+        entries_by_zip.setdefault(entry.zip_path, []).append(entry.zinfo)
+
+    total = len(snapshot)
+    restored = 0
+    for chain_zip_path, zinfos in entries_by_zip.items():
+        with zipfile.ZipFile(chain_zip_path, "r") as zf:
+            for zinfo in zinfos:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                zf.extract(zinfo, target_dir)
+                restored += 1
+                if progress_callback is not None:
+                    progress_callback(f"{restored}/{total} dosya geri yüklendi", restored / total)
+    return restored
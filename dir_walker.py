@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+Dir Walker - Paralel Klasör Tarama Modülü
+
+Bu modül, klasör ağaçlarını birden fazla thread ile paralel olarak tarayan
+ortak bir yardımcı sağlar. Sıkıştırma, dosya indeksi (dosya arama, kelime
+arama, klasör özellikleri) ve metod analizi gibi ağaç tarayan tüm özellikler
+bu yardımcıyı kullanır.
+
+Her thread kendi klasör kuyruğunu (deque) işler; kuyruğu boşalan thread
+diğerlerinin kuyruğundan iş çalar (work-stealing). os.scandir çağrıları
+GIL'i bıraktığından, özellikle ağ paylaşımlarında ve soğuk önbellekte
+klasör listeleme süresi belirgin şekilde kısalır.
+
+Kullanım:
+    from dir_walker import parallel_walk
+    from exclusion_utils import ExclusionManager
+
+    manager = ExclusionManager("__pycache__, .git")
+    for dir_path, dir_entries, file_entries in parallel_walk("C:\\project", manager):
+        for entry in file_entries:
+            print(entry.path, entry.stat().st_size)  # stat() önbellekten gelir
+"""
+
+import os
+import queue
+import threading
+from collections import deque
+
+
+# Varsayılan thread sayısı (iş G/Ç ağırlıklı olduğundan CPU sayısından bağımsız)
+DEFAULT_WALKER_WORKERS = 8
+
+_WALK_DONE = object()
+
+
+class ParallelDirWalker:
+    """Klasör ağacını work-stealing thread havuzu ile tarayan sınıf.
+
+    Sonuçlar os.walk biçiminde (klasör_yolu, klasör_girdileri, dosya_girdileri)
+    üçlüleri olarak üretilir; girdiler os.DirEntry nesneleridir. Bir klasör her
+    zaman alt klasörlerinden önce üretilir. Klasörler arası sıra ise
+    belirsizdir.
+
+    Attributes:
+        root: Taranacak kök klasör.
+        exclusion_manager: Klasör seviyesinde budama için ExclusionManager (opsiyonel).
+        prune_dir: Ek budama kuralı; DirEntry alır, True dönerse klasöre girilmez (opsiyonel).
+        max_workers: Thread sayısı.
+        stat_files: True ise dosyaların stat() bilgisi thread içinde alınıp
+                    DirEntry üzerinde önbelleğe alınır.
+        log_pruned: True ise hariç tutulan klasörler debug çıktısına yazılır.
+    """
+
+    def __init__(self, root, exclusion_manager=None, prune_dir=None, max_workers=None, stat_files=True,
+                 log_pruned=False):
+        """ParallelDirWalker'ı başlatır.
+
+        Args:
+            root: Taranacak kök klasör.
+            exclusion_manager: Klasör budaması için ExclusionManager (opsiyonel).
+            prune_dir: Ek budama kuralı (opsiyonel).
+            max_workers: Thread sayısı (varsayılan DEFAULT_WALKER_WORKERS).
+            stat_files: Dosya stat bilgisinin önceden alınıp alınmayacağı.
+            log_pruned: Hariç tutulan klasörlerin debug çıktısına yazılıp yazılmayacağı.
+        """
+        self.root = root
+        self.exclusion_manager = exclusion_manager
+        self.prune_dir = prune_dir
+        self.max_workers = max_workers or DEFAULT_WALKER_WORKERS
+        self.stat_files = stat_files
+        self.log_pruned = log_pruned
+
+    def walk(self):
+        """Klasör ağacını paralel olarak tarar ve sonuçları üretir.
+
+        Yields:
+            tuple: (klasör_yolu, klasör_girdileri, dosya_girdileri)
+        """
+        deques = [deque() for _ in range(self.max_workers)]
+        results = queue.Queue(maxsize=1024)
+        state = {"pending": 1}
+        condition = threading.Condition()
+        stop_event = threading.Event()
+
+        deques[0].append(self.root)
+        workers = [threading.Thread(target=self._worker, args=(i, deques, results, state, condition, stop_event),
+                                    daemon=True)
+                   for i in range(self.max_workers)]
+        for worker in workers:
+            worker.start()
+
+        try:
+            while True:
+                item = results.get()
+                if item is _WALK_DONE:
+                    break
+                yield item
+        finally:
+            # Tüketici erken çıktıysa (break, hata) thread'leri durdur
+            stop_event.set()
+            with condition:
+                condition.notify_all()
+            while True:
+                try:
+                    results.get_nowait()
+                except queue.Empty:
+                    break
+
+    def _steal(self, index, deques):
+        """Diğer thread'lerin kuyruklarının başından (en eski) iş çalar."""
+        for offset in range(1, len(deques)):
+            try:
+                return deques[(index + offset) % len(deques)].popleft()
+            except IndexError:
+                continue
+        return None
+
+    def _worker(self, index, deques, results, state, condition, stop_event):
+        """Thread döngüsü: kendi kuyruğunun sonundan alır, boşsa iş çalar."""
+        own_deque = deques[index]
+        while not stop_event.is_set():
+            try:
+                dir_path = own_deque.pop()
+            except IndexError:
+                dir_path = self._steal(index, deques)
+                if dir_path is None:
+                    with condition:
+                        if state["pending"] == 0:
+                            return
+                        condition.wait(0.05)
+                    continue
+
+            sub_dirs = self._scan_dir(dir_path, results, stop_event)
+
+            # Sonuç, alt klasörler kuyruğa eklenmeden önce yayınlandı (üst klasör önce gelir).
+            # Sayaç, alt klasörler çalınabilir hale gelmeden önce artırılır; aksi halde
+            # başka bir thread onları bitirip sayacı erkenden sıfıra indirebilir.
+            with condition:
+                state["pending"] += len(sub_dirs) - 1
+                own_deque.extend(sub_dirs)
+                if state["pending"] == 0:
+                    condition.notify_all()
+                    self._put(results, _WALK_DONE, stop_event)
+                elif sub_dirs:
+                    condition.notify_all()
+
+    @staticmethod
+    def _put(results, item, stop_event):
+        """Sonuç kuyruğuna ekler; tüketici durduysa beklemeyi bırakır."""
+        while not stop_event.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _scan_dir(self, dir_path, results, stop_event):
+        """Tek bir klasörü listeler, sonucu yayınlar ve girilecek alt klasörleri döndürür."""
+        dir_entries = []
+        file_entries = []
+        sub_dirs = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if not is_dir:
+                        if self.stat_files:
+                            try:
+                                entry.stat()  # Sonuç DirEntry üzerinde önbelleğe alınır
+                            except OSError:
+                                pass
+                        file_entries.append(entry)
+                        continue
+
+                    if self.exclusion_manager is not None and self.exclusion_manager.should_exclude_dir(entry.name):
+                        if self.log_pruned:
+                            print(f"🔧 DEBUG: Klasör hariç tutuluyor: {entry.path}")
+                        continue
+                    if self.prune_dir is not None and self.prune_dir(entry):
+                        continue
+                    dir_entries.append(entry)
+                    try:
+                        # os.walk gibi sembolik bağlantılı klasörlere girilmez
+                        if not entry.is_symlink():
+                            sub_dirs.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            # Okunamayan klasörler os.walk'taki gibi sessizce atlanır
+            return []
+
+        self._put(results, (dir_path, dir_entries, file_entries), stop_event)
+        return sub_dirs
+
+
+def parallel_walk(root, exclusion_manager=None, prune_dir=None, max_workers=None, stat_files=True, log_pruned=False):
+    """Klasör ağacını paralel olarak tarar (ParallelDirWalker kısayolu).
+
+    Args:
+        root: Taranacak kök klasör.
+        exclusion_manager: Klasör budaması için ExclusionManager (opsiyonel).
+        prune_dir: Ek budama kuralı; DirEntry alır, True dönerse klasöre girilmez (opsiyonel).
+        max_workers: Thread sayısı (opsiyonel).
+        stat_files: Dosya stat bilgisinin önceden alınıp alınmayacağı.
+        log_pruned: Hariç tutulan klasörlerin debug çıktısına yazılıp yazılmayacağı.
+
+    Yields:
+        tuple: (klasör_yolu, klasör_girdileri, dosya_girdileri)
+    """
+    return ParallelDirWalker(root, exclusion_manager, prune_dir, max_workers, stat_files, log_pruned).walk()
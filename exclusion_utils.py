@@ -22,9 +22,41 @@ Kullanım:
 """
 
 import os
+import re
 import fnmatch
 
 
+# Bu karakterleri içermeyen pattern'ler düz isimdir (örn: __pycache__, .git)
+_WILDCARD_CHARS = ('*', '?', '[')
+
+
+def _compile_patterns(patterns):
+    """Pattern listesini hızlı eşleştirme için derler.
+    
+    Düz isimler küçük harfe çevrilerek bir frozenset'e, joker karakterli
+    pattern'ler fnmatch.translate ile tek bir birleşik regex'e dönüştürülür.
+    Eşleştirme küçük harfe çevrilmiş isim üzerinde yapılır; sonuç her
+    pattern için fnmatch.fnmatch(isim.lower(), pattern.lower()) ile aynıdır.
+    
+    Args:
+        patterns: fnmatch pattern'leri listesi
+    
+    Returns:
+        tuple: (düz isimler frozenset'i, birleşik regex'in match metodu veya None)
+    """
+    literals = set()
+    wildcard_regexes = []
+    for pattern in patterns:
+        pattern_lower = pattern.lower()
+        if any(char in pattern_lower for char in _WILDCARD_CHARS):
+            wildcard_regexes.append(fnmatch.translate(pattern_lower))
+        else:
+            literals.add(pattern_lower)
+    
+    matcher = re.compile('|'.join(wildcard_regexes)).match if wildcard_regexes else None
+    return frozenset(literals), matcher
+
+
 class ExclusionManager:
     """Hariç tutma pattern'lerini yöneten merkezi sınıf."""
     
@@ -43,6 +75,12 @@ class ExclusionManager:
         if exclusion_string:
             self.raw_patterns = [p.strip() for p in exclusion_string.split(',') if p.strip()]
             self._parse_patterns()
+        self._compile()
+    
+    def _compile(self):
+        """Klasör ve dosya pattern'lerini derler (her kontrol tek set araması + tek regex)."""
+        self._dir_literals, self._dir_matcher = _compile_patterns(self.dir_patterns)
+        self._file_literals, self._file_matcher = _compile_patterns(self.file_patterns)
     
     def _parse_patterns(self):
         """Exclusion pattern'lerini klasör ve dosya pattern'lerine ayırır.
@@ -103,10 +141,10 @@ class ExclusionManager:
         if not self.dir_patterns:
             return False
         
-        for pattern in self.dir_patterns:
-            if fnmatch.fnmatch(dir_name.lower(), pattern.lower()):
-                return True
-        return False
+        name = dir_name.lower()
+        if name in self._dir_literals:
+            return True
+        return self._dir_matcher is not None and self._dir_matcher(name) is not None
     
     def should_exclude_file(self, file_name):
         """Dosyanın sadece dosya adına göre hariç tutulup tutulmayacağını kontrol eder.
@@ -120,10 +158,10 @@ class ExclusionManager:
         if not self.file_patterns:
             return False
         
-        for pattern in self.file_patterns:
-            if fnmatch.fnmatch(file_name.lower(), pattern.lower()):
-                return True
-        return False
+        name = file_name.lower()
+        if name in self._file_literals:
+            return True
+        return self._file_matcher is not None and self._file_matcher(name) is not None
     
     def is_file_excluded(self, file_name, file_path, root_folder):
         """Dosyanın hariç tutulup tutulmayacağını tam olarak kontrol eder.
@@ -233,20 +233,9 @@ class FavoritesManager:
                     self.app.dir_tree.selection_set(current_node)
                     self.app.dir_tree.see(current_node)
                     
-                    # Sağ paneli güncelle
-                    self.app.file_browser.populate_file_list(folder_path)
-                    
-                    # GUI güncellemesinin tamamlanması için biraz bekle ve sonra seçim yap
-                    def select_file():
-                        for item_id in self.app.file_list.get_children():
-                            item_values = self.app.file_list.item(item_id)["values"]
-                            if len(item_values) > 2 and item_values[2] == file_path:  # values[2] dosyanın tam yolu
-                                self.app.file_list.selection_set(item_id)
-                                self.app.file_list.focus(item_id)
-                                self.app.file_list.see(item_id)  # Seçili öğeyi görünür yap
-                                break
-                    
-                    self.app.after(100, select_file)  # 100ms sonra seçim yap
+                    # Sağ paneli güncelle; dosya, listeleme (arka planda) bitince seçilir
+                    self.app.file_browser.populate_file_list(
+                        folder_path, on_done=lambda: self.app.file_browser.select_path_in_list(file_path))
                     break
             
             if not folder_found:
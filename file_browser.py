@@ -4,15 +4,43 @@ import json # Sütun genişliklerini yüklemek için
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog 
 import os
+import stat # İzleyici olaylarında dosya türünü ayırt etmek için
 from datetime import datetime
 import zipfile # ZIP dosyalarını okumak için
 import subprocess # ZIP içeriğini göstermek için
 import platform # ZIP içeriğini göstermek için
+import threading # Klasör listeleme worker thread'i için
 
 # Yerel modüllerden importlar (App'den çağrılacakları için App'in importlarına benzer)
 from db_manager import DatabaseManager # Sadece tip belirtmek için gerekebilir, App üzerinden erişilecek
 from utils import ICON_FOLDER, ICON_PYTHON_FILE, ICON_COMPRESS, ICON_EXECUTABLE, ICON_UNKNOWN, BACKUP_FOLDER_BASENAME # İkon sabitleri ve yedekleme klasörü adı
 from ui_dialogs import ZipContentsWindow # ZIP içeriği penceresi
+from cancellation import CancellationToken, OperationCancelled # Bayat listelemeleri iptal etmek için
+from listing_cache import ListingCache # Klasör listeleme önbelleği
+from fs_watcher import (create_watcher, FolderEvent, EVENT_CREATED, EVENT_DELETED, EVENT_MODIFIED,
+                        EVENT_RENAMED, EVENT_RESCAN) # Dosya listesi ve ağaç için canlı güncelleme
+
+LISTING_CHUNK_SIZE = 500 # Dosya listesine bir after() çağrısında eklenecek satır sayısı
+
+class ListingEntry:
+    """Dosya listesindeki bir girdinin tek stat ile okunan bilgileri.
+
+    Attributes:
+        name: Dosya/klasör adı.
+        path: Tam yol.
+        is_dir: Klasörse True.
+        size: Bayt cinsinden boyut (stat başarısızsa None).
+        mtime: Değiştirilme zamanı (stat başarısızsa None).
+    """
+    __slots__ = ("name", "path", "is_dir", "size", "mtime")
+
+    def __init__(self, name, path, is_dir, size, mtime):
+        self.name = name
+        self.path = path
+        self.is_dir = is_dir
+        self.size = size
+        self.mtime = mtime
+
 
 class FileBrowser:
     """Dosya tarayıcı ve klasör gezinme yöneticisi.
@@ -23,6 +51,8 @@ class FileBrowser:
     
     Attributes:
         app: Ana uygulama referansı (App).
+        listing_cache: Son açılan klasörlerin listeleme önbelleği (ListingCache).
+        watcher: Görüntülenen klasörü ve açılmış ağaç düğümlerini izleyen dosya izleyici.
         
     Example:
         >>> file_browser = FileBrowser(app_instance)
@@ -35,11 +65,22 @@ class FileBrowser:
             app_instance: Ana uygulama referansı.
         """
         self.app = app_instance
+        self._listing_token = None # Süren dosya listelemesinin iptal token'ı
+        self.listing_cache = ListingCache() # Son açılan klasörlerin listeleme önbelleği
+        self.watcher = create_watcher(self._on_watcher_events) # Dosya sistemi değişiklikleri için
+        self._watched_tree_nodes = {} # İzlenen klasör anahtarı -> dir_tree düğümü
+        self._watched_list_folder = None # Dosya listesi için izlenen klasör
+        self._cache_watches = {} # Önbellekte kaydı olduğu için izlenen klasör anahtarı -> klasör yolu
+        self._pending_list_events = [] # Listeleme sürerken gelen olaylar
+        self._row_entries = {} # file_list satırı -> (ListingEntry, açıklama); sıralama için tipli model
+        self._on_listing_done = None # Sürmekte olan listeleme bitince çağrılacak fonksiyon
 
     def populate_tree(self, start_path):
         """Klasör ağacını belirtilen yoldan başlayarak doldurur."""
         for i in self.app.dir_tree.get_children():
             self.app.dir_tree.delete(i)
+        for key in list(self._watched_tree_nodes):
+            self._forget_tree_watch(key)
 
         try:
             if not os.path.isdir(start_path):
@@ -54,6 +95,7 @@ class FileBrowser:
                 self.app.dir_tree.item(root_node, image=self.app.folder_icon)
 
             self._populate_node_children(root_node, start_path)
+            self._watch_tree_node(root_node, start_path)
             self.app.dir_tree.focus(root_node)
             self.app.dir_tree.selection_set(root_node)
             self.on_tree_select(None) # Manuel tetikleme
@@ -65,19 +107,25 @@ class FileBrowser:
         try:
             for item in sorted(os.scandir(parent_path), key=lambda e: e.name):
                 if item.is_dir() and not item.name.startswith('.'):
-                    node_options = {"text": item.name, "open": False, "values": [item.path]}
-                    if self.app.folder_icon:
-                        node_options["image"] = self.app.folder_icon
-                    node = self.app.dir_tree.insert(parent_node, tk.END, **node_options)
-                    # Placeholder only if there are subdirectories
-                    try:
-                        if any(child.is_dir() and not child.name.startswith('.') for child in os.scandir(item.path)):
-                            self.app.dir_tree.insert(node, tk.END, text="...")
-                    except OSError:
-                        pass
+                    self._insert_tree_node(parent_node, item.name, item.path)
         except OSError as e:
             print(f"❗ Klasör taranırken hata {parent_path}: {e}")
 
+    def _insert_tree_node(self, parent_node, name, path, index=tk.END):
+        """Ağaca bir klasör düğümü ekler; alt klasörü varsa açılabilmesi için placeholder koyar."""
+        node_options = {"text": name, "open": False, "values": [path]}
+        if self.app.folder_icon:
+            node_options["image"] = self.app.folder_icon
+        node = self.app.dir_tree.insert(parent_node, index, **node_options)
+        # Placeholder only if there are subdirectories
+        try:
+            with os.scandir(path) as children:
+                if any(child.is_dir() and not child.name.startswith('.') for child in children):
+                    self.app.dir_tree.insert(node, tk.END, text="...")
+        except OSError:
+            pass
+        return node
+
     def on_node_expand(self, event=None):
         """Bir klasör düğümü genişletildiğinde alt klasörleri yükler."""
         node_id = self.app.dir_tree.focus()
@@ -89,6 +137,7 @@ class FileBrowser:
             try:
                 node_path = self.app.dir_tree.item(node_id, "values")[0]
                 self._populate_node_children(node_id, node_path)
+                self._watch_tree_node(node_id, node_path)
             except IndexError:
                  print(f"❗ Hata: Düğüm yolu alınamadı: {node_id}")
             except Exception as e:
@@ -116,6 +165,7 @@ class FileBrowser:
                 current_col_widths = {
                     "#0": self.app.file_list.column("#0", "width"),
                     "description": self.app.file_list.column("description", "width"),
+                    "size": self.app.file_list.column("size", "width"),
                     "date_modified": self.app.file_list.column("date_modified", "width")
                 }
 
@@ -170,17 +220,106 @@ class FileBrowser:
         else:
             return f"{size_bytes / (1024 ** 3):,.2f} GB"
 
-    def populate_file_list(self, folder_path):
-        """Belirtilen klasördeki Python dosyalarını sağ bölmede listeler."""
+    def populate_file_list(self, folder_path, on_done=None):
+        """Belirtilen klasördeki dosyaları sağ bölmede listeler.
+
+        Klasör bir worker thread'inde okunur (_scan_folder, girdi başına tek
+        stat) ve sıralanır; arayüz thread'inde .py açıklamaları tek sorguda
+        alınır, satırlar biçimlendirilir (_format_row) ve after() ile
+        LISTING_CHUNK_SIZE'lık parçalar halinde Treeview'e eklenir. Yeni bir
+        klasör açıldığında önceki (bayat) listeleme iptal edilir; yavaş ağ
+        sürücüleri ve çok büyük klasörler arayüzü dondurmaz.
+
+        Yakın zamanda açılan ve o zamandan beri değişmeyen klasörler
+        listing_cache'ten (ListingCache) gelir; klasör yeniden okunmaz. Önbellekte
+        kaydı olan klasörler (en fazla MAX_CACHED_FOLDERS) dosya izleyicisiyle
+        izlenmeye devam eder ve değiştiklerinde kayıtları atılır; bu klasörlerin
+        kaydı doğrudan kullanılır. İzlenemeyen klasörlerin kaydı worker
+        thread'inde yalnızca klasör mtime kontrolüyle kullanılır.
+
+        Args:
+            folder_path: Listelenecek klasör.
+            on_done: Tüm satırlar eklendiğinde arayüz thread'inde çağrılır (örn:
+                     bir dosyayı seçmek için, opsiyonel). Listeleme başka bir
+                     klasör açıldığı için iptal edilirse veya hata verirse çağrılmaz.
+        """
+        # Önceki listeleme hâlâ sürüyorsa iptal et
+        if self._listing_token is not None:
+            self._listing_token.cancel()
+        listing_token = CancellationToken()
+        self._listing_token = listing_token
+        self._on_listing_done = on_done
+
         for i in self.app.file_list.get_children():
             self.app.file_list.delete(i)
+        self._row_entries = {}
+
+        # İzlenen klasörlerin önbellek kaydını izleyici güncel tutmuştur
+        folder_key = self._folder_key(folder_path)
+        is_watched_folder = folder_key in self._cache_watches or (
+            self._watched_list_folder is not None and self._folder_key(self._watched_list_folder) == folder_key)
 
         # Hangi klasörün görüntülendiğini App'e bildir
         self.app.currently_displayed_folder_in_file_list = folder_path
+        self._watch_list_folder(folder_path)
+        self._pending_list_events = []
+
+        # Yedekleme klasörü olup olmadığını kontrol et
+        abs_current_folder_path = os.path.abspath(folder_path)
+        abs_backup_dir_path = os.path.abspath(os.path.join(self.app.base_path, BACKUP_FOLDER_BASENAME))
+        is_backup_folder = os.path.normcase(abs_current_folder_path) == os.path.normcase(abs_backup_dir_path)
+
+        self._apply_column_widths(is_backup_folder)
 
+        cached_entries = self.listing_cache.get(folder_path) if is_watched_folder else None
+        if cached_entries is not None:
+            print(f"🔧 DEBUG: Klasör listesi önbellekten: {folder_path} ({len(cached_entries)} girdi)")
+            self._on_folder_scanned(folder_path, is_backup_folder, cached_entries, listing_token)
+            return
+
+        self.app.status_label.config(text=f"'{os.path.basename(folder_path) or folder_path}' okunuyor...")
+        threading.Thread(target=self._listing_worker, args=(folder_path, is_backup_folder, listing_token),
+                         daemon=True).start()
+
+    def _listing_worker(self, folder_path, is_backup_folder, listing_token):
+        """Klasörü okuyup sıralar ve sonucu arayüz thread'ine iletir (worker thread'i)."""
         try:
             if not os.path.isdir(folder_path):
+                self.app.after(0, self._finish_listing, listing_token)
                 return
+            # İzlenmeyen klasörün kaydı yalnızca klasör mtime değeriyle doğrulanır
+            entries = self.listing_cache.get(folder_path)
+            if entries is not None:
+                print(f"🔧 DEBUG: Klasör listesi önbellekten (mtime ile doğrulandı): {folder_path} ({len(entries)} girdi)")
+                self.app.after(0, self._on_folder_scanned, folder_path, is_backup_folder, entries, listing_token)
+                return
+            # mtime okumadan önce alınır; okuma sırasındaki değişiklikler kaydı geçersiz kılar
+            dir_mtime = os.stat(folder_path).st_mtime
+            entries = self._scan_folder(folder_path, listing_token)
+            self._sort_entries(entries, is_backup_folder)
+            self.listing_cache.put(folder_path, dir_mtime, entries)
+        except OperationCancelled:
+            print(f"🔧 DEBUG: Bayat listeleme iptal edildi: {folder_path}")
+            return
+        except OSError as e:
+            error_message = str(e)
+            self.app.after(0, self._handle_listing_error, folder_path, error_message, listing_token)
+            return
+        self.app.after(0, self._on_folder_scanned, folder_path, is_backup_folder, entries, listing_token)
+
+    def _on_folder_scanned(self, folder_path, is_backup_folder, entries, listing_token):
+        """Okunan klasörün satırlarını parça parça eklemeye başlar (arayüz thread'i)."""
+        if listing_token.is_cancelled:
+            return
+        self._sync_cache_watches() # Yeni kayıt eski klasörleri önbellekten atmış olabilir
+        try:
+            py_paths = [entry.path for entry in entries if not entry.is_dir and entry.name.lower().endswith(".py")]
+            descriptions = self.app.db.get_descriptions_batch(py_paths) if py_paths else {}
+
+            # App'deki sıralama durumu varsayılan düzene göre güncellenir
+            if hasattr(self.app, 'file_list_sort_column'):
+                self.app.file_list_sort_column = "date_modified" if is_backup_folder else "#0"
+                self.app.file_list_sort_order_asc = not is_backup_folder
 
             # Add ".." entry to navigate to parent directory if not at the drive root
             parent_folder_path = os.path.dirname(folder_path)
@@ -192,180 +331,480 @@ class FileBrowser:
                                           image=parent_icon,
                                           values=("Üst Klasör", "<YOK>", parent_folder_path),
                                           tags=("parent_folder_item",))
+        except Exception as e:
+            messagebox.showerror("Hata", f"Dosya listesi doldurulurken beklenmedik hata:\n{e}", parent=self.app)
+            return
+        self._insert_listing_chunk(entries, descriptions, 0, listing_token)
 
-            # Klasör içeriğini al ve sıralama için hazırla
-            items_to_process = []
-            try:
-                for entry in os.scandir(folder_path):
-                    items_to_process.append(entry)
-            except OSError as e:
-                messagebox.showerror("Hata", f"'{folder_path}' klasörü okunurken hata oluştu:\n{e}", parent=self.app)
-                return
+    def _insert_listing_chunk(self, entries, descriptions, start, listing_token):
+        """Sıradaki LISTING_CHUNK_SIZE satırı ekler ve kalanı için kendini yeniden zamanlar."""
+        if listing_token.is_cancelled:
+            return
+        try:
+            for entry in entries[start:start + LISTING_CHUNK_SIZE]:
+                row = self._format_row(entry, descriptions.get(entry.path))
+                item_id = self.app.file_list.insert("", tk.END, **row)
+                self._row_entries[item_id] = (entry, row["values"][0])
+        except Exception as e:
+            messagebox.showerror("Hata", f"Dosya listesi doldurulurken beklenmedik hata:\n{e}", parent=self.app)
+            return
+
+        next_start = start + LISTING_CHUNK_SIZE
+        if next_start < len(entries):
+            # Arada arayüz olaylarının işlenmesine izin ver
+            self.app.after(1, self._insert_listing_chunk, entries, descriptions, next_start, listing_token)
+        else:
+            self._finish_listing(listing_token)
+
+    def _finish_listing(self, listing_token):
+        """Listeleme bittiğinde başlık oklarını ve durum çubuğunu günceller."""
+        if listing_token.is_cancelled:
+            return
+        self._listing_token = None
+        # Listeleme sırasında gelen değişiklikleri uygula
+        pending_events, self._pending_list_events = self._pending_list_events, []
+        if pending_events:
+            self._apply_file_list_events(pending_events)
+        # Dosya listesi doldurulduktan sonra App'deki sıralama durumunu yansıtacak şekilde başlıkları güncelle.
+        if hasattr(self.app, '_update_file_list_header_indicators'):
+            self.app._update_file_list_header_indicators()
+        self.app.status_label.config(text="Hazır.")
+        on_done, self._on_listing_done = self._on_listing_done, None
+        if on_done is not None:
+            on_done()
+
+    def _handle_listing_error(self, folder_path, error_message, listing_token):
+        if listing_token.is_cancelled:
+            return
+        self._listing_token = None
+        self._on_listing_done = None
+        self.app.status_label.config(text="Hazır.")
+        messagebox.showerror("Hata", f"'{folder_path}' klasörü okunurken hata oluştu:\n{error_message}", parent=self.app)
+
+    def _scan_folder(self, folder_path, cancel_token=None):
+        """Klasörü okur; her girdi için tek stat yapar (arayüze dokunmaz, worker thread'inde çalışabilir).
 
-            # Yedekleme klasörü olup olmadığını kontrol et
-            abs_current_folder_path = os.path.abspath(folder_path)
-            abs_backup_dir_path = os.path.abspath(os.path.join(self.app.base_path, BACKUP_FOLDER_BASENAME))
-            is_backup_folder = os.path.normcase(abs_current_folder_path) == os.path.normcase(abs_backup_dir_path)
+        Returns:
+            list: ListingEntry listesi.
 
-            # Sütun genişliklerini yükle (yedekleme klasörüne özel veya genel)
-            width_setting_key = "backup_list_column_widths" if is_backup_folder else "file_list_column_widths"
-            saved_widths_json = self.app.db.get_setting(width_setting_key)
-            if saved_widths_json:
+        Raises:
+            OSError: Klasör okunamazsa.
+            OperationCancelled: cancel_token iptal edilirse.
+        """
+        entries = []
+        with os.scandir(folder_path) as scandir_entries:
+            for scandir_entry in scandir_entries:
+                if cancel_token is not None and len(entries) % 256 == 0:
+                    cancel_token.raise_if_cancelled()
+                # is_dir/is_file d_type'tan gelir; sembolik bağlar dışında sistem çağrısı yapmaz
                 try:
-                    saved_widths = json.loads(saved_widths_json)
-                    if isinstance(saved_widths, dict):
-                        for col_id, width_val in saved_widths.items():
-                            if col_id in ("#0", "description", "date_modified"): # Geçerli sütunlar
-                                try:
-                                    self.app.file_list.column(col_id, width=int(width_val))
-                                except (ValueError, tk.TclError) as e_col:
-                                    print(f"❗ HATA: '{width_setting_key}' için '{col_id}' sütun genişliği ({width_val}) uygulanamadı: {e_col}")
-                except json.JSONDecodeError as e:
-                    print(f"❗ HATA: Kayıtlı sütun genişlikleri ('{width_setting_key}') okunamadı (JSON): {e}")
-            else:
-                # Kayıtlı ayar yoksa, varsayılan genişlikleri (UIManager._setup_ui'de tanımlanan) kullan
-                # veya burada tekrar ayarla (güvenlik için)
-                self.app.file_list.column("#0", width=250)
-                self.app.file_list.column("description", width=300)
-                self.app.file_list.column("date_modified", width=150)
-
-            if is_backup_folder:
-                # Yedekleme klasörü ise değiştirme tarihine göre azalan sırada sırala
-                def get_mtime_for_sort(scandir_entry):
-                    try:
-                        return os.stat(scandir_entry.path).st_mtime
-                    except OSError:
-                        return -1 # Hata durumunda en sona at
-                items_to_process.sort(key=get_mtime_for_sort, reverse=True)
-                if hasattr(self.app, 'file_list_sort_column'):
-                    self.app.file_list_sort_column = "date_modified"
-                    self.app.file_list_sort_order_asc = False
-            else:
-                # Diğer klasörler için isme göre artan sırada sırala
-                items_to_process.sort(key=lambda e: e.name.lower())
-                if hasattr(self.app, 'file_list_sort_column'):
-                    self.app.file_list_sort_column = "#0" # Dosya Adı
-                    self.app.file_list_sort_order_asc = True
-
-            datetime_str = '%Y.%m.%d - %H:%M'
-            # item.name.lower() yerine item_name_lower kullanılacak
-            for item in items_to_process:
-                item_path = item.path
-                item_name = item.name
-                description = ""
-                current_icon = None
-                file_type_tag = None
-                date_modified_str = "N/A"
-
-                if item.is_dir():
-                    description = "Klasör"
-                    current_icon = self.app.folder_icon if hasattr(self.app, 'folder_icon') else None
-                    file_type_tag = "folder_item"
-                    try:
-                        mod_timestamp = os.stat(item_path).st_mtime
-                        date_modified_str = datetime.fromtimestamp(mod_timestamp).strftime(datetime_str)
-                    except OSError:
-                        date_modified_str = "N/A"
-                elif item.is_file():
-                    item_name_lower = item_name.lower()
-                    if item_name_lower.endswith(".py"):
-                        file_stat = os.stat(item_path)
-                        size_in_bytes = file_stat.st_size
-                        desc = self.app.db.get_description(item_path)
-                        description = desc if desc else f" [{self.format_file_size(size_in_bytes)}]"
-                        current_icon = self.app.file_icon if hasattr(self.app, 'file_icon') else None
-                        file_type_tag = "python_file"
-                    elif item_name_lower.endswith(".json"):
-                        file_stat = os.stat(item_path)
-                        size_in_bytes = file_stat.st_size
-                        description = f"JSON Dosyası [{self.format_file_size(size_in_bytes)}]"
-                        current_icon = self.app.file_icon if hasattr(self.app, 'file_icon') else None
-                        file_type_tag = "json_file"
-                    elif item_name_lower.endswith((".md", ".markdown")):
-                        file_stat = os.stat(item_path)
-                        size_in_bytes = file_stat.st_size
-                        description = f"Markdown [{self.format_file_size(size_in_bytes)}]"
-                        current_icon = self.app.file_icon if hasattr(self.app, 'file_icon') else None
-                        file_type_tag = "markdown_file"
-                    elif item_name_lower.endswith(".zip"):
-                        file_stat = os.stat(item_path)
-                        mod_time_for_desc = datetime.fromtimestamp(file_stat.st_mtime).strftime(datetime_str)
-                        size_in_bytes = file_stat.st_size
-                        description = f"ZIP - {self.format_file_size(size_in_bytes)}"
-                        current_icon = self.app.zip_icon if hasattr(self.app, 'zip_icon') else None
-                        file_type_tag = "zip_file"
-                    elif item_name_lower.endswith(".exe"):
-                        file_stat = os.stat(item_path)
-                        mod_time_for_desc = datetime.fromtimestamp(file_stat.st_mtime).strftime(datetime_str)
-                        size_in_bytes = file_stat.st_size
-                        description = f"Uygulama - {self.format_file_size(size_in_bytes)}"
-                        current_icon = self.app.exe_icon if hasattr(self.app, 'exe_icon') else None
-                        file_type_tag = "exe_file"
-                    elif item_name_lower.endswith(".db"):
-                        try:
-                            file_stat = os.stat(item_path)
-                            mod_time_for_desc = datetime.fromtimestamp(file_stat.st_mtime).strftime(datetime_str)
-                            size_in_bytes = file_stat.st_size
-                            description = f"Veritabanı - {self.format_file_size(size_in_bytes)}"
-                        except OSError:
-                            description = "Veritabanı Dosyası"
-                        current_icon = self.app.db_icon if hasattr(self.app, 'db_icon') else None
-                        file_type_tag = "db_file"
-                    elif item_name_lower.endswith(".mp3"):
-                        file_stat = os.stat(item_path)
-                        mod_time_for_desc = datetime.fromtimestamp(file_stat.st_mtime).strftime(datetime_str)
-                        size_in_bytes = file_stat.st_size
-                        size_in_kb = size_in_bytes / (1024)
-                        description = f"MP3 Ses Dosyası - {size_in_kb:,.2f} KB"
-                        current_icon = self.app.mp3_icon if hasattr(self.app, 'mp3_icon') else None
-                        file_type_tag = "mp3_file"
-                    else: # Diğer tüm dosya türleri
-                        try:
-                            file_stat = os.stat(item_path)
-                            mod_time_for_desc = datetime.fromtimestamp(file_stat.st_mtime).strftime(datetime_str)
-                            size_in_bytes = file_stat.st_size
-                            if size_in_bytes < 1024:
-                                size_str = f"{size_in_bytes} B"
-                            elif size_in_bytes < 1024 * 1024:
-                                size_str = f"{size_in_bytes / 1024:,.1f} KB"
-                            else:
-                                size_str = f"{size_in_bytes / (1024 * 1024):,.2f} MB"
-                            description = f"Dosya - {size_str}"
-                        except OSError:
-                            description = "Dosya" # Fallback
-                        current_icon = self.app.unknown_icon if hasattr(self.app, 'unknown_icon') else None
-                        file_type_tag = "other_file"
-
-                    try:
-                        mod_timestamp = os.stat(item_path).st_mtime
-                        date_modified_str = datetime.fromtimestamp(mod_timestamp).strftime(datetime_str)
-                    except OSError:
-                        date_modified_str = "N/A"
+                    is_dir = scandir_entry.is_dir()
+                    if not is_dir and not scandir_entry.is_file():
+                        continue # Skip other types like broken symlinks
+                except OSError:
+                    continue
+                try:
+                    entry_stat = scandir_entry.stat()
+                    size, mtime = entry_stat.st_size, entry_stat.st_mtime
+                except OSError:
+                    size, mtime = None, None
+                entries.append(ListingEntry(scandir_entry.name, scandir_entry.path, is_dir, size, mtime))
+        return entries
+
+    def _apply_column_widths(self, is_backup_folder):
+        """Sütun genişliklerini yükler (yedekleme klasörüne özel veya genel)."""
+        width_setting_key = "backup_list_column_widths" if is_backup_folder else "file_list_column_widths"
+        saved_widths_json = self.app.db.get_setting(width_setting_key)
+        if saved_widths_json:
+            try:
+                saved_widths = json.loads(saved_widths_json)
+                if isinstance(saved_widths, dict):
+                    for col_id, width_val in saved_widths.items():
+                        if col_id in ("#0", "description", "size", "date_modified"): # Geçerli sütunlar
+                            try:
+                                self.app.file_list.column(col_id, width=int(width_val))
+                            except (ValueError, tk.TclError) as e_col:
+                                print(f"❗ HATA: '{width_setting_key}' için '{col_id}' sütun genişliği ({width_val}) uygulanamadı: {e_col}")
+            except json.JSONDecodeError as e:
+                print(f"❗ HATA: Kayıtlı sütun genişlikleri ('{width_setting_key}') okunamadı (JSON): {e}")
+        else:
+            # Kayıtlı ayar yoksa, varsayılan genişlikleri (UIManager._setup_ui'de tanımlanan) kullan
+            # veya burada tekrar ayarla (güvenlik için)
+            self.app.file_list.column("#0", width=250)
+            self.app.file_list.column("description", width=300)
+            self.app.file_list.column("size", width=90)
+            self.app.file_list.column("date_modified", width=150)
+
+    @staticmethod
+    def _sort_entries(entries, is_backup_folder):
+        """Girdileri varsayılan düzene sokar (worker thread'inde çalışabilir)."""
+        if is_backup_folder:
+            # Yedekleme klasörü ise değiştirme tarihine göre azalan sırada sırala (okunamayanlar en sona)
+            entries.sort(key=lambda e: e.mtime if e.mtime is not None else -1, reverse=True)
+        else:
+            # Diğer klasörler için isme göre artan sırada sırala
+            entries.sort(key=lambda e: e.name.lower())
+
+    def _format_row(self, entry, py_description=None):
+        """ListingEntry'den Treeview satır seçeneklerini oluşturur (G/Ç yapmaz).
+
+        Args:
+            entry: _scan_folder'dan gelen ListingEntry.
+            py_description: .py dosyası için kayıtlı açıklama (opsiyonel).
+
+        Returns:
+            dict: file_list.insert'e verilecek text, values (açıklama, tarih, yol, boyut), image ve tags.
+        """
+        datetime_str = '%Y.%m.%d - %H:%M'
+        size_in_bytes = entry.size
+        has_stat = size_in_bytes is not None
+        date_modified_str = datetime.fromtimestamp(entry.mtime).strftime(datetime_str) if has_stat else "N/A"
+
+        if entry.is_dir:
+            description = "Klasör"
+            current_icon = self.app.folder_icon if hasattr(self.app, 'folder_icon') else None
+            file_type_tag = "folder_item"
+        else:
+            item_name_lower = entry.name.lower()
+            if item_name_lower.endswith(".py"):
+                if py_description:
+                    description = py_description
+                else:
+                    description = f" [{self.format_file_size(size_in_bytes)}]" if has_stat else ""
+                current_icon = self.app.file_icon if hasattr(self.app, 'file_icon') else None
+                file_type_tag = "python_file"
+            elif item_name_lower.endswith(".json"):
+                description = f"JSON Dosyası [{self.format_file_size(size_in_bytes)}]" if has_stat else "JSON Dosyası"
+                current_icon = self.app.file_icon if hasattr(self.app, 'file_icon') else None
+                file_type_tag = "json_file"
+            elif item_name_lower.endswith((".md", ".markdown")):
+                description = f"Markdown [{self.format_file_size(size_in_bytes)}]" if has_stat else "Markdown"
+                current_icon = self.app.file_icon if hasattr(self.app, 'file_icon') else None
+                file_type_tag = "markdown_file"
+            elif item_name_lower.endswith(".zip"):
+                description = f"ZIP - {self.format_file_size(size_in_bytes)}" if has_stat else "ZIP"
+                current_icon = self.app.zip_icon if hasattr(self.app, 'zip_icon') else None
+                file_type_tag = "zip_file"
+            elif item_name_lower.endswith(".exe"):
+                description = f"Uygulama - {self.format_file_size(size_in_bytes)}" if has_stat else "Uygulama"
+                current_icon = self.app.exe_icon if hasattr(self.app, 'exe_icon') else None
+                file_type_tag = "exe_file"
+            elif item_name_lower.endswith(".db"):
+                description = f"Veritabanı - {self.format_file_size(size_in_bytes)}" if has_stat else "Veritabanı Dosyası"
+                current_icon = self.app.db_icon if hasattr(self.app, 'db_icon') else None
+                file_type_tag = "db_file"
+            elif item_name_lower.endswith(".mp3"):
+                description = f"MP3 Ses Dosyası - {size_in_bytes / 1024:,.2f} KB" if has_stat else "MP3 Ses Dosyası"
+                current_icon = self.app.mp3_icon if hasattr(self.app, 'mp3_icon') else None
+                file_type_tag = "mp3_file"
+            else: # Diğer tüm dosya türleri
+                if not has_stat:
+                    description = "Dosya" # Fallback
+                elif size_in_bytes < 1024:
+                    description = f"Dosya - {size_in_bytes} B"
+                elif size_in_bytes < 1024 * 1024:
+                    description = f"Dosya - {size_in_bytes / 1024:,.1f} KB"
                 else:
-                    continue # Skip other types like symlinks for now
+                    description = f"Dosya - {size_in_bytes / (1024 * 1024):,.2f} MB"
+                current_icon = self.app.unknown_icon if hasattr(self.app, 'unknown_icon') else None
+                file_type_tag = "other_file"
 
-                file_node_options = {"text": item_name, "values": (description, date_modified_str, item_path)}
-                if current_icon:
-                    file_node_options["image"] = current_icon
-                
-                if file_type_tag:
-                    file_node_options["tags"] = (file_type_tag,)
+        size_str = self.format_file_size(size_in_bytes) if has_stat and not entry.is_dir else ""
+        file_node_options = {"text": entry.name, "values": (description, date_modified_str, entry.path, size_str),
+                             "tags": (file_type_tag,)}
+        if current_icon:
+            file_node_options["image"] = current_icon
+        return file_node_options
 
-                self.app.file_list.insert("", tk.END, **file_node_options)
+    # --- Dosya sistemi izleyici ---
 
-            # Dosya listesi doldurulduktan sonra App'deki sıralama durumunu (yukarıda ayarlandı)
-            # yansıtacak şekilde başlıkları güncelle.
-            # Eğer yedekleme klasörü değilse ve kullanıcı daha önce bir sıralama yapmadıysa,
-            # varsayılan olarak isme göre sıralanmış olacak ve başlıkta ok görünmeyecek
-            # (eğer file_list_sort_column = None ve _update_file_list_header_indicators buna göre davranıyorsa)
-            # veya "#0" (Dosya Adı) için artan ok görünecek.
-            if hasattr(self.app, '_update_file_list_header_indicators'):
-                self.app._update_file_list_header_indicators()
+    @staticmethod
+    def _folder_key(folder_path):
+        return os.path.normcase(os.path.abspath(folder_path))
 
-        except OSError as e:
-            messagebox.showerror("Hata", f"Klasör okunurken hata oluştu:\n{e}", parent=self.app)
-        except Exception as e:
-            messagebox.showerror("Hata", f"Dosya listesi doldurulurken beklenmedik hata:\n{e}", parent=self.app)
+    def _update_watch(self, folder_path):
+        """Klasörün izlemesini kullanım yerlerine göre ayarlar.
+
+        Dosya listesinde gösterilen veya önbellekte kaydı olan klasörler dosya
+        değişiklikleriyle birlikte, yalnızca ağaç düğümü olanlar alt klasörleri
+        için izlenir; hiçbirinde kullanılmayan klasörün izlemesi bırakılır.
+        """
+        key = self._folder_key(folder_path)
+        is_list_folder = self._watched_list_folder is not None and self._folder_key(self._watched_list_folder) == key
+        if is_list_folder or key in self._cache_watches:
+            self.watcher.watch(folder_path, contents=True)
+        elif key in self._watched_tree_nodes:
+            self.watcher.watch(folder_path, contents=False)
+        else:
+            self.watcher.unwatch(folder_path)
+
+    def _watch_list_folder(self, folder_path):
+        """Dosya listesinde gösterilen klasörü (dosya değişiklikleriyle birlikte) izlemeye alır."""
+        previous = self._watched_list_folder
+        self._watched_list_folder = folder_path
+        if previous is not None and self._folder_key(previous) != self._folder_key(folder_path):
+            # Önbellekte kaydı kalan klasör, kaydı güncel kalsın diye izlenmeye devam eder
+            if previous in self.listing_cache:
+                self._cache_watches[self._folder_key(previous)] = previous
+            self._update_watch(previous)
+        self._update_watch(folder_path)
+        self._sync_cache_watches()
+
+    def _sync_cache_watches(self):
+        """Önbellekten atılan (LRU veya mtime değişikliği) klasörlerin izlemelerini bırakır."""
+        for key, folder_path in list(self._cache_watches.items()):
+            if folder_path not in self.listing_cache:
+                del self._cache_watches[key]
+                self._update_watch(folder_path)
+
+    def _watch_tree_node(self, node_id, folder_path):
+        """Alt klasörleri yüklenmiş ağaç düğümünü izlemeye alır."""
+        self._watched_tree_nodes[self._folder_key(folder_path)] = node_id
+        self._update_watch(folder_path)
+
+    def _forget_tree_watch(self, key):
+        """Ağaç düğümünün izlemesini bırakır (gösterilen veya önbellekteki klasör izlenmeye devam eder)."""
+        node_id = self._watched_tree_nodes.pop(key, None)
+        if node_id is None:
+            return
+        self._update_watch(key)
+
+    def _forget_tree_watches_under(self, folder_path):
+        """Silinen/taşınan klasörün ve altındaki ağaç düğümlerinin izlemelerini bırakır."""
+        key = self._folder_key(folder_path)
+        prefix = key.rstrip(os.sep) + os.sep
+        for watched_key in [k for k in self._watched_tree_nodes if k == key or k.startswith(prefix)]:
+            self._forget_tree_watch(watched_key)
+
+    def stop_watching(self):
+        """Dosya izleyiciyi durdurur (uygulama kapanırken)."""
+        self.watcher.stop()
+
+    def _on_watcher_events(self, events):
+        """İzleyici thread'inden gelen olayları arayüz thread'ine aktarır."""
+        try:
+            self.app.after(0, self._apply_watcher_events, events)
+        except Exception:
+            # Ana pencere kapanmışsa olaylar işlenemez
+            pass
+
+    def _apply_watcher_events(self, events):
+        """Değişiklikleri önbelleğe, dosya listesine ve ağaca uygular (arayüz thread'i)."""
+        displayed_folder = getattr(self.app, 'currently_displayed_folder_in_file_list', None)
+        displayed_key = self._folder_key(displayed_folder) if displayed_folder else None
+        list_events = []
+        relist = False
+
+        for event in events:
+            if event.folder is None: # Olay kuyruğu taştı; hiçbir şeye güvenilemez
+                self.listing_cache.clear()
+                self._sync_cache_watches()
+                relist = True
+                continue
+            self.listing_cache.invalidate(event.folder)
+            key = self._folder_key(event.folder)
+            if key in self._cache_watches and key != displayed_key:
+                # Kaydı atılan klasörün yalnızca önbellek için tutulan izlemesi bırakılır
+                del self._cache_watches[key]
+                self._update_watch(event.folder)
+
+            if event.kind == EVENT_RESCAN:
+                relist = relist or key == displayed_key
+                if not os.path.isdir(event.folder):
+                    self._forget_tree_watches_under(event.folder)
+                continue
+            if key == displayed_key:
+                list_events.append(event)
+            node_id = self._watched_tree_nodes.get(key)
+            if node_id is not None:
+                self._apply_tree_event(key, node_id, event)
+
+        if relist and displayed_folder:
+            print(f"🔧 DEBUG: İzleyici klasörün yeniden listelenmesini istedi: {displayed_folder}")
+            self.populate_file_list(displayed_folder)
+        elif list_events:
+            if self._listing_token is not None:
+                # Listeleme bitince uygulanır
+                self._pending_list_events.extend(list_events)
+            else:
+                self._apply_file_list_events(list_events)
+
+    def _apply_tree_event(self, key, node_id, event):
+        """Ağaç düğümünün alt klasörlerine tek bir değişikliği uygular."""
+        tree = self.app.dir_tree
+        if not tree.exists(node_id):
+            self._forget_tree_watch(key)
+            return
+        if event.kind == EVENT_MODIFIED:
+            return
+
+        children = {}
+        for child in tree.get_children(node_id):
+            child_values = tree.item(child, "values")
+            if child_values:
+                children[self._folder_key(child_values[0])] = child
+
+        if event.kind in (EVENT_DELETED, EVENT_RENAMED):
+            old_path = os.path.join(event.folder, event.name)
+            old_node = children.pop(self._folder_key(old_path), None)
+            if old_node is not None:
+                self._forget_tree_watches_under(old_path)
+                tree.delete(old_node)
+
+        if event.kind in (EVENT_CREATED, EVENT_RENAMED):
+            new_name = event.new_name if event.kind == EVENT_RENAMED else event.name
+            new_path = os.path.join(event.folder, new_name)
+            if new_name.startswith('.') or self._folder_key(new_path) in children or not os.path.isdir(new_path):
+                return
+            # populate_tree ile aynı düzen: ada göre sıralı
+            index = tk.END
+            for position, child in enumerate(tree.get_children(node_id)):
+                if tree.item(child, "text") != "..." and str(tree.item(child, "text")) > new_name:
+                    index = position
+                    break
+            self._insert_tree_node(node_id, new_name, new_path, index)
+
+    # --- Dosya listesi sıralama ---
+
+    @staticmethod
+    def _row_sort_key(column_id, ascending, entry, description):
+        """Satırın tipli sıralama anahtarı (tarih ve boyut sayısal karşılaştırılır).
+
+        Tarihi veya boyutu olmayan satırlar (klasörler, okunamayanlar) her iki
+        yönde de sona yerleşir; eşitlikte ada göre sıralanır.
+        """
+        name_key = entry.name.lower()
+        if column_id == "description":
+            return (0, description.lower(), name_key)
+        if column_id == "date_modified":
+            value = entry.mtime
+        elif column_id == "size":
+            value = None if entry.is_dir else entry.size
+        else: # "#0" - Dosya Adı
+            return (0, name_key, "")
+        if value is None:
+            return (1 if ascending else -1, 0, name_key)
+        return (0, value, name_key)
+
+    def sort_file_list(self, column_id, ascending):
+        """Dosya listesini tipli modelden hesaplanan anahtarlarla sıralar.
+
+        Satırlar silinip yeniden eklenmez; yeni sıra tek bir set_children
+        çağrısıyla (toplu move) uygulanır. Modelde olmayan satırlar (".."
+        gibi) en üstte kalır.
+        """
+        file_list = self.app.file_list
+        fixed_rows = []
+        keyed_rows = []
+        row_entries = {}
+        for item_id in file_list.get_children(""):
+            row = self._row_entries.get(item_id)
+            if row is None:
+                fixed_rows.append(item_id)
+            else:
+                row_entries[item_id] = row
+                keyed_rows.append((self._row_sort_key(column_id, ascending, *row), item_id))
+        self._row_entries = row_entries # Listeden silinmiş satırları modelden at
+
+        keyed_rows.sort(reverse=not ascending)
+        file_list.set_children("", *fixed_rows, *(item_id for _key, item_id in keyed_rows))
+
+    def _sorted_insert_index(self, entry, description):
+        """Yeni satırın geçerli sıralamaya göre ekleneceği konumu ikili arama ile bulur."""
+        column_id = getattr(self.app, 'file_list_sort_column', None) or "#0"
+        ascending = getattr(self.app, 'file_list_sort_order_asc', True)
+        new_key = self._row_sort_key(column_id, ascending, entry, description)
+
+        children = self.app.file_list.get_children("")
+        low, high = 0, len(children)
+        while low < high and children[low] not in self._row_entries:
+            low += 1
+        while low < high:
+            middle = (low + high) // 2
+            row = self._row_entries.get(children[middle])
+            key = self._row_sort_key(column_id, ascending, *row) if row is not None else new_key
+            if (key <= new_key) if ascending else (key >= new_key):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def select_path_in_list(self, file_path):
+        """Dosya listesinde verilen yolun satırını seçip görünür yapar.
+
+        Returns:
+            bool: Satır bulunduysa True.
+        """
+        file_list = self.app.file_list
+        target_key = self._folder_key(file_path)
+        for item_id, (entry, _description) in self._row_entries.items():
+            if self._folder_key(entry.path) == target_key and file_list.exists(item_id):
+                file_list.selection_set(item_id)
+                file_list.focus(item_id)
+                file_list.see(item_id)
+                return True
+        return False
+
+    def refresh_renamed_row(self, old_path, new_path):
+        """Uygulama içinden yeniden adlandırılan dosyanın satırını günceller (izleyici olayını beklemeden)."""
+        self._apply_file_list_events([FolderEvent(EVENT_RENAMED, os.path.dirname(old_path),
+                                                  os.path.basename(old_path), os.path.basename(new_path))])
+
+    def _apply_file_list_events(self, events):
+        """Görüntülenen klasördeki değişiklikleri yalnızca ilgili satırları güncelleyerek uygular.
+
+        Olaylar tekrar uygulanabilir: var olan satır güncellenir, olmayan
+        satırın silinmesi yok sayılır.
+        """
+        file_list = self.app.file_list
+        rows = {entry.path: item_id for item_id, (entry, _description) in self._row_entries.items()
+                if file_list.exists(item_id)}
+
+        changed_paths = []
+        for event in events:
+            if event.kind in (EVENT_DELETED, EVENT_RENAMED):
+                old_path = os.path.join(event.folder, event.name)
+                item_id = rows.pop(old_path, None)
+                if item_id is not None:
+                    file_list.delete(item_id)
+                    self._row_entries.pop(item_id, None)
+                if old_path in changed_paths:
+                    changed_paths.remove(old_path)
+            if event.kind == EVENT_RENAMED:
+                changed_paths.append(os.path.join(event.folder, event.new_name))
+            elif event.kind in (EVENT_CREATED, EVENT_MODIFIED):
+                path = os.path.join(event.folder, event.name)
+                if path not in changed_paths:
+                    changed_paths.append(path)
+
+        entries = []
+        for path in changed_paths:
+            try:
+                entry_stat = os.stat(path)
+            except OSError:
+                # Olaydan sonra silinmiş
+                item_id = rows.pop(path, None)
+                if item_id is not None:
+                    file_list.delete(item_id)
+                    self._row_entries.pop(item_id, None)
+                continue
+            is_dir = stat.S_ISDIR(entry_stat.st_mode)
+            if not is_dir and not stat.S_ISREG(entry_stat.st_mode):
+                continue
+            entries.append(ListingEntry(os.path.basename(path), path, is_dir, entry_stat.st_size, entry_stat.st_mtime))
+
+        py_paths = [entry.path for entry in entries if not entry.is_dir and entry.name.lower().endswith(".py")]
+        descriptions = self.app.db.get_descriptions_batch(py_paths) if py_paths else {}
+        for entry in entries:
+            row = self._format_row(entry, descriptions.get(entry.path))
+            description = row["values"][0]
+            item_id = rows.get(entry.path)
+            if item_id is not None:
+                file_list.item(item_id, **row)
+            else:
+                item_id = file_list.insert("", self._sorted_insert_index(entry, description), **row)
+                rows[entry.path] = item_id
+            self._row_entries[item_id] = (entry, description)
 
     def select_folder(self):
         """Kullanıcının yeni bir ana klasör seçmesini sağlar."""
@@ -441,9 +880,11 @@ class FileBrowser:
             self.app.db.set_description(file_path, new_desc.strip())
             if self.app.file_list.exists(item_id):
                 current_values = list(self.app.file_list.item(item_id, "values"))
-                if len(current_values) == 3 and current_values[2] == file_path:
+                if len(current_values) >= 3 and current_values[2] == file_path:
                     current_values[0] = new_desc.strip()
                     self.app.file_list.item(item_id, values=tuple(current_values))
+                    if item_id in self._row_entries:
+                        self._row_entries[item_id] = (self._row_entries[item_id][0], new_desc.strip())
 
     def rename_selected_file(self, old_file_path, item_id, file_type_hint):
         """Seçili dosyayı (ZIP) yeniden adlandırır."""
@@ -478,7 +919,8 @@ class FileBrowser:
         try:
             os.rename(old_file_path, new_file_path)
             self.app.db.add_history(f"Yeniden adlandırıldı: '{current_name}' -> '{new_filename}' ({folder_path})", event_type="rename")
-            self.populate_file_list(folder_path)
+            # Yeni adlı dosya listeleme bitince seçilir
+            self.populate_file_list(folder_path, on_done=lambda: self.select_path_in_list(new_file_path))
             messagebox.showinfo("Başarılı", f"Dosya '{new_filename}' olarak yeniden adlandırıldı.", parent=self.app)
         except OSError as e:
             messagebox.showerror("Yeniden Adlandırma Hatası", f"Dosya yeniden adlandırılamadı:\n{e}", parent=self.app)
@@ -494,6 +936,7 @@ class FileBrowser:
                 self.app.db.delete_description(file_path)
                 if self.app.file_list.exists(item_id):
                     self.app.file_list.delete(item_id)
+                self._row_entries.pop(item_id, None)
                 messagebox.showinfo("Başarılı", f"'{file_name}' dosyası başarıyla silindi.", parent=self.app)
             except OSError as e:
                 messagebox.showerror("Silme Hatası", f"Dosya silinemedi:\n{e}", parent=self.app)
@@ -0,0 +1,779 @@
+# -*- coding: utf-8 -*-
+"""
+File Index - Kalıcı Dosya İndeksi Modülü
+
+Bu modül, arama yapılan kök klasörlerdeki dosyaların yol, ad, boyut ve
+değiştirilme zamanı bilgilerini ayrı bir SQLite dosyasında (sidecar) saklar.
+Böylece her dosya aramasında tüm ağacı yeniden taramak yerine indeks
+üzerinde milisaniyeler içinde sorgu yapılabilir.
+
+Klasörlerin değiştirilme zamanları (mtime) da saklanır. İndeks yenilenirken
+yalnızca mtime değeri değişen klasörler yeniden listelenir; değişmeyen
+klasörler için tek bir stat çağrısı yeterlidir. İlk indeksleme paralel
+klasör tarayıcı (dir_walker) ile yapılır.
+
+Global exclusion listesindeki klasörlere (.git, venv gibi) girilmez; bu
+klasörler yalnızca yolları ile saklanır (iter_excluded_dirs). Exclusion
+listesi değişirse kök bir sonraki yenilemede baştan indekslenir.
+
+Yerinde düzenlenen dosyalar klasörün mtime değerini değiştirmez. Bu yüzden
+boyut veya mtime bilgisi kullanılacak dosyalar verify_files ile diskle
+karşılaştırılır (stat çağrıları thread havuzunda yapılır); değişen kayıtlar
+düzeltilir ve satır sayıları yeniden hesaplanmak üzere silinir.
+
+İndeks en son kullanılan MAX_INDEXED_ROOTS kök klasörü tutar; daha eski
+veya MAX_ROOT_AGE_DAYS gündür yenilenmeyen kökler her yenilemeden sonra
+silinir.
+
+Kelime araması için .py dosyalarının içerikleri de trigram imzaları olarak
+indekslenir. Her dosya için küçük harfe çevrilmiş içeriğin tüm 3 byte'lık
+parçaları, boyutu dosyanın trigram sayısına göre seçilen bir bit maskesine
+işlenir; arama kelimesinin tüm trigramlarını içermeyen dosyalar hiç
+açılmadan elenir. Çok fazla farklı trigram içeren dosyalar için imza
+saklanmaz (her aramada aday sayılır). İmzalar dosyanın boyutu veya mtime
+değeri değiştiğinde yeniden hesaplanır.
+
+Kullanım:
+    from file_index import FileIndex
+
+    index = FileIndex("C:\\PyManager\\program_manager_index.db", exclusion_source=lambda: "__pycache__, .git")
+
+    # Kök klasörü indeksle (ilk seferde tam tarama, sonrasında artımlı yenileme)
+    index.refresh("C:\\project")
+
+    # Sorgu sonuçlarının boyut/mtime bilgisini diskle doğrula (yerinde düzenlenen dosyalar)
+    index.verify_files("C:\\project", [path for path, _size, _mtime in index.search("C:\\project", "*.py")])
+
+    # Desen ve boyut filtresiyle sorgula (boyut filtresi indeksli aralık sorgusudur)
+    for path, size, mtime in index.search("C:\\project", "*.py", 10, "büyük"):
+        print(path, size)
+
+    # Kelimeyi içerebilecek dosyaları trigram imzalarıyla daralt
+    candidates = index.content_candidates("C:\\project", py_files, "import")
+"""
+
+import os
+import fnmatch
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from dir_walker import parallel_walk, DEFAULT_WALKER_WORKERS # Paralel klasör tarama
+from exclusion_utils import ExclusionManager # Merkezi exclusion yönetimi
+
+
+# İndeks şeması değiştiğinde artırılır; eski şemalı indeksler önbellek
+# olduğundan silinip yeniden oluşturulur.
+INDEX_SCHEMA_VERSION = 5
+
+# Trigram başına imza biti. İmzanın yaklaşık sekizde biri dolar; 3 trigramlık
+# bir kelime için yanlış pozitif oranı yaklaşık binde ikidir, daha uzun kelimelerde çok daha düşüktür.
+CONTENT_SIGNATURE_BITS_PER_TRIGRAM = 8
+MIN_CONTENT_SIGNATURE_BITS = 1024
+# Bundan büyük imza gerektiren dosyalar için imza saklanmaz (dosya her zaman aday)
+MAX_CONTENT_SIGNATURE_BITS = 1 << 20   # 128 KB
+CONTENT_QUERY_CHUNK_SIZE = 500         # İmzaları veya kayıtları okunan dosya yolları bu boyutta gruplarla sorgulanır
+
+# İndekste tutulacak en fazla kök klasör sayısı ve kullanılmayan köklerin
+# silinme süresi. Klasör özellikleri ve bağımlılık analizi her yeni klasörü
+# ayrı bir kök olarak indekslediğinden indeks dosyası aksi halde sınırsız büyür.
+MAX_INDEXED_ROOTS = 16
+MAX_ROOT_AGE_DAYS = 30
+
+
+def _trigram_bit(trigram, bits):
+    """3 byte'lık trigramı imza içindeki bit konumuna eşler (kalıcı, deterministik)."""
+    return ((int.from_bytes(trigram, "little") * 2654435761) >> 7) % bits
+
+
+def _trigrams(data):
+    """Byte dizisindeki farklı trigramları döndürür."""
+    return {data[i:i + 3] for i in range(len(data) - 2)}
+
+
+def content_signature(text):
+    """Dosya içeriğinin (küçük harfe çevrilmiş) trigram imzasını hesaplar.
+
+    İmza boyutu trigram sayısına göre 2'nin kuvveti olarak seçilir.
+
+    Returns:
+        bytes: İmza; dosya MAX_CONTENT_SIGNATURE_BITS sınırını aşıyorsa boş (b"").
+    """
+    trigrams = _trigrams(text.lower().encode("utf-8"))
+    bits = MIN_CONTENT_SIGNATURE_BITS
+    while bits < len(trigrams) * CONTENT_SIGNATURE_BITS_PER_TRIGRAM:
+        bits *= 2
+    if bits > MAX_CONTENT_SIGNATURE_BITS:
+        return b""
+    signature = bytearray(bits // 8)
+    for trigram in trigrams:
+        bit = _trigram_bit(trigram, bits)
+        signature[bit >> 3] |= 1 << (bit & 7)
+    return bytes(signature)
+
+
+def query_trigrams(search_word):
+    """Arama kelimesinin trigramlarını döndürür; 3 byte'tan kısa kelimeler için boş küme."""
+    return _trigrams(search_word.lower().encode("utf-8"))
+
+
+def signature_matches(signature, trigrams):
+    """İmza kelimenin tüm trigramlarını içerebiliyorsa True döndürür (boş imza her zaman eşleşir)."""
+    if not signature:
+        return True
+    bits = len(signature) * 8
+    for trigram in trigrams:
+        bit = _trigram_bit(trigram, bits)
+        if not signature[bit >> 3] & (1 << (bit & 7)):
+            return False
+    return True
+
+
+class FileIndex:
+    """Kök klasör bazında kalıcı dosya indeksini yöneten sınıf.
+
+    Her işlem kendi SQLite bağlantısını açar; bu sayede arka plan
+    thread'lerinde yapılan yenilemeler ile arayüzden yapılan sorgular
+    birbirini beklemez (WAL modu).
+
+    Attributes:
+        db_path: İndeks veritabanı dosyasının yolu.
+        exclusion_source: Global exclusion listesini (virgülle ayrılmış metin)
+                          döndüren fonksiyon; None ise hiçbir klasör budanmaz.
+    """
+
+    def __init__(self, db_path, exclusion_source=None):
+        """FileIndex'i başlatır.
+
+        Args:
+            db_path: İndeks veritabanı dosyasının yolu.
+            exclusion_source: Global exclusion listesini döndüren fonksiyon (opsiyonel).
+        """
+        self.db_path = db_path
+        self.exclusion_source = exclusion_source
+        self._locks_guard = threading.Lock()
+        self._root_locks = {}
+        self._create_tables()
+
+    def _connect(self):
+        """Yeni bir SQLite bağlantısı açar."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _create_tables(self):
+        """İndeks tablolarını oluşturur, şema eskiyse indeksi sıfırlar."""
+        try:
+            conn = self._connect()
+        except sqlite3.Error as e:
+            print(f"❗ Dosya indeksi açılamadı: {e}")
+            return
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != INDEX_SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS file_index")
+                conn.execute("DROP TABLE IF EXISTS dir_index")
+                conn.execute("DROP TABLE IF EXISTS indexed_roots")
+                conn.execute("DROP TABLE IF EXISTS content_index")
+                conn.execute("DROP TABLE IF EXISTS excluded_dirs")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS indexed_roots (
+                    root TEXT PRIMARY KEY,
+                    last_refresh TEXT NOT NULL,
+                    file_count INTEGER DEFAULT 0 NOT NULL,
+                    exclusions TEXT DEFAULT '' NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS dir_index (
+                    root TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    mtime REAL NOT NULL,
+                    PRIMARY KEY (root, path)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS excluded_dirs (
+                    root TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    dir_path TEXT NOT NULL,
+                    PRIMARY KEY (root, path)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_index (
+                    root TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    dir_path TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    name_lower TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    line_count INTEGER,
+                    PRIMARY KEY (root, path)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS content_index (
+                    root TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    dir_path TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    signature BLOB NOT NULL,
+                    PRIMARY KEY (root, path)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_file_index_size ON file_index (root, size)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_file_index_dir ON file_index (root, dir_path)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_excluded_dirs_dir ON excluded_dirs (root, dir_path)")
+            conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"❗ Dosya indeksi tabloları oluşturulamadı: {e}")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _root_key(root):
+        """Kök klasör için karşılaştırılabilir anahtar üretir."""
+        return os.path.normcase(os.path.abspath(root))
+
+    def _get_root_lock(self, root_key):
+        """Aynı kökün eş zamanlı yenilenmesini engelleyen kilidi döndürür."""
+        with self._locks_guard:
+            lock = self._root_locks.get(root_key)
+            if lock is None:
+                lock = self._root_locks[root_key] = threading.Lock()
+            return lock
+
+    def has_root(self, root):
+        """Kök klasörün daha önce indekslenip indekslenmediğini döndürür."""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT 1 FROM indexed_roots WHERE root = ?",
+                               (self._root_key(root),)).fetchone()
+            return row is not None
+        except sqlite3.Error as e:
+            print(f"❗ Dosya indeksi sorgulanamadı: {e}")
+            return False
+        finally:
+            conn.close()
+
+    def _exclusion_manager(self):
+        """Klasör budamasında kullanılacak ExclusionManager'ı ve karşılaştırma anahtarını döndürür."""
+        exclusion_string = ""
+        if self.exclusion_source is not None:
+            try:
+                exclusion_string = self.exclusion_source() or ""
+            except Exception as e:
+                print(f"❗ Exclusion listesi okunamadı: {e}")
+        exclusion_manager = ExclusionManager(exclusion_string)
+        # Sadece klasör pattern'leri indeksin içeriğini etkiler
+        return exclusion_manager, "\n".join(sorted(p.lower() for p in exclusion_manager.dir_patterns))
+
+    def refresh(self, root, wait=True, on_files=None, cancel_token=None):
+        """Kök klasörün indeksini diskle eşitler.
+
+        Kök daha önce indekslenmişse yalnızca mtime değeri değişen klasörler
+        yeniden listelenir; aksi halde (veya exclusion listesi değiştiyse)
+        tüm ağaç paralel olarak taranır. Hariç tutulan klasörlere girilmez.
+        Yerinde düzenlenen dosyalar için verify_files kullanılır.
+
+        Args:
+            root: İndekslenecek kök klasör.
+            wait: False ise ve aynı kök zaten yenileniyorsa beklemeden döner.
+            on_files: İlk indeksleme sırasında her klasör yazıldığında
+                      (dosya_yolu, ad, boyut, mtime) listesiyle çağrılır (opsiyonel).
+                      Artımlı yenilemede çağrılmaz.
+            cancel_token: Klasörler arasında kontrol edilen CancellationToken (opsiyonel).
+                          İptal edilirse değişiklikler geri alınır ve OperationCancelled
+                          fırlatılır.
+
+        Returns:
+            bool: Yenileme yapıldıysa True.
+        """
+        root_key = self._root_key(root)
+        lock = self._get_root_lock(root_key)
+        if not lock.acquire(blocking=wait):
+            return False
+        try:
+            exclusion_manager, exclusion_key = self._exclusion_manager()
+            conn = self._connect()
+            try:
+                stored_dirs = dict(conn.execute("SELECT path, mtime FROM dir_index WHERE root = ?", (root_key,)).fetchall())
+                stored_root = conn.execute("SELECT exclusions FROM indexed_roots WHERE root = ?", (root_key,)).fetchone()
+                with conn:
+                    if stored_root is not None and stored_root[0] != exclusion_key:
+                        # Exclusion listesi değişti: budanan klasörler farklı, kök baştan indekslenir
+                        print(f"🔧 DEBUG: Exclusion listesi değişti, dosya indeksi yeniden oluşturuluyor: {root}")
+                        self._delete_root(conn, root_key)
+                        stored_dirs = {}
+                    stats = self._sync_tree(conn, root_key, os.path.abspath(root), stored_dirs, exclusion_manager,
+                                            on_files, cancel_token)
+                    file_count = conn.execute("SELECT COUNT(*) FROM file_index WHERE root = ?", (root_key,)).fetchone()[0]
+                    conn.execute("INSERT OR REPLACE INTO indexed_roots (root, last_refresh, file_count, exclusions) "
+                                 "VALUES (?, ?, ?, ?)",
+                                 (root_key, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), file_count, exclusion_key))
+                self._evict_roots(conn, root_key)
+            finally:
+                conn.close()
+            print(f"🔧 DEBUG: Dosya indeksi yenilendi: {root} ({stats['checked']} klasör kontrol edildi, "
+                  f"{stats['rescanned']} klasör yeniden tarandı, {stats['removed']} klasör silindi, {file_count} dosya)")
+            return True
+        finally:
+            lock.release()
+
+    def _evict_roots(self, conn, keep_root_key):
+        """En uzun süredir kullanılmayan kökleri indeksten siler.
+
+        MAX_ROOT_AGE_DAYS gündür yenilenmeyen kökler ve en yeni
+        MAX_INDEXED_ROOTS kökün dışında kalanlar silinir. O anda yenilenen
+        bir kök atlanır.
+        """
+        oldest_allowed = (datetime.now() - timedelta(days=MAX_ROOT_AGE_DAYS)).strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            roots = conn.execute("SELECT root, last_refresh FROM indexed_roots ORDER BY last_refresh DESC").fetchall()
+            doomed = [root for position, (root, last_refresh) in enumerate(roots)
+                      if root != keep_root_key and (position >= MAX_INDEXED_ROOTS or last_refresh < oldest_allowed)]
+            for root_key in doomed:
+                lock = self._get_root_lock(root_key)
+                if not lock.acquire(blocking=False):
+                    continue
+                try:
+                    with conn:
+                        self._delete_root(conn, root_key)
+                        conn.execute("DELETE FROM indexed_roots WHERE root = ?", (root_key,))
+                finally:
+                    lock.release()
+                print(f"🔧 DEBUG: Dosya indeksinden eski kök silindi: {root_key}")
+        except sqlite3.Error as e:
+            print(f"❗ Eski kökler dosya indeksinden silinemedi: {e}")
+
+    @staticmethod
+    def _delete_root(conn, root_key):
+        """Kökün dosya, klasör ve içerik kayıtlarını siler (indexed_roots satırı hariç)."""
+        for table in ("file_index", "content_index", "dir_index", "excluded_dirs"):
+            conn.execute(f"DELETE FROM {table} WHERE root = ?", (root_key,))
+
+    def _sync_tree(self, conn, root_key, abs_root, stored_dirs, exclusion_manager, on_files=None, cancel_token=None):
+        """Klasör ağacını gezer; mtime değeri değişen klasörleri yeniden tarar."""
+        if not stored_dirs:
+            return self._build_tree(conn, root_key, abs_root, exclusion_manager, on_files, cancel_token)
+
+        # Saklanan klasörlerden üst-alt ilişkisini çıkar
+        stored_children = {}
+        for dir_path in stored_dirs:
+            if dir_path != abs_root:
+                stored_children.setdefault(os.path.dirname(dir_path), []).append(dir_path)
+
+        stats = {"checked": 0, "rescanned": 0, "removed": 0}
+        stack = [abs_root]
+        while stack:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            dir_path = stack.pop()
+            stats["checked"] += 1
+            try:
+                dir_mtime = os.stat(dir_path).st_mtime
+            except OSError:
+                stats["removed"] += self._remove_subtree(conn, root_key, dir_path, stored_dirs)
+                continue
+
+            if stored_dirs.get(dir_path) == dir_mtime:
+                # Klasör içeriği değişmemiş, sadece bilinen alt klasörlere in
+                stack.extend(stored_children.get(dir_path, ()))
+                continue
+
+            stats["rescanned"] += 1
+            sub_dirs = self._rescan_dir(conn, root_key, dir_path, dir_mtime, exclusion_manager)
+            if sub_dirs is None:
+                stats["removed"] += self._remove_subtree(conn, root_key, dir_path, stored_dirs)
+                continue
+            current = set(sub_dirs)
+            for old_child in stored_children.get(dir_path, ()):
+                if old_child not in current:
+                    stats["removed"] += self._remove_subtree(conn, root_key, old_child, stored_dirs)
+            stack.extend(sub_dirs)
+        return stats
+
+    def _rescan_dir(self, conn, root_key, dir_path, dir_mtime, exclusion_manager):
+        """Tek bir klasörü listeler ve değişen dosya kayıtlarını günceller.
+
+        Returns:
+            list veya None: Girilecek alt klasör yolları; klasör okunamazsa None.
+        """
+        sub_dirs = []
+        excluded_dirs = []
+        rows = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if exclusion_manager.should_exclude_dir(entry.name):
+                                excluded_dirs.append(entry.path)
+                            else:
+                                sub_dirs.append(entry.path)
+                        elif entry.is_file():
+                            st = entry.stat()
+                            rows.append((entry.path, entry.name, st.st_size, st.st_mtime, st.st_mtime_ns))
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        self._store_dir(conn, root_key, dir_path, dir_mtime, rows, excluded_dirs)
+        return sub_dirs
+
+    def _build_tree(self, conn, root_key, abs_root, exclusion_manager, on_files=None, cancel_token=None):
+        """Hiç indekslenmemiş bir kökü paralel klasör tarayıcı ile baştan indeksler."""
+        stats = {"checked": 0, "rescanned": 0, "removed": 0}
+        try:
+            dir_mtimes = {abs_root: os.stat(abs_root).st_mtime}
+        except OSError:
+            return stats
+
+        # Hariç tutulan klasörler üst klasörlerine göre toplanır (tarayıcı thread'lerinde
+        # çağrılır; her klasörü tek bir thread listeler ve sonucu listeleme bitince üretilir)
+        pruned = {}
+
+        def prune_dir(entry):
+            if exclusion_manager.should_exclude_dir(entry.name):
+                pruned.setdefault(os.path.dirname(entry.path), []).append(entry.path)
+                return True
+            return False
+
+        for dir_path, dir_entries, file_entries in parallel_walk(abs_root, prune_dir=prune_dir):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            # Alt klasörlerin mtime değerleri üst klasör listelenirken alınır (üst klasör her zaman önce gelir)
+            for entry in dir_entries:
+                try:
+                    if not entry.is_symlink():
+                        dir_mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime
+                except OSError:
+                    continue
+            rows = []
+            for entry in file_entries:
+                try:
+                    if entry.is_file():
+                        st = entry.stat()
+                        rows.append((entry.path, entry.name, st.st_size, st.st_mtime, st.st_mtime_ns))
+                except OSError:
+                    continue
+            stats["checked"] += 1
+            stats["rescanned"] += 1
+            self._store_dir(conn, root_key, dir_path, dir_mtimes.pop(dir_path, 0), rows, pruned.pop(dir_path, ()))
+            if on_files is not None:
+                on_files([(path, name, size, mtime) for path, name, size, mtime, _mtime_ns in rows])
+        return stats
+
+    def _store_dir(self, conn, root_key, dir_path, dir_mtime, rows, excluded_dirs=()):
+        """Bir klasörün dosya kayıtlarını indeksteki kayıtlarla karşılaştırıp günceller.
+
+        Boyutu ve mtime_ns değeri değişmeyen dosyaların kayıtlarına (ve
+        önbelleğe alınmış satır sayılarına) dokunulmaz.
+
+        Args:
+            rows: (dosya_yolu, ad, boyut, mtime, mtime_ns) tuple'ları.
+            excluded_dirs: Klasörün girilmeyen (hariç tutulan) alt klasörlerinin yolları.
+        """
+        previous = {path: (size, mtime_ns) for path, size, mtime_ns in conn.execute(
+            "SELECT path, size, mtime_ns FROM file_index WHERE root = ? AND dir_path = ?", (root_key, dir_path))}
+        current_paths = {row[0] for row in rows}
+        removed = [(root_key, path) for path in previous if path not in current_paths]
+        changed = [(root_key, path, dir_path, name, name.lower(), size, mtime, mtime_ns)
+                   for path, name, size, mtime, mtime_ns in rows if previous.get(path) != (size, mtime_ns)]
+        if removed:
+            conn.executemany("DELETE FROM file_index WHERE root = ? AND path = ?", removed)
+            # Klasörden silinen dosyaların içerik imzalarını da kaldır
+            conn.executemany("DELETE FROM content_index WHERE root = ? AND path = ?", removed)
+        if changed:
+            # Değişen dosyaların satır sayısı yeniden hesaplanır (line_count NULL)
+            conn.executemany("INSERT OR REPLACE INTO file_index "
+                             "(root, path, dir_path, name, name_lower, size, mtime, mtime_ns, line_count) "
+                             "VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL)", changed)
+        conn.execute("DELETE FROM excluded_dirs WHERE root = ? AND dir_path = ?", (root_key, dir_path))
+        if excluded_dirs:
+            conn.executemany("INSERT OR REPLACE INTO excluded_dirs (root, path, dir_path) VALUES (?, ?, ?)",
+                             [(root_key, path, dir_path) for path in excluded_dirs])
+        conn.execute("INSERT OR REPLACE INTO dir_index (root, path, mtime) VALUES (?, ?, ?)", (root_key, dir_path, dir_mtime))
+
+    def _remove_subtree(self, conn, root_key, dir_path, stored_dirs):
+        """Silinen bir klasörü ve altındaki tüm kayıtları indeksten çıkarır."""
+        prefix = dir_path.rstrip(os.sep) + os.sep
+        doomed = [p for p in stored_dirs if p == dir_path or p.startswith(prefix)]
+        if not doomed:
+            return 0
+        params = [(root_key, p) for p in doomed]
+        conn.executemany("DELETE FROM file_index WHERE root = ? AND dir_path = ?", params)
+        conn.executemany("DELETE FROM content_index WHERE root = ? AND dir_path = ?", params)
+        conn.executemany("DELETE FROM excluded_dirs WHERE root = ? AND dir_path = ?", params)
+        conn.executemany("DELETE FROM dir_index WHERE root = ? AND path = ?", params)
+        for p in doomed:
+            stored_dirs.pop(p, None)
+        return len(doomed)
+
+    def iter_dirs(self, root):
+        """İndeksteki klasör yollarını sıralı olarak döndürür (kök dahil, hariç tutulanlar hariç)."""
+        conn = self._connect()
+        try:
+            return [row[0] for row in conn.execute(
+                "SELECT path FROM dir_index WHERE root = ? ORDER BY path", (self._root_key(root),))]
+        except sqlite3.Error as e:
+            print(f"❗ Dosya indeksi sorgulanamadı: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def iter_excluded_dirs(self, root):
+        """İndekslenmeyen (hariç tutulan) en üst seviye klasörlerin yollarını sıralı olarak döndürür."""
+        conn = self._connect()
+        try:
+            return [row[0] for row in conn.execute(
+                "SELECT path FROM excluded_dirs WHERE root = ? ORDER BY path", (self._root_key(root),))]
+        except sqlite3.Error as e:
+            print(f"❗ Dosya indeksi sorgulanamadı: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def iter_files(self, root):
+        """İndeksteki tüm dosyaları döndürür.
+
+        Returns:
+            list: (dosya_yolu, klasör_yolu, ad, boyut, mtime, satır_sayısı) tuple'ları.
+                  Satır sayısı henüz hesaplanmadıysa None'dır.
+        """
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT path, dir_path, name, size, mtime, line_count FROM file_index WHERE root = ?",
+                                (self._root_key(root),)).fetchall()
+        except sqlite3.Error as e:
+            print(f"❗ Dosya indeksi sorgulanamadı: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def set_line_counts(self, root, line_counts):
+        """Hesaplanan satır sayılarını indekse yazar.
+
+        Args:
+            root: Kök klasör.
+            line_counts: (dosya_yolu, satır_sayısı) tuple'larının listesi.
+        """
+        if not line_counts:
+            return
+        root_key = self._root_key(root)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany("UPDATE file_index SET line_count = ? WHERE root = ? AND path = ?",
+                                 [(count, root_key, path) for path, count in line_counts])
+        except sqlite3.Error as e:
+            print(f"❗ Satır sayıları indekse yazılamadı: {e}")
+        finally:
+            conn.close()
+
+    def verify_files(self, root, paths, cancel_token=None):
+        """Verilen dosyaların indeks kayıtlarını diskle karşılaştırır ve düzeltir.
+
+        Klasör bazlı yenileme yerinde düzenlenen dosyaları görmediğinden,
+        boyut veya mtime bilgisi kullanılacak dosyalar (sorgu sonuçları) bu
+        metotla doğrulanır. Maliyet ağacın boyutuyla değil, verilen dosya
+        sayısıyla orantılıdır.
+
+        Args:
+            root: Kök klasör.
+            paths: Doğrulanacak dosya yolları (indeksteki yollar).
+            cancel_token: Gruplar arasında kontrol edilen CancellationToken (opsiyonel).
+                          İptal edilirse o ana kadar bulunan değişiklikler yine yazılır.
+
+        Returns:
+            dict: Değişen dosyalar için {dosya_yolu: (boyut, mtime)};
+                  diskten silinen dosyalar için değer None'dır.
+        """
+        root_key = self._root_key(root)
+        paths = list(paths)
+        changes = {}
+        updated_rows = []
+        removed_rows = []
+        conn = self._connect()
+        try:
+            with ThreadPoolExecutor(max_workers=DEFAULT_WALKER_WORKERS, thread_name_prefix="index") as executor:
+                for start in range(0, len(paths), CONTENT_QUERY_CHUNK_SIZE):
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
+                    chunk = paths[start:start + CONTENT_QUERY_CHUNK_SIZE]
+                    placeholders = ','.join(['?' for _ in chunk])
+                    stored = {path: (size, mtime_ns) for path, size, mtime_ns in conn.execute(
+                        f"SELECT path, size, mtime_ns FROM file_index WHERE root = ? AND path IN ({placeholders})",
+                        [root_key] + chunk)}
+                    # os.stat GIL'i bıraktığından stat çağrıları thread havuzunda paralel yapılır
+                    for path, st in zip(chunk, executor.map(self._stat_or_none, chunk)):
+                        if path not in stored:
+                            continue
+                        if st is None:
+                            changes[path] = None
+                            removed_rows.append((root_key, path))
+                        elif stored[path] != (st.st_size, st.st_mtime_ns):
+                            changes[path] = (st.st_size, st.st_mtime)
+                            updated_rows.append((st.st_size, st.st_mtime, st.st_mtime_ns, root_key, path))
+        except sqlite3.Error as e:
+            print(f"❗ Dosya indeksi doğrulanamadı: {e}")
+        finally:
+            # İptal edilse bile bulunan değişiklikleri yaz
+            try:
+                if removed_rows or updated_rows:
+                    with conn:
+                        conn.executemany("DELETE FROM file_index WHERE root = ? AND path = ?", removed_rows)
+                        conn.executemany("DELETE FROM content_index WHERE root = ? AND path = ?", removed_rows)
+                        # Değişen dosyaların satır sayısı yeniden hesaplanır (line_count NULL)
+                        conn.executemany("UPDATE file_index SET size = ?, mtime = ?, mtime_ns = ?, line_count = NULL "
+                                         "WHERE root = ? AND path = ?", updated_rows)
+            except sqlite3.Error as e:
+                print(f"❗ Dosya indeksi güncellenemedi: {e}")
+            conn.close()
+
+        if changes:
+            print(f"🔧 DEBUG: Dosya indeksi doğrulandı: {len(paths)} dosyadan {len(updated_rows)} tanesi değişmiş, "
+                  f"{len(removed_rows)} tanesi silinmiş")
+        return changes
+
+    @staticmethod
+    def _stat_or_none(path):
+        """Dosyanın stat bilgisini döndürür; dosya yoksa veya okunamıyorsa None."""
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _to_glob(pattern):
+        """fnmatch desenini SQLite GLOB desenine çevirir (küçük harfli)."""
+        return pattern.lower().replace("[!", "[^")
+
+    @staticmethod
+    def _size_range_clause(file_size, size_operator):
+        """KB cinsinden boyut filtresini byte aralığı SQL koşuluna çevirir."""
+        if file_size is None:
+            return "", ()
+        if size_operator == "büyük":
+            return " AND size > ?", (file_size * 1024,)
+        if size_operator == "küçük":
+            return " AND size < ?", (file_size * 1024,)
+        # "eşit": 0.1 KB tolerans
+        return " AND size BETWEEN ? AND ?", ((file_size - 0.1) * 1024, (file_size + 0.1) * 1024)
+
+    @staticmethod
+    def matches(name, size, pattern, file_size=None, size_operator=None):
+        """Tek bir dosyanın search() ile aynı desen ve boyut filtresine uyup uymadığını döndürür.
+
+        İndeks henüz oluşturulurken bulunan dosyaları anında süzmek için kullanılır.
+        """
+        if not fnmatch.fnmatchcase(name.lower(), pattern.lower()):
+            return False
+        if file_size is None:
+            return True
+        if size_operator == "büyük":
+            return size > file_size * 1024
+        if size_operator == "küçük":
+            return size < file_size * 1024
+        return (file_size - 0.1) * 1024 <= size <= (file_size + 0.1) * 1024
+
+    def search(self, root, pattern, file_size=None, size_operator=None):
+        """İndekste dosya adı desenine ve boyut filtresine uyan dosyaları döndürür.
+
+        Args:
+            root: Aranacak kök klasör.
+            pattern: fnmatch tarzı dosya adı deseni (büyük/küçük harf duyarsız).
+            file_size: KB cinsinden boyut (None ise boyut filtresi uygulanmaz).
+            size_operator: "büyük", "eşit" veya "küçük".
+
+        Returns:
+            list: (dosya_yolu, boyut_byte, mtime) tuple'larının listesi.
+        """
+        size_clause, size_params = self._size_range_clause(file_size, size_operator)
+        query = ("SELECT path, size, mtime FROM file_index WHERE root = ? AND name_lower GLOB ?"
+                 + size_clause + " ORDER BY path")
+        conn = self._connect()
+        try:
+            return conn.execute(query, (self._root_key(root), self._to_glob(pattern)) + size_params).fetchall()
+        except sqlite3.Error as e:
+            print(f"❗ Dosya indeksi sorgulanamadı: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def content_candidates(self, root, files, search_word, cancel_token=None):
+        """Arama kelimesini içerebilecek dosyaları trigram imzalarıyla belirler.
+
+        Yalnızca verilen dosyaların imzaları okunur. İmzası olmayan veya
+        boyutu/mtime değeri değişmiş dosyalar okunup imzaları yeniden
+        hesaplanır. Dönen dosyalar kelimeyi içermeyebilir (yanlış pozitif),
+        fakat kelimeyi içeren hiçbir dosya elenmez; bu yüzden satırlar çağıran
+        tarafından yine doğrulanmalıdır.
+
+        Args:
+            root: Kök klasör.
+            files: (dosya_yolu, boyut_byte, mtime) tuple'ları (diskteki güncel değerler).
+            search_word: Aranan kelime.
+            cancel_token: Dosyalar arasında kontrol edilen CancellationToken (opsiyonel).
+                          İptalde o ana kadar hesaplanan imzalar yine kaydedilir.
+
+        Returns:
+            list: Aday dosya yolları (files sırasıyla).
+        """
+        root_key = self._root_key(root)
+        conn = self._connect()
+        stored = {}
+        try:
+            paths = [path for path, _size, _mtime in files]
+            for start in range(0, len(paths), CONTENT_QUERY_CHUNK_SIZE):
+                chunk = paths[start:start + CONTENT_QUERY_CHUNK_SIZE]
+                placeholders = ','.join(['?' for _ in chunk])
+                for path, size, mtime, signature in conn.execute(
+                        "SELECT path, size, mtime, signature FROM content_index "
+                        f"WHERE root = ? AND path IN ({placeholders})", [root_key] + chunk):
+                    stored[path] = (size, mtime, signature)
+        except sqlite3.Error as e:
+            print(f"❗ İçerik indeksi sorgulanamadı: {e}")
+
+        trigrams = query_trigrams(search_word)
+        candidates = []
+        updated_rows = []
+        try:
+            for path, size, mtime in files:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                old = stored.get(path)
+                if old and old[0] == size and old[1] == mtime:
+                    signature = old[2]
+                else:
+                    try:
+                        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                            signature = content_signature(f.read())
+                    except OSError:
+                        # Okunamayan dosya: aday kabul et, doğrulama adımı atlayacaktır
+                        candidates.append(path)
+                        continue
+                    updated_rows.append((root_key, path, os.path.dirname(path), size, mtime, signature))
+                if signature_matches(signature, trigrams):
+                    candidates.append(path)
+        finally:
+            # İptal edilse bile hesaplanan imzaları sakla
+            if updated_rows:
+                try:
+                    with conn:
+                        conn.executemany("INSERT OR REPLACE INTO content_index (root, path, dir_path, size, mtime, signature) "
+                                         "VALUES (?, ?, ?, ?, ?, ?)", updated_rows)
+                except sqlite3.Error as e:
+                    print(f"❗ İçerik indeksi güncellenemedi: {e}")
+            conn.close()
+
+        print(f"🔧 DEBUG: İçerik indeksi: {len(files)} dosyadan {len(candidates)} aday, "
+              f"{len(updated_rows)} imza yeniden hesaplandı")
+        return candidates
@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+"""
+FS Watcher - Dosya Sistemi İzleyici Modülü
+
+Görüntülenen klasör ve dir_tree'de açılmış klasörler izlenir; dosya
+eklendiğinde, silindiğinde, değiştirildiğinde veya yeniden adlandırıldığında
+olaylar toplu halde bir callback'e bildirilir. Böylece arayüz tüm klasörü
+yeniden listelemek yerine yalnızca değişen satırları günceller.
+
+- Linux'ta inotify (ctypes ile libc üzerinden, ek bağımlılık yok) kullanılır.
+- Diğer sistemlerde veya inotify kullanılamazsa klasörler belirli
+  aralıklarla taranıp önceki durumla karşılaştırılır (polling).
+
+Callback izleyicinin kendi thread'inde çağrılır; arayüz güncellemeleri
+after() ile ana thread'e aktarılmalıdır.
+
+Kullanım:
+    from fs_watcher import create_watcher, EVENT_CREATED
+
+    def on_events(events):
+        for event in events:
+            print(event.kind, event.folder, event.name, event.new_name)
+
+    watcher = create_watcher(on_events)
+    watcher.watch("/home/user/project", contents=True)
+    ...
+    watcher.stop()
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import threading
+import ctypes
+import ctypes.util
+
+
+EVENT_CREATED = "created"     # Yeni dosya/klasör
+EVENT_DELETED = "deleted"     # Silinen (veya izlenen klasörün dışına taşınan) dosya/klasör
+EVENT_MODIFIED = "modified"   # İçeriği veya tarihi değişen dosya
+EVENT_RENAMED = "renamed"     # Aynı klasör içinde yeniden adlandırma (name -> new_name)
+EVENT_RESCAN = "rescan"       # Klasörün (folder None ise tüm klasörlerin) yeniden okunması gerekir
+
+POLL_INTERVAL_SECONDS = 1.0   # Polling izleyicisinin tarama aralığı
+EVENT_BATCH_DELAY = 0.1       # Art arda gelen olayları tek bildirimde toplamak için bekleme süresi
+
+
+class FolderEvent:
+    """İzlenen bir klasördeki tek bir değişiklik.
+
+    Attributes:
+        kind: EVENT_CREATED, EVENT_DELETED, EVENT_MODIFIED, EVENT_RENAMED veya EVENT_RESCAN.
+        folder: Değişikliğin olduğu izlenen klasör (taşma durumunda None).
+        name: Değişen girdinin adı (EVENT_RESCAN için None).
+        new_name: EVENT_RENAMED için yeni ad.
+    """
+
+    __slots__ = ("kind", "folder", "name", "new_name")
+
+    def __init__(self, kind, folder, name=None, new_name=None):
+        self.kind = kind
+        self.folder = folder
+        self.name = name
+        self.new_name = new_name
+
+    def __repr__(self):
+        return f"FolderEvent({self.kind!r}, {self.folder!r}, {self.name!r}, {self.new_name!r})"
+
+
+def coalesce_events(events):
+    """Aynı girdi için tekrarlanan EVENT_MODIFIED olaylarını tek olaya indirir."""
+    seen_modified = set()
+    result = []
+    for event in events:
+        if event.kind == EVENT_MODIFIED:
+            key = (event.folder, event.name)
+            if key in seen_modified:
+                continue
+            seen_modified.add(key)
+        result.append(event)
+    return result
+
+
+class _BaseWatcher:
+    """İzleyicilerin ortak kısmı: izlenen klasörler ve olay bildirimi."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _key(folder_path):
+        return os.path.normcase(os.path.abspath(folder_path))
+
+    def _ensure_thread(self):
+        if self._thread is None and not self._stop_event.is_set():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _deliver(self, events):
+        events = coalesce_events(events)
+        if not events:
+            return
+        try:
+            self.callback(events)
+        except Exception as e:
+            print(f"❗ Dosya izleyici olayları işlenirken hata: {e}")
+
+    def _run(self):
+        raise NotImplementedError
+
+
+class InotifyWatcher(_BaseWatcher):
+    """Linux inotify tabanlı izleyici.
+
+    Raises:
+        OSError: inotify kullanılamıyorsa (libc'de yoksa veya başlatılamazsa).
+    """
+
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = 0o2000000
+
+    # Yazma sırasındaki her IN_MODIFY yerine dosya kapatıldığında tek olay alınır
+    WATCH_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+                  IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+    EVENT_HEADER = struct.Struct("iIII")   # wd, mask, cookie, len
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, callback):
+        super().__init__(callback)
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify desteklenmiyor")
+        self._libc = libc
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            error_number = ctypes.get_errno()
+            raise OSError(error_number, os.strerror(error_number))
+        self._wake_read, self._wake_write = os.pipe()
+        self._wd_to_path = {}
+        self._key_to_wd = {}
+
+    def watch(self, folder_path, contents=False):
+        """Klasörü izlemeye başlar (inotify dosya değişikliklerini her zaman bildirir).
+
+        Returns:
+            bool: İzleme başlatıldıysa True.
+        """
+        if self._stop_event.is_set():
+            return False
+        key = self._key(folder_path)
+        with self._lock:
+            if key in self._key_to_wd:
+                return True
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(folder_path), self.WATCH_MASK)
+        if wd < 0:
+            error_number = ctypes.get_errno()
+            print(f"❗ Klasör izlenemiyor ({folder_path}): {os.strerror(error_number)}")
+            return False
+        with self._lock:
+            self._wd_to_path[wd] = folder_path
+            self._key_to_wd[key] = wd
+        self._ensure_thread()
+        return True
+
+    def unwatch(self, folder_path):
+        """Klasörün izlenmesini bırakır."""
+        with self._lock:
+            wd = self._key_to_wd.pop(self._key(folder_path), None)
+            if wd is None:
+                return
+            self._wd_to_path.pop(wd, None)
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+    def stop(self):
+        """İzleyici thread'ini durdurur ve inotify tanımlayıcısını kapatır."""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        os.write(self._wake_write, b"\0")
+        if self._thread is None:
+            self._close()
+
+    def _close(self):
+        for fd in (self._fd, self._wake_read, self._wake_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _run(self):
+        try:
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select([self._fd, self._wake_read], [], [])
+                if self._stop_event.is_set():
+                    break
+                if self._fd in readable:
+                    # Derleme gibi yoğun yazmalarda olaylar birikip tek seferde işlensin
+                    time.sleep(EVENT_BATCH_DELAY)
+                    self._deliver(self._read_events())
+        except Exception as e:
+            print(f"❗ Dosya izleyici durdu: {e}")
+        finally:
+            self._close()
+
+    def _read_events(self):
+        data = b""
+        while True:
+            try:
+                chunk = os.read(self._fd, self.READ_SIZE)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            data += chunk
+        return self._parse_events(data)
+
+    def _parse_events(self, data):
+        """Ham inotify olaylarını FolderEvent listesine çevirir; yeniden adlandırmaları cookie ile eşler."""
+        events = []
+        moved_from = {}   # cookie -> EVENT_DELETED olarak eklenmiş olay
+        offset = 0
+        header_size = self.EVENT_HEADER.size
+        while offset + header_size <= len(data):
+            wd, mask, cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+            name = os.fsdecode(data[offset + header_size:offset + header_size + length].rstrip(b"\0"))
+            offset += header_size + length
+
+            if mask & self.IN_Q_OVERFLOW:
+                events.append(FolderEvent(EVENT_RESCAN, None))
+                continue
+            with self._lock:
+                folder = self._wd_to_path.get(wd)
+                if mask & self.IN_IGNORED and folder is not None:
+                    # Klasör silindi veya izleme kaldırıldı
+                    self._wd_to_path.pop(wd, None)
+                    self._key_to_wd.pop(self._key(folder), None)
+            if folder is None or mask & self.IN_IGNORED:
+                continue
+
+            if mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF):
+                events.append(FolderEvent(EVENT_RESCAN, folder))
+            elif mask & self.IN_MOVED_FROM:
+                event = FolderEvent(EVENT_DELETED, folder, name)
+                moved_from[cookie] = event
+                events.append(event)
+            elif mask & self.IN_MOVED_TO:
+                source_event = moved_from.pop(cookie, None)
+                if source_event is not None and source_event.folder == folder:
+                    source_event.kind = EVENT_RENAMED
+                    source_event.new_name = name
+                else:
+                    events.append(FolderEvent(EVENT_CREATED, folder, name))
+            elif mask & self.IN_CREATE:
+                events.append(FolderEvent(EVENT_CREATED, folder, name))
+            elif mask & self.IN_DELETE:
+                events.append(FolderEvent(EVENT_DELETED, folder, name))
+            elif mask & (self.IN_CLOSE_WRITE | self.IN_ATTRIB):
+                events.append(FolderEvent(EVENT_MODIFIED, folder, name))
+        return events
+
+
+class PollingWatcher(_BaseWatcher):
+    """Klasörleri belirli aralıklarla tarayarak değişiklikleri bulan izleyici.
+
+    contents=False ile izlenen klasörler (örn: yalnızca alt klasörleri
+    gösterilen ağaç düğümleri) klasörün mtime değeri değişmedikçe taranmaz;
+    contents=True ile izlenenlerde dosya boyutu/tarihi değişiklikleri için
+    her turda girdiler stat edilir.
+    """
+
+    def __init__(self, callback, interval=POLL_INTERVAL_SECONDS):
+        super().__init__(callback)
+        self.interval = interval
+        self._watches = {}   # anahtar -> [klasör yolu, contents, klasör mtime_ns, girdi durumu]
+
+    def watch(self, folder_path, contents=False):
+        """Klasörü izlemeye başlar; ilk durum bir sonraki turda alınır.
+
+        Returns:
+            bool: İzleme başlatıldıysa True.
+        """
+        if self._stop_event.is_set():
+            return False
+        key = self._key(folder_path)
+        with self._lock:
+            if key in self._watches:
+                self._watches[key][1] = contents
+            else:
+                self._watches[key] = [folder_path, contents, None, None]
+        self._ensure_thread()
+        return True
+
+    def unwatch(self, folder_path):
+        """Klasörün izlenmesini bırakır."""
+        with self._lock:
+            self._watches.pop(self._key(folder_path), None)
+
+    def stop(self):
+        """İzleyici thread'ini durdurur."""
+        self._stop_event.set()
+
+    @staticmethod
+    def _read_state(folder_path):
+        """Klasördeki girdilerin ad -> (klasör mü, boyut, mtime_ns, inode) durumunu döndürür."""
+        state = {}
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                state[entry.name] = (is_dir, 0 if is_dir else entry_stat.st_size, entry_stat.st_mtime_ns, entry_stat.st_ino)
+        return state
+
+    @staticmethod
+    def diff_states(folder_path, old_state, new_state):
+        """İki durum arasındaki farkı FolderEvent listesi olarak döndürür.
+
+        Aynı inode'a sahip silinen ve eklenen girdiler yeniden adlandırma
+        sayılır (Windows'ta inode 0 olduğundan silme + ekleme olarak kalır).
+        """
+        events = []
+        removed = [name for name in old_state if name not in new_state]
+        added = [name for name in new_state if name not in old_state]
+
+        added_by_inode = {}
+        for name in added:
+            inode = new_state[name][3]
+            if inode:
+                added_by_inode[(new_state[name][0], inode)] = name
+        for name in removed:
+            is_dir, _size, _mtime, inode = old_state[name]
+            new_name = added_by_inode.pop((is_dir, inode), None) if inode else None
+            if new_name is not None:
+                added.remove(new_name)
+                events.append(FolderEvent(EVENT_RENAMED, folder_path, name, new_name))
+            else:
+                events.append(FolderEvent(EVENT_DELETED, folder_path, name))
+        for name in added:
+            events.append(FolderEvent(EVENT_CREATED, folder_path, name))
+        for name, (is_dir, size, mtime, _inode) in new_state.items():
+            old = old_state.get(name)
+            if old is not None and not is_dir and (old[1], old[2]) != (size, mtime):
+                events.append(FolderEvent(EVENT_MODIFIED, folder_path, name))
+        return events
+
+    def _poll_once(self):
+        with self._lock:
+            watches = [(key, list(watch)) for key, watch in self._watches.items()]
+        events = []
+        for key, (folder_path, contents, dir_mtime, old_state) in watches:
+            try:
+                new_dir_mtime = os.stat(folder_path).st_mtime_ns
+                if old_state is not None and not contents and new_dir_mtime == dir_mtime:
+                    continue
+                new_state = self._read_state(folder_path)
+            except OSError:
+                # Klasör silindi veya erişilemiyor
+                self.unwatch(folder_path)
+                events.append(FolderEvent(EVENT_RESCAN, folder_path))
+                continue
+            if old_state is not None:
+                events.extend(self.diff_states(folder_path, old_state, new_state))
+            with self._lock:
+                watch = self._watches.get(key)
+                if watch is not None:
+                    watch[2], watch[3] = new_dir_mtime, new_state
+        self._deliver(events)
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self._poll_once()
+            except Exception as e:
+                print(f"❗ Klasörler taranırken hata (izleyici): {e}")
+
+
+def create_watcher(callback):
+    """Platforma uygun izleyiciyi oluşturur (Linux'ta inotify, aksi halde polling).
+
+    Args:
+        callback: callback(events) olarak izleyici thread'inde çağrılır.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            watcher = InotifyWatcher(callback)
+            print("🔧 DEBUG: Dosya izleyici: inotify")
+            return watcher
+        except (OSError, AttributeError) as e:
+            print(f"🔸 UYARI: inotify kullanılamıyor, klasörler taranarak izlenecek: {e}")
+    print("🔧 DEBUG: Dosya izleyici: polling")
+    return PollingWatcher(callback)
@@ -1,12 +1,51 @@
 # -*- coding: utf-8 -*-
 
-from collections import Counter
 import tkinter as tk
 from tkinter import ttk
 import json # For loading/saving column widths
 import datetime
 from tkcalendar import DateEntry  # Takvim widget'ı için eklendi
 
+from cancellation import OperationCancelled
+from job_scheduler import PRIORITY_LOW # Geçmiş sıkıştırma arka plan işi olarak çalışır
+
+
+# Filtre panelindeki gruplar: grup anahtarı -> geçmişteki olay türleri
+HISTORY_EVENT_GROUPS = {
+    "run": ("run_normal", "run_search"),
+    "compress": ("compress",),
+    "zip_extraction": ("zip_extraction",),
+    "search": ("search_initiated", "word_search_initiated", "search_completed"),
+    "rename": ("rename",),
+    "open_default": ("open_default",),
+    "play_mp3": ("play_mp3",),
+    "analysis": ("method_analysis",),
+    "python_editor": ("python_editor",),
+}
+
+# İstatistik penceresindeki gruplar: (grup anahtarı, etiket, sayılan olay türleri).
+# Aramalarda yalnızca başlatma kayıtları sayılır (her aramanın bir de bitiş kaydı vardır).
+HISTORY_STATS_GROUPS = [
+    ("run", "Çalıştırma İşlemleri", HISTORY_EVENT_GROUPS["run"]),
+    ("compress", "Sıkıştırma İşlemleri", HISTORY_EVENT_GROUPS["compress"]),
+    ("zip_extraction", "ZIP Çıkartma İşlemleri", HISTORY_EVENT_GROUPS["zip_extraction"]),
+    ("search", "Arama İşlemleri", ("search_initiated", "word_search_initiated")),
+    ("rename", "Yeniden Adlandırma İşlemleri", HISTORY_EVENT_GROUPS["rename"]),
+    ("open_default", "Varsayılanla Açma İşlemleri", HISTORY_EVENT_GROUPS["open_default"]),
+    ("play_mp3", "MP3 Çalma İşlemleri", HISTORY_EVENT_GROUPS["play_mp3"]),
+    ("analysis", "Analiz İşlemleri", HISTORY_EVENT_GROUPS["analysis"]),
+    ("python_editor", "Python Editör İşlemleri", HISTORY_EVENT_GROUPS["python_editor"]),
+]
+
+# İstatistiklerdeki zaman dilimleri: etiket -> DatabaseManager.get_history_counts gruplaması
+HISTORY_TIME_BUCKETS = {"Gün": "day", "Hafta": "week", "Ay": "month"}
+
+HISTORY_PAGE_SIZE = 200        # Geçmiş listesine bir seferde yüklenen kayıt sayısı
+TOP_PROGRAMS_LIMIT = 50        # İstatistiklerde gösterilen en çok çalıştırılan program sayısı
+TIME_BUCKET_LIMIT = 60         # İstatistiklerde gösterilen en fazla zaman dilimi sayısı
+LOAD_MORE_THRESHOLD = 0.9      # Kaydırma çubuğu bu orana gelince sonraki sayfa yüklenir
+HISTORY_COMPACTION_DELAY_MS = 30000  # Açılıştan sonra geçmiş sıkıştırmanın başlatılacağı gecikme
+
 class HistoryManager:
     def __init__(self, app_instance):
         self.app = app_instance
@@ -96,87 +135,92 @@ class HistoryManager:
         start_date_entry.bind("<<DateEntrySelected>>", on_date_selected)
         end_date_entry.bind("<<DateEntrySelected>>", on_date_selected)
 
-        all_history_data = self.app.db.get_history() 
-
-        tree = None # Define tree here to be accessible in populate_history_tree
-
-        def populate_history_tree(data_to_populate):
-            """Verilen verilerle geçmiş ağacını doldurur."""
-            if tree is None: return # Should not happen if called after tree creation
-
-            event_type_tags = {
-                "search_initiated": "history_search", 
-                "word_search_initiated": "history_search",
-                "run_normal": "history_run_normal", 
-                "compress": "history_compress", 
-                "zip_extraction": "history_zip_extract",
-                "run_search": "history_run_search", 
-                "rename": "history_rename", 
-                "open_default": "history_open_default",
-                "play_mp3": "history_play_mp3",
-                "method_analysis": "history_method_analysis",
-                "python_editor": "history_python_editor", 
-                "unknown": "history_unknown"
-            }
-
-            if data_to_populate:
-                for timestamp, path, event_type in data_to_populate:
-                    tag_to_apply = event_type_tags.get(event_type, "history_unknown")
-                    tree.insert("", tk.END, values=(timestamp, path), tags=(tag_to_apply,))
-            else:
+        filter_groups = [
+            ("run", run_filter_var),
+            ("compress", compress_filter_var),
+            ("zip_extraction", zip_extraction_filter_var),
+            ("search", search_filter_var),
+            ("rename", rename_filter_var),
+            ("open_default", open_default_filter_var),
+            ("play_mp3", play_mp3_filter_var),
+            ("analysis", method_analysis_filter_var),
+            ("python_editor", python_editor_filter_var),
+        ]
+
+        event_type_tags = {
+            "search_initiated": "history_search", 
+            "word_search_initiated": "history_search",
+            "search_completed": "history_search",
+            "run_normal": "history_run_normal", 
+            "compress": "history_compress", 
+            "zip_extraction": "history_zip_extract",
+            "run_search": "history_run_search", 
+            "rename": "history_rename", 
+            "open_default": "history_open_default",
+            "play_mp3": "history_play_mp3",
+            "method_analysis": "history_method_analysis",
+            "python_editor": "history_python_editor", 
+            "unknown": "history_unknown"
+        }
+
+        tree = None # Define tree here to be accessible in load_next_page
+        # Filtreler SQL sorgusunda uygulanır; liste kaydırıldıkça sayfa sayfa (keyset) yüklenir
+        page_state = {"filters": None, "before": None, "has_more": False, "loading": False, "count": 0}
+
+        def load_next_page():
+            """Geçerli filtrelere uyan sonraki kayıt sayfasını listeye ekler."""
+            page_state["loading"] = False
+            if tree is None or not page_state["has_more"]: return
+            start_date, end_date, event_types = page_state["filters"]
+            rows = self.app.db.get_history_page(start_date, end_date, event_types,
+                                                before=page_state["before"], limit=HISTORY_PAGE_SIZE)
+            for row_id, ts, timestamp, path, event_type in rows:
+                tag_to_apply = event_type_tags.get(event_type, "history_unknown")
+                tree.insert("", tk.END, values=(timestamp, path), tags=(tag_to_apply,))
+            if rows:
+                page_state["before"] = (rows[-1][1], rows[-1][0])
+            page_state["has_more"] = len(rows) == HISTORY_PAGE_SIZE
+            page_state["count"] += len(rows)
+
+            if page_state["count"] == 0:
                 tree.insert("", tk.END, values=("", "Gösterilecek geçmiş kaydı bulunamadı veya filtreye uyan kayıt yok."))
-            self.window.title(f"🔍 Geçmiş listesi:  Toplam {len(data_to_populate)}  kayıt")
-            # print(f"🔍 Geçmiş listesi: Toplam {len(data_to_populate)} Listelenen: {displayCount} kayıt")
+            more_text = "+" if page_state["has_more"] else ""
+            self.window.title(f"🔍 Geçmiş listesi:  {page_state['count']}{more_text}  kayıt")
 
         def update_history_filter():
-            """Checkbox durumlarına göre geçmiş listesini filtreler ve günceller."""
+            """Checkbox ve tarih filtrelerine göre geçmiş listesini baştan yükler."""
             if tree is None: return # Should not happen
             tree.delete(*tree.get_children()) 
 
-            show_run = run_filter_var.get()
-            show_compress = compress_filter_var.get()
-            show_zip_extraction = zip_extraction_filter_var.get()
-            show_search = search_filter_var.get()
-            show_rename = rename_filter_var.get()
-            show_open_default = open_default_filter_var.get() 
-            show_play_mp3 = play_mp3_filter_var.get()
-            show_method_analysis = method_analysis_filter_var.get()
-            show_python_editor = python_editor_filter_var.get()    
-            
-            filtered_data = []
-            for timestamp, path, event_type in all_history_data:
-                # Tarih filtresi
-                sd = start_date_var.get()
-                ed = end_date_var.get()
-                if sd and ed:
-                    try:
-                        ts_date = datetime.datetime.strptime(timestamp.split()[0], "%Y-%m-%d").date()
-                        start = datetime.datetime.strptime(sd, "%Y-%m-%d").date()
-                        end = datetime.datetime.strptime(ed, "%Y-%m-%d").date()
-                        if not (start <= ts_date <= end):
-                            continue
-                    except:
-                        pass
-                if show_run and event_type in ("run_normal", "run_search"):
-                    filtered_data.append((timestamp, path, event_type))
-                elif show_compress and event_type == "compress":
-                    filtered_data.append((timestamp, path, event_type))
-                elif show_zip_extraction and event_type == "zip_extraction":
-                    filtered_data.append((timestamp, path, event_type))
-                elif show_search and event_type in ("search_initiated", "word_search_initiated"):
-                    filtered_data.append((timestamp, path, event_type))
-                elif show_rename and event_type == "rename":
-                    filtered_data.append((timestamp, path, event_type))
-                elif show_open_default and event_type == "open_default": 
-                    filtered_data.append((timestamp, path, event_type))
-                elif show_play_mp3 and event_type == "play_mp3": 
-                    filtered_data.append((timestamp, path, event_type))
-                elif show_method_analysis and event_type == "method_analysis":
-                    filtered_data.append((timestamp, path, event_type))
-                elif show_python_editor and event_type == "python_editor":  
-                    filtered_data.append((timestamp, path, event_type))
-            
-            populate_history_tree(filtered_data)
+            event_types = [event_type for group_key, variable in filter_groups if variable.get()
+                           for event_type in HISTORY_EVENT_GROUPS[group_key]]
+
+            # Tarih filtresi yalnızca iki tarih de geçerliyse uygulanır
+            sd = start_date_var.get()
+            ed = end_date_var.get()
+            if sd and ed:
+                try:
+                    datetime.datetime.strptime(sd, "%Y-%m-%d")
+                    datetime.datetime.strptime(ed, "%Y-%m-%d")
+                except ValueError:
+                    sd = ed = None
+            else:
+                sd = ed = None
+
+            page_state.update(filters=(sd, ed, event_types), before=None, has_more=True, count=0)
+            if event_types:
+                load_next_page()
+            else:
+                page_state["has_more"] = False
+                tree.insert("", tk.END, values=("", "Gösterilecek geçmiş kaydı bulunamadı veya filtreye uyan kayıt yok."))
+                self.window.title("🔍 Geçmiş listesi:  0  kayıt")
+
+        def on_tree_yscroll(first, last):
+            """Kaydırma çubuğunu günceller; listenin sonuna yaklaşılınca sonraki sayfayı yükler."""
+            scrollbar_y.set(first, last)
+            if page_state["has_more"] and not page_state["loading"] and float(last) >= LOAD_MORE_THRESHOLD:
+                page_state["loading"] = True
+                history_window.after_idle(load_next_page)
 
         ttk.Checkbutton(filter_controls_frame, text="Çalıştırma", variable=run_filter_var, command=update_history_filter).pack(side=tk.LEFT, padx=5)
         ttk.Checkbutton(filter_controls_frame, text="Sıkıştırma", variable=compress_filter_var, command=update_history_filter).pack(side=tk.LEFT, padx=5)
@@ -188,19 +232,13 @@ class HistoryManager:
         ttk.Checkbutton(filter_controls_frame, text="Analizler", variable=method_analysis_filter_var, command=update_history_filter).pack(side=tk.LEFT, padx=5)
         ttk.Checkbutton(filter_controls_frame, text="Python Editör", variable=python_editor_filter_var, command=update_history_filter).pack(side=tk.LEFT, padx=5)  
 
-        stats_button = ttk.Button(filter_controls_frame, text="İstatistikler",
-                                  command=lambda: self._show_history_statistics(
-                                      all_history_data,
-                                      run_filter_var.get(),
-                                      compress_filter_var.get(),
-                                      zip_extraction_filter_var.get(),
-                                      search_filter_var.get(),
-                                      rename_filter_var.get(),
-                                      open_default_filter_var.get(),
-                                      play_mp3_filter_var.get(),
-                                      method_analysis_filter_var.get(),
-                                      python_editor_filter_var.get()  
-                                  ))
+        def open_statistics():
+            """İstatistikleri listedeki etkin filtrelerle açar."""
+            start_date, end_date, _event_types = page_state["filters"] or (None, None, [])
+            selected_groups = {group_key for group_key, variable in filter_groups if variable.get()}
+            self._show_history_statistics(start_date, end_date, selected_groups)
+
+        stats_button = ttk.Button(filter_controls_frame, text="İstatistikler", command=open_statistics)
         stats_button.pack(side=tk.LEFT, padx=10)
 
         def close_history():
@@ -246,7 +284,7 @@ class HistoryManager:
 
         tree.grid(row=0, column=0, sticky='nsew')
         scrollbar_y = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar_y.set)
+        tree.configure(yscrollcommand=on_tree_yscroll)
         scrollbar_y.grid(row=0, column=1, sticky='ns')
         scrollbar_x = ttk.Scrollbar(frame, orient=tk.HORIZONTAL, command=tree.xview)
         tree.configure(xscrollcommand=scrollbar_x.set)
@@ -294,8 +332,25 @@ class HistoryManager:
         window_obj.destroy()
         self.stats_window_open = False
 
-    def _show_history_statistics(self, history_data, show_run, show_compress, show_zip_extraction, show_search, show_rename, show_open_default, show_play_mp3, show_analysis, show_python_editor):  
-        """Geçmiş işlem istatistiklerini gösteren bir pencere açar."""
+    @staticmethod
+    def _format_period(grouping, period):
+        """get_history_counts zaman dilimi anahtarını okunabilir metne çevirir."""
+        if grouping == "week" and period:
+            year, week = period.split("-")
+            return f"{year} / {int(week)}. hafta"
+        return period
+
+    def _show_history_statistics(self, start_date, end_date, selected_groups):
+        """Geçmiş işlem istatistiklerini gösteren bir pencere açar.
+
+        Sayımlar etkin filtrelerle (tarih aralığı ve seçili gruplar) SQL'de
+        GROUP BY ile yapılır; geçmiş kayıtları belleğe alınmaz.
+
+        Args:
+            start_date: Filtre başlangıç tarihi (YYYY-MM-DD) veya None.
+            end_date: Filtre bitiş tarihi (YYYY-MM-DD) veya None.
+            selected_groups: Filtre panelinde seçili HISTORY_EVENT_GROUPS anahtarları.
+        """
         if self.stats_window_open:
             # TODO: Mevcut istatistik penceresini öne getirebilir veya kullanıcıyı bilgilendirebiliriz.
             # Şimdilik, zaten açıksa yenisini açmayı engelliyoruz.
@@ -307,7 +362,7 @@ class HistoryManager:
         stats_window_key = "history_stats"
         stats_window = tk.Toplevel(self.app)
         stats_window.title("Geçmiş İstatistikleri")
-        self.app.load_or_center_window(stats_window_key, stats_window, 550, 450)
+        self.app.load_or_center_window(stats_window_key, stats_window, 600, 650)
         stats_window.transient(self.app) # Ana pencereye bağlı
         stats_window.grab_set()
         stats_window.focus_set()
@@ -315,63 +370,56 @@ class HistoryManager:
         main_stats_frame = ttk.Frame(stats_window, padding="10")
         main_stats_frame.pack(expand=True, fill=tk.BOTH)
 
-        # Veri İşleme
-        group_counts = {"run": 0, "compress": 0, "zip_extraction": 0, "search": 0, "rename": 0, "open_default": 0, "play_mp3": 0, "analysis":0, "python_editor": 0}  # Add python_editor
-        program_execution_paths = []
-
-        for _timestamp, path, event_type in history_data:
-            if event_type in ("run_normal", "run_search"):
-                if show_run: # Sadece checkbox işaretliyse say
-                    group_counts["run"] += 1
-                program_execution_paths.append(path) # Program listesi için her zaman ekle
-            elif event_type == "compress" and show_compress:
-                group_counts["compress"] += 1
-            elif event_type == "zip_extraction" and show_zip_extraction:
-                group_counts["zip_extraction"] += 1
-            elif event_type in ("search_initiated", "word_search_initiated") and show_search:
-                group_counts["search"] += 1
-            elif event_type == "rename" and show_rename:
-                group_counts["rename"] += 1
-            elif event_type == "open_default" and show_open_default: # open_default sayımı
-                group_counts["open_default"] += 1
-            elif event_type == "play_mp3" and show_play_mp3:
-                group_counts["play_mp3"] += 1
-            elif event_type == "method_analysis" and show_analysis:
-                group_counts["analysis"] += 1
-            elif event_type == "python_editor" and show_python_editor:  # Add this condition
-                group_counts["python_editor"] += 1
-
-        program_execution_counts = Counter(program_execution_paths)
-        sorted_program_executions = program_execution_counts.most_common()
+        # Veri İşleme (SQL'de gruplanır)
+        selected_stats_groups = [group for group in HISTORY_STATS_GROUPS if group[0] in selected_groups]
+        counted_event_types = [event_type for _key, _label, event_types in selected_stats_groups for event_type in event_types]
+        type_counts = dict(self.app.db.get_history_counts("event_type", start_date, end_date, counted_event_types)) \
+            if counted_event_types else {}
+        date_range_text = f"{start_date} - {end_date}" if start_date and end_date else "Tüm zamanlar"
 
         # Grup Sayılarını Gösterme
-        group_counts_frame = ttk.LabelFrame(main_stats_frame, text="Seçili İşlem Grubu Sayıları", padding="10")
+        group_counts_frame = ttk.LabelFrame(main_stats_frame, text=f"Seçili İşlem Grubu Sayıları ({date_range_text})", padding="10")
         group_counts_frame.pack(pady=10, fill="x")
 
-        if show_run:
-            ttk.Label(group_counts_frame, text=f"Çalıştırma İşlemleri: {group_counts['run']}").pack(anchor='w')
-        if show_compress:
-            ttk.Label(group_counts_frame, text=f"Sıkıştırma İşlemleri: {group_counts['compress']}").pack(anchor='w')
-        if show_zip_extraction:
-            ttk.Label(group_counts_frame, text=f"ZIP Çıkartma İşlemleri: {group_counts['zip_extraction']}").pack(anchor='w')        
-        if show_search:
-            ttk.Label(group_counts_frame, text=f"Arama İşlemleri: {group_counts['search']}").pack(anchor='w')
-        if show_rename:
-            ttk.Label(group_counts_frame, text=f"Yeniden Adlandırma İşlemleri: {group_counts['rename']}").pack(anchor='w')
-        if show_open_default: 
-            ttk.Label(group_counts_frame, text=f"Varsayılanla Açma İşlemleri: {group_counts['open_default']}").pack(anchor='w')
-        if show_play_mp3:
-            ttk.Label(group_counts_frame, text=f"MP3 Çalma İşlemleri: {group_counts['play_mp3']}").pack(anchor='w')
-        if show_analysis:
-            ttk.Label(group_counts_frame, text=f"Analiz İşlemleri: {group_counts['analysis']}").pack(anchor='w')
-        if show_python_editor:  
-            ttk.Label(group_counts_frame, text=f"Python Editör İşlemleri: {group_counts['python_editor']}").pack(anchor='w')
-        
-        if not (show_run or show_compress or show_search or show_rename or show_open_default or show_play_mp3):
+        for _key, label, event_types in selected_stats_groups:
+            group_total = sum(type_counts.get(event_type, 0) for event_type in event_types)
+            ttk.Label(group_counts_frame, text=f"{label}: {group_total}").pack(anchor='w')
+        if not selected_stats_groups:
             ttk.Label(group_counts_frame, text="İstatistik göstermek için en az bir işlem grubu seçin.").pack(anchor='w')
 
-        # Program Çalıştırma Sayılarını Gösterme
-        program_exec_frame = ttk.LabelFrame(main_stats_frame, text="Program Çalıştırma Sayıları (Çoktan Aza)", padding="10")
+        # Zaman Dilimlerine Göre Dağılım
+        time_frame = ttk.LabelFrame(main_stats_frame, text="Zaman Dağılımı (Seçili Gruplar)", padding="10")
+        time_frame.pack(pady=10, fill="x")
+        time_frame.columnconfigure(0, weight=1)
+
+        bucket_var = tk.StringVar(value="Gün")
+        bucket_combo = ttk.Combobox(time_frame, textvariable=bucket_var, values=list(HISTORY_TIME_BUCKETS), state="readonly", width=10)
+        bucket_combo.grid(row=0, column=0, sticky="w", pady=(0, 5))
+
+        bucket_tree = ttk.Treeview(time_frame, columns=("period", "count"), show="headings", height=6)
+        bucket_tree.heading("period", text="Dönem")
+        bucket_tree.heading("count", text="İşlem Sayısı")
+        bucket_tree.column("period", width=200)
+        bucket_tree.column("count", width=100, anchor='center')
+        bucket_tree.grid(row=1, column=0, sticky="nsew")
+        bt_scrollbar_y = ttk.Scrollbar(time_frame, orient=tk.VERTICAL, command=bucket_tree.yview)
+        bucket_tree.configure(yscrollcommand=bt_scrollbar_y.set)
+        bt_scrollbar_y.grid(row=1, column=1, sticky="ns")
+
+        def refresh_time_buckets(event=None):
+            bucket_tree.delete(*bucket_tree.get_children())
+            if not counted_event_types:
+                return
+            grouping = HISTORY_TIME_BUCKETS[bucket_var.get()]
+            for period, count in self.app.db.get_history_counts(grouping, start_date, end_date, counted_event_types,
+                                                                 limit=TIME_BUCKET_LIMIT):
+                bucket_tree.insert("", tk.END, values=(self._format_period(grouping, period), count))
+
+        bucket_combo.bind("<<ComboboxSelected>>", refresh_time_buckets)
+        refresh_time_buckets()
+
+        # Program Çalıştırma Sayılarını Gösterme (çalıştırma filtresinden bağımsız, tarih aralığına göre)
+        program_exec_frame = ttk.LabelFrame(main_stats_frame, text=f"En Çok Çalıştırılan Programlar (İlk {TOP_PROGRAMS_LIMIT})", padding="10")
         program_exec_frame.pack(pady=10, fill="both", expand=True)
         program_exec_frame.rowconfigure(0, weight=1)
         program_exec_frame.columnconfigure(0, weight=1)
@@ -397,7 +445,9 @@ class HistoryManager:
             program_tree.column("program", width=350)
             program_tree.column("count", width=100, anchor='center')
 
-        for prog_path, count in sorted_program_executions:
+        top_programs = self.app.db.get_history_counts("path", start_date, end_date, HISTORY_EVENT_GROUPS["run"],
+                                                      limit=TOP_PROGRAMS_LIMIT)
+        for prog_path, count in top_programs:
             program_tree.insert("", tk.END, values=(prog_path, count))
 
         program_tree.grid(row=0, column=0, sticky="nsew")
@@ -411,4 +461,44 @@ class HistoryManager:
         close_button = ttk.Button(main_stats_frame, text="Kapat", command=lambda: self._on_stats_closing(stats_window, stats_window_key, program_tree, tree_col_widths_key))
         close_button.pack(pady=10)
 
-        self.app.wait_window(stats_window)
\ No newline at end of file
+        self.app.wait_window(stats_window)
+
+    # --- History Retention ---
+    def schedule_history_compaction(self, force=False, delay_ms=HISTORY_COMPACTION_DELAY_MS):
+        """Saklama süresini aşan geçmiş kayıtlarını özetleyen işi zamanlar.
+
+        İş günde en fazla bir kez çalışır (son çalışma günü ayarlarda tutulur).
+
+        Args:
+            force: True ise bugün zaten çalışmış olsa da yeniden çalıştırılır.
+            delay_ms: İşin gönderilmeden önce beklenecek süre (milisaniye).
+        """
+        self.app.after(delay_ms, self._submit_history_compaction, force)
+
+    def _submit_history_compaction(self, force=False):
+        today = datetime.date.today().isoformat()
+        if not force and self.app.db.get_setting("history_last_compaction") == today:
+            return
+        retention_days = self.app.db.get_history_retention_days()
+        if retention_days <= 0:
+            return
+
+        def run(job):
+            job.report_progress(f"{retention_days} günden eski kayıtlar özetleniyor...")
+            try:
+                stats = self.app.db.compact_history(retention_days, cancel_token=job.cancel_token)
+            except OperationCancelled:
+                raise
+            except Exception as e:
+                print(f"❗ Geçmiş sıkıştırılamadı: {e}")
+                raise
+            self.app.after(0, self._handle_history_compaction_done, today, stats)
+
+        self.app.job_scheduler.submit("Geçmiş sıkıştırma", run, priority=PRIORITY_LOW)
+
+    def _handle_history_compaction_done(self, today, stats):
+        self.app.db.set_setting("history_last_compaction", today)
+        if stats and stats["deleted_rows"]:
+            print(f"🔧 DEBUG: {stats['cutoff_day']} öncesindeki {stats['deleted_rows']} geçmiş kaydı "
+                  f"{stats['rollup_groups']} günlük özete taşındı, "
+                  f"{self.app.format_file_size(stats['freed_bytes'])} boşaltıldı")
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""
+Job Scheduler - Eş Zamanlı İşlem Zamanlayıcı Modülü
+
+Uzun süren işlemler (dosya arama, kelime arama, sıkıştırma, EXE çevirme,
+analizler) tek bir "işlem sürüyor" bayrağıyla sıraya sokulmak yerine bu
+zamanlayıcıya iş (Job) olarak gönderilir.
+
+- Sınırlı sayıda worker thread'i vardır (varsayılan DEFAULT_MAX_JOBS).
+- Bekleyen işler önceliğe, sonra gönderilme sırasına göre başlatılır.
+- Aynı veya iç içe klasörler üzerinde çalışan işler sırayla, farklı
+  klasörlerdeki işler aynı anda çalışır.
+- Her iş kendi CancellationToken'ına ve ilerleme bilgisine sahiptir.
+
+Kullanım:
+    from job_scheduler import JobScheduler, PRIORITY_HIGH
+
+    scheduler = JobScheduler(app)
+
+    def run(job):
+        for i, path in enumerate(paths, 1):
+            job.cancel_token.raise_if_cancelled()
+            job.report_progress(f"{i}/{len(paths)} dosya", i / len(paths))
+
+    job = scheduler.submit("Arama: *.py", run, root="C:\\project", priority=PRIORITY_HIGH)
+    job.cancel()
+"""
+
+import os
+import threading
+import time
+from itertools import count
+
+from cancellation import CancellationToken, OperationCancelled
+
+
+# Öncelikler (küçük değer önce çalışır)
+PRIORITY_HIGH = 0    # Kullanıcının sonucunu beklediği etkileşimli işler (arama)
+PRIORITY_NORMAL = 1  # Analizler
+PRIORITY_LOW = 2     # Sıkıştırma, EXE çevirme gibi uzun arka plan işleri
+
+PRIORITY_NAMES = {PRIORITY_HIGH: "Yüksek", PRIORITY_NORMAL: "Normal", PRIORITY_LOW: "Düşük"}
+
+DEFAULT_MAX_JOBS = 3        # Aynı anda çalışabilecek en fazla iş sayısı
+MAX_FINISHED_JOBS = 50      # İşler panelinde tutulacak biten iş sayısı
+
+
+class Job:
+    """Zamanlayıcıya gönderilen tek bir iş.
+
+    Attributes:
+        job_id: İşin benzersiz numarası.
+        title: İşler panelinde görünen başlık.
+        root: İşin üzerinde çalıştığı klasör (çakışma kontrolü için, None olabilir).
+        priority: PRIORITY_HIGH, PRIORITY_NORMAL veya PRIORITY_LOW.
+        cancel_token: İşin CancellationToken'ı.
+        status: "queued", "running", "done", "failed" veya "cancelled".
+        progress: 0-1 arası ilerleme oranı (bilinmiyorsa None).
+        progress_text: İlerleme açıklaması.
+        error: İş hata ile bittiyse hata mesajı.
+    """
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CANCELLED = "cancelled"
+
+    STATUS_NAMES = {
+        STATUS_QUEUED: "Bekliyor",
+        STATUS_RUNNING: "Çalışıyor",
+        STATUS_DONE: "Tamamlandı",
+        STATUS_FAILED: "Hata",
+        STATUS_CANCELLED: "İptal edildi",
+    }
+
+    def __init__(self, scheduler, job_id, title, func, root, priority):
+        self._scheduler = scheduler
+        self.job_id = job_id
+        self.title = title
+        self.func = func
+        self.root = root
+        self.priority = priority
+        self.cancel_token = CancellationToken()
+        self.status = self.STATUS_QUEUED
+        self.progress = None
+        self.progress_text = ""
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def is_active(self):
+        """İş bekliyor veya çalışıyorsa True döndürür."""
+        return self.status in (self.STATUS_QUEUED, self.STATUS_RUNNING)
+
+    @property
+    def elapsed_seconds(self):
+        """İşin çalışma süresi (henüz başlamadıysa 0)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def report_progress(self, text=None, fraction=None):
+        """İşin ilerlemesini bildirir (herhangi bir thread'den çağrılabilir).
+
+        Args:
+            text: İlerleme açıklaması (örn: "120 dosya bulundu").
+            fraction: 0-1 arası ilerleme oranı (bilinmiyorsa None).
+        """
+        if text is not None:
+            self.progress_text = text
+        self.progress = fraction
+        self._scheduler._notify()
+
+    def cancel(self):
+        """İşi iptal eder; bekliyorsa hiç başlatılmaz."""
+        self._scheduler.cancel(self)
+
+
+class JobScheduler:
+    """Sınırlı thread havuzu ile öncelikli işleri çalıştıran zamanlayıcı.
+
+    Dinleyiciler (add_listener) iş durumları değiştiğinde arayüz
+    thread'inde çağrılır; sık gelen ilerleme bildirimleri tek bir
+    çağrıda birleştirilir.
+
+    Attributes:
+        app: Ana uygulama referansı (App).
+        max_workers: Aynı anda çalışabilecek en fazla iş sayısı.
+    """
+
+    def __init__(self, app_instance, max_workers=DEFAULT_MAX_JOBS):
+        """JobScheduler'ı başlatır ve worker thread'lerini oluşturur.
+
+        Args:
+            app_instance: Ana uygulama referansı.
+            max_workers: Aynı anda çalışabilecek en fazla iş sayısı.
+        """
+        self.app = app_instance
+        self.max_workers = max_workers
+        self._condition = threading.Condition()
+        self._queued = []
+        self._running = []
+        self._finished = []
+        self._ids = count(1)
+        self._listeners = []
+        self._notify_pending = False
+        self._shutdown = False
+
+        self._workers = [threading.Thread(target=self._worker_loop, daemon=True) for _ in range(max_workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, title, func, root=None, priority=PRIORITY_NORMAL):
+        """Yeni bir iş gönderir.
+
+        Args:
+            title: İşler panelinde görünecek başlık.
+            func: Worker thread'inde func(job) olarak çağrılacak fonksiyon.
+            root: İşin üzerinde çalıştığı klasör; aynı/iç içe klasördeki işler sırayla çalışır.
+            priority: PRIORITY_HIGH, PRIORITY_NORMAL veya PRIORITY_LOW.
+
+        Returns:
+            Job: Gönderilen iş.
+        """
+        with self._condition:
+            job = Job(self, next(self._ids), title, func, root, priority)
+            self._queued.append(job)
+            self._condition.notify_all()
+        print(f"🔧 DEBUG: İş gönderildi #{job.job_id}: {title} (öncelik: {PRIORITY_NAMES.get(priority, priority)})")
+        self._notify()
+        return job
+
+    def cancel(self, job):
+        """İşi iptal eder; çalışan iş bir sonraki kontrol noktasında durur.
+
+        Bekleyen iş, klasör çakışmasına bakılmadan ilk boşalan worker'da
+        başlatılır ve iptal edilmiş token'ı görerek hemen biter. Böylece
+        işin kendi temizlik/geri bildirim kodu (örn: açık sonuç penceresi) yine çalışır.
+        """
+        job.cancel_token.cancel()
+        with self._condition:
+            self._condition.notify_all()
+        self._notify()
+
+    def cancel_all(self):
+        """Bekleyen ve çalışan tüm işleri iptal eder."""
+        for job in self.get_active_jobs():
+            self.cancel(job)
+
+    def get_active_jobs(self):
+        """Çalışan ve bekleyen işleri (önce çalışanlar) döndürür."""
+        with self._condition:
+            return list(self._running) + sorted(self._queued, key=lambda j: (j.priority, j.job_id))
+
+    def get_jobs(self):
+        """İşler paneli için tüm işleri (aktifler ve son bitenler) döndürür."""
+        with self._condition:
+            active = list(self._running) + sorted(self._queued, key=lambda j: (j.priority, j.job_id))
+            return active + list(reversed(self._finished))
+
+    def add_listener(self, callback):
+        """İş durumları değiştiğinde arayüz thread'inde çağrılacak fonksiyonu ekler."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Dinleyiciyi kaldırır."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def shutdown(self):
+        """Tüm işleri iptal eder ve worker thread'lerini durdurur (beklemez)."""
+        with self._condition:
+            self._shutdown = True
+            for job in self._queued + self._running:
+                job.cancel_token.cancel()
+            self._condition.notify_all()
+
+    @staticmethod
+    def _roots_conflict(root_a, root_b):
+        """İki klasör aynıysa veya biri diğerinin içindeyse True döndürür."""
+        if root_a is None or root_b is None:
+            return False
+        a = os.path.normcase(os.path.abspath(root_a)).rstrip(os.sep) + os.sep
+        b = os.path.normcase(os.path.abspath(root_b)).rstrip(os.sep) + os.sep
+        return a.startswith(b) or b.startswith(a)
+
+    def _next_runnable(self):
+        """Çalışan işlerle klasör çakışması olmayan en öncelikli bekleyen işi döndürür."""
+        for job in self._queued:
+            if job.cancel_token.is_cancelled:
+                return job
+        for job in sorted(self._queued, key=lambda j: (j.priority, j.job_id)):
+            if not any(self._roots_conflict(job.root, running.root) for running in self._running):
+                return job
+        return None
+
+    def _remember_finished(self, job):
+        """Biten işi panel geçmişine ekler (sınırlı sayıda tutulur)."""
+        self._finished.append(job)
+        del self._finished[:-MAX_FINISHED_JOBS]
+
+    def _worker_loop(self):
+        """Worker thread döngüsü: sıradaki uygun işi alıp çalıştırır."""
+        while True:
+            with self._condition:
+                job = None
+                while not self._shutdown:
+                    job = self._next_runnable()
+                    if job is not None:
+                        break
+                    self._condition.wait()
+                if self._shutdown:
+                    return
+                self._queued.remove(job)
+                self._running.append(job)
+                job.status = Job.STATUS_RUNNING
+                job.started_at = time.time()
+            self._notify()
+
+            try:
+                job.func(job)
+                status = Job.STATUS_CANCELLED if job.cancel_token.is_cancelled else Job.STATUS_DONE
+            except OperationCancelled:
+                status = Job.STATUS_CANCELLED
+            except Exception as e:
+                status = Job.STATUS_FAILED
+                job.error = str(e)
+                print(f"❗ İş #{job.job_id} ({job.title}) hata ile sonlandı: {e}")
+
+            with self._condition:
+                job.status = status
+                job.finished_at = time.time()
+                self._running.remove(job)
+                self._remember_finished(job)
+                # Çakışma nedeniyle bekleyen işler artık başlayabilir
+                self._condition.notify_all()
+            print(f"🔧 DEBUG: İş #{job.job_id} bitti: {job.title} - {Job.STATUS_NAMES[status]} ({job.elapsed_seconds:.2f} sn)")
+            self._notify()
+
+    def _notify(self):
+        """Dinleyicileri arayüz thread'inde çağırır; bekleyen bir bildirim varsa yenisini eklemez."""
+        with self._condition:
+            if self._notify_pending or self._shutdown:
+                return
+            self._notify_pending = True
+        try:
+            self.app.after(0, self._dispatch)
+        except Exception:
+            # Ana pencere kapanmışsa bildirim yapılamaz
+            pass
+
+    def _dispatch(self):
+        """Dinleyicileri çağırır (arayüz thread'i)."""
+        with self._condition:
+            self._notify_pending = False
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception as e:
+                print(f"❗ İş dinleyicisi çalıştırılırken hata: {e}")
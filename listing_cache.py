@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Listing Cache - Klasör Listeleme Önbelleği Modülü
+
+dir_tree'de klasörler arasında gidip gelirken her seferinde klasörü diskten
+yeniden okumamak için işlenmiş (stat edilmiş ve sıralanmış) listeleme
+girdileri bellekte tutulur. Önbellek LRU düzenindedir; hem klasör sayısı
+hem de toplam girdi sayısı sınırlıdır, sınır aşıldığında en uzun süredir
+kullanılmayan klasör atılır.
+
+Geçerlilik klasörün değiştirilme zamanı (mtime) ile kontrol edilir: dosya
+eklenince, silinince veya yeniden adlandırılınca klasörün mtime değeri
+değişir ve kayıt atılır. Dosya izleyicisi olan klasörler için invalidate()
+doğrudan çağrılabilir. mtime değeri "şimdi"ye çok yakın olan klasörler
+önbelleğe alınmaz; aynı zaman dilimi içinde yapılan bir değişiklik mtime
+değerini değiştirmeyebilir.
+
+Yerinde düzenlenen bir dosya klasörün mtime değerini değiştirmez; bu yüzden
+önbellekteki klasörler dosya izleyicisiyle izlenmeli ve olaylarda
+invalidate() çağrılmalıdır (izleme sayısı max_folders ile sınırlı kalır).
+
+Kullanım:
+    from listing_cache import ListingCache
+
+    cache = ListingCache()
+    entries = cache.get(folder_path)
+    if entries is None:
+        dir_mtime = os.stat(folder_path).st_mtime
+        entries = scan(folder_path)
+        cache.put(folder_path, dir_mtime, entries)
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+
+
+MAX_CACHED_FOLDERS = 64          # Önbellekte tutulacak en fazla klasör sayısı
+MAX_CACHED_ENTRIES = 200000      # Tüm klasörlerdeki toplam girdi sınırı
+RACY_MTIME_SECONDS = 2.0         # mtime değeri bu kadar yeni olan klasörler önbelleğe alınmaz
+
+
+class ListingCache:
+    """Klasör yolu -> listeleme girdileri LRU önbelleği (thread-safe).
+
+    Attributes:
+        max_folders: Önbellekte tutulacak en fazla klasör sayısı.
+        max_entries: Tüm klasörlerdeki toplam girdi sınırı.
+        hits: Geçerli kayıt bulunan sorgu sayısı.
+        misses: Kayıt bulunamayan veya geçersiz kayıt bulunan sorgu sayısı.
+    """
+
+    def __init__(self, max_folders=MAX_CACHED_FOLDERS, max_entries=MAX_CACHED_ENTRIES):
+        self.max_folders = max_folders
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._items = OrderedDict()   # anahtar -> (dir_mtime, girdiler)
+        self._entry_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(folder_path):
+        return os.path.normcase(os.path.abspath(folder_path))
+
+    def __contains__(self, folder_path):
+        """Klasörün önbellekte kaydı olup olmadığını döndürür (diske erişmez)."""
+        with self._lock:
+            return self._key(folder_path) in self._items
+
+    def get(self, folder_path):
+        """Klasörün önbellekteki girdilerini döndürür.
+
+        Kayıt varsa klasörün mtime değeri tek bir stat ile kontrol edilir;
+        değişmişse kayıt atılır.
+
+        Args:
+            folder_path: Klasör yolu.
+
+        Returns:
+            list: Kaydedilen girdiler (değiştirilmemelidir); yoksa veya geçersizse None.
+        """
+        key = self._key(folder_path)
+        with self._lock:
+            item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        cached_mtime, entries = item
+        try:
+            current_mtime = os.stat(folder_path).st_mtime
+        except OSError:
+            current_mtime = None
+        if current_mtime != cached_mtime:
+            self.invalidate(folder_path)
+            self.misses += 1
+            return None
+
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+        self.hits += 1
+        return entries
+
+    def put(self, folder_path, dir_mtime, entries):
+        """Klasörün girdilerini önbelleğe ekler ve gerekirse eski kayıtları atar.
+
+        Args:
+            folder_path: Listelenen klasör.
+            dir_mtime: Klasörün okunmaya başlanmadan önceki mtime değeri.
+            entries: Listeleme girdileri (kaydedildikten sonra değiştirilmemelidir).
+        """
+        if dir_mtime is None or len(entries) > self.max_entries:
+            return
+        if time.time() - dir_mtime < RACY_MTIME_SECONDS:
+            return
+        key = self._key(folder_path)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._entry_count -= len(old[1])
+            self._items[key] = (dir_mtime, entries)
+            self._entry_count += len(entries)
+            while len(self._items) > self.max_folders or self._entry_count > self.max_entries:
+                _evicted_key, (_mtime, evicted_entries) = self._items.popitem(last=False)
+                self._entry_count -= len(evicted_entries)
+
+    def invalidate(self, folder_path):
+        """Klasörün kaydını atar (dosya izleyicisi veya uygulamanın kendi değişiklikleri için)."""
+        with self._lock:
+            old = self._items.pop(self._key(folder_path), None)
+            if old is not None:
+                self._entry_count -= len(old[1])
+
+    def clear(self):
+        """Tüm önbelleği temizler."""
+        with self._lock:
+            self._items.clear()
+            self._entry_count = 0
@@ -1,11 +1,14 @@
 import ast
 import os
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 import json
 from collections import defaultdict
 import glob
 from python_editor import PythonEditor  
+from dir_walker import parallel_walk
+from exclusion_utils import ExclusionManager
+from job_scheduler import PRIORITY_NORMAL
 
 class MethodAnalyzer:
     def __init__(self, app_instance):
@@ -163,15 +166,14 @@ class MethodAnalyzer:
         """Proje klasöründeki tüm Python dosyalarını bulur."""
         self.project_files = []
         
-        # Recursive olarak tüm .py dosyalarını bul
-        for root, dirs, files in os.walk(project_dir):
-            # __pycache__ klasörlerini atla
-            dirs[:] = [d for d in dirs if d != '__pycache__']
-            
-            for file in files:
-                if file.endswith('.py'):
-                    full_path = os.path.join(root, file)
-                    self.project_files.append(full_path)
+        # Recursive olarak tüm .py dosyalarını bul (__pycache__ klasörleri atlanır)
+        for root, dirs, files in parallel_walk(project_dir, ExclusionManager("__pycache__"), stat_files=False):
+            for file_entry in files:
+                if file_entry.name.endswith('.py'):
+                    self.project_files.append(os.path.join(root, file_entry.name))
+        
+        # Paralel taramada klasör sırası belirsiz olduğundan sonuçları sırala
+        self.project_files.sort()
         
         print(f"🔍 Toplam {len(self.project_files)} Python dosyası bulundu")
     
@@ -705,11 +707,10 @@ class MethodAnalyzer:
         """Projedeki potansiyel ana dosyaları bulur."""
         main_files = []
         
-        for root, dirs, files in os.walk(project_dir):
-            # __pycache__ ve .git klasörlerini atla
-            dirs[:] = [d for d in dirs if d not in ['__pycache__', '.git', '.vscode', '__pycache__']]
-            
-            for file in files:
+        # __pycache__, .git ve .vscode klasörlerini atla
+        for root, dirs, file_entries in parallel_walk(project_dir, ExclusionManager("__pycache__, .git, .vscode"), stat_files=False):
+            for file_entry in file_entries:
+                file = file_entry.name
                 if file.endswith('.py'):
                     file_path = os.path.join(root, file)
                     is_main, reason = self._is_main_file(file_path)
@@ -721,16 +722,36 @@ class MethodAnalyzer:
                             'name': file
                         })
         
+        # Paralel taramada klasör sırası belirsiz olduğundan sonuçları sırala
+        main_files.sort(key=lambda item: item['path'])
         return main_files
     
     def show_analysis_window(self, file_path):
-        """Analiz sonuçlarını gösteren pencereyi açar."""
-        # Ana dosya kontrolü
-        is_main, main_reason = self._is_main_file(file_path)
-        
-        # Önce analizi yap
-        self.analyze_file(file_path)
-        
+        """Analizi iş zamanlayıcısında başlatır; bitince sonuç penceresini açar."""
+        def run(job):
+            try:
+                # Ana dosya kontrolü
+                job.report_progress("Ana dosya kontrol ediliyor...")
+                is_main, main_reason = self._is_main_file(file_path)
+                job.cancel_token.raise_if_cancelled()
+                
+                # Önce analizi yap
+                job.report_progress("Metodlar analiz ediliyor...")
+                self.analyze_file(file_path)
+                job.cancel_token.raise_if_cancelled()
+            except Exception as e:
+                error_message = str(e)
+                if not job.cancel_token.is_cancelled:
+                    self.app.after(0, lambda: messagebox.showerror(
+                        "Hata", f"Metod analizi sırasında hata oluştu:\n{error_message}", parent=self.app))
+                raise
+            self.app.after(0, self._build_analysis_window, file_path, is_main, main_reason)
+        
+        self.app.job_scheduler.submit(f"Metod analizi: {os.path.basename(file_path)}", run,
+                                      root=os.path.dirname(os.path.abspath(file_path)), priority=PRIORITY_NORMAL)
+
+    def _build_analysis_window(self, file_path, is_main, main_reason):
+        """Analiz sonuçlarını gösteren pencereyi oluşturur (arayüz thread'i)."""
         # Pencereyi oluştur
         self.analysis_window = tk.Toplevel(self.app)
         self.analysis_window.title(f"Python Metod Kontrolü - {os.path.basename(file_path)}")
@@ -9,15 +9,102 @@ import tempfile
 import fnmatch
 import subprocess
 import platform
+import time
+import json
+import stat
 
 from exclusion_utils import ExclusionManager # Merkezi exclusion yönetimi
+from dir_walker import parallel_walk # Paralel klasör tarama
+from cancellation import OperationCancelled # İşbirlikçi iptal
+from job_scheduler import PRIORITY_LOW # Arka plan işlerinin önceliği
+from parallel_zip import ParallelZipWriter, CompressionProgress # Çok çekirdekli ZIP sıkıştırma ve ilerleme ölçümü
+import differential_backup # Fark yedekleri ve yedek zinciri
+from backup_store import BackupStore # İçerik adresli yedek deposu
+
+# Akışlı arama sonuçlarının kuyruğa gönderilme sıklığı
+SEARCH_BATCH_SIZE = 200       # Bu kadar sonuç birikince gönder
+SEARCH_BATCH_INTERVAL = 0.1   # veya en geç bu kadar saniyede bir gönder
 
 # --- Sıkıştırma İşlemleri ---
+def iter_compression_files(abs_source_folder_path, include_subfolders, file_pattern, exclusion_manager,
+                           normcase_abs_zip_file_path, normcase_abs_backup_dir_path, cancel_token=None):
+    """Sıkıştırılacak dosyaları (dosya yolu, arşiv içi ad, boyut) üçlüleri olarak üretir.
+    
+    Yedekleme klasörü ve yazılmakta olan ZIP dosyası atlanır; dosya deseni ve
+    exclusion kuralları uygulanır. ZIP yedeği ve yedek deposu aynı seçimi kullanır.
+    Boyut, taramanın zaten yaptığı stat çağrısından gelir (Windows'ta DirEntry
+    önbelleğinden, ek sistem çağrısı olmadan).
+    """
+    if include_subfolders:
+        # Yedekleme klasörünün kendisine girilmez
+        def is_backup_dir(entry):
+            return os.path.normcase(os.path.abspath(entry.path)) == normcase_abs_backup_dir_path
+        
+        # Klasörler paralel listelenir, hariç tutulan klasörler budanır; dosyalar çağıran thread'de işlenir
+        for root, dirs, files in parallel_walk(abs_source_folder_path, exclusion_manager, prune_dir=is_backup_dir,
+                                              log_pruned=True):
+            abs_current_root = os.path.abspath(root)
+            for file_entry in files:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                file_name = file_entry.name
+                if fnmatch.fnmatch(file_name, file_pattern): # Dosya deseni kontrolü
+                    file_path_to_add = os.path.abspath(os.path.join(abs_current_root, file_name))
+                    if os.path.normcase(file_path_to_add) == normcase_abs_zip_file_path:
+                        continue
+                    # Exclusion kontrolü
+                    if exclusion_manager.should_exclude_file(file_name):
+                        continue
+                    try:
+                        file_size = file_entry.stat().st_size
+                    except OSError:
+                        continue # Tarama sırasında silinmiş
+                    yield file_path_to_add, os.path.relpath(file_path_to_add, abs_source_folder_path), file_size
+    else:
+        for item_name in os.listdir(abs_source_folder_path):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            item_path_to_check = os.path.join(abs_source_folder_path, item_name)
+            abs_item_path_to_check = os.path.abspath(item_path_to_check)
+            if os.path.normcase(abs_item_path_to_check) == normcase_abs_backup_dir_path:
+                continue
+            if os.path.normcase(abs_item_path_to_check) == normcase_abs_zip_file_path:
+                continue
+            try:
+                item_stat = os.stat(abs_item_path_to_check)
+            except OSError:
+                continue
+            if stat.S_ISREG(item_stat.st_mode):
+                if fnmatch.fnmatch(item_name, file_pattern): # Dosya deseni kontrolü
+                    # Exclusion kontrolü
+                    if exclusion_manager.should_exclude_file(item_name):
+                        continue
+                    yield abs_item_path_to_check, item_name, item_stat.st_size
+
 def perform_compression_in_thread(app_instance, abs_source_folder_path, include_subfolders,
                                   abs_zip_file_path, normcase_abs_zip_file_path,
                                   abs_backup_dir_path, normcase_abs_backup_dir_path, folder_name,
-                                  backup_dir_name, file_pattern="*.*", exclusion_pattern=""):
-    """Sıkıştırma işlemini ayrı bir iş parçacığında gerçekleştirir."""
+                                  backup_dir_name, file_pattern="*.*", exclusion_pattern="", cancel_token=None,
+                                  progress_callback=None, compression_workers=None, compression_policy=None,
+                                  differential=False):
+    """Sıkıştırma işlemini ayrı bir iş parçacığında gerçekleştirir.
+    
+    Dosyalar bu thread'de seçilir; sıkıştırma ParallelZipWriter ile
+    compression_workers thread'e (varsayılan: çekirdek sayısı) dağıtılır ve
+    hazır üyeler sırasıyla ZIP'e yazılır.
+    
+    cancel_token verilirse her klasör ve dosyadan önce kontrol edilir; iptal
+    edildiğinde yarım kalan ZIP dosyası silinir. Yazmadan önce dosyalar
+    taranıp toplam boyut ve sayı çıkarılır; progress_callback verilirse
+    progress_callback(metin, oran) ile ilerleme, bayt/sn, dosya/sn, kalan süre
+    ve sıkıştırma oranı bildirilir. Son ölçümler başarı bildirimine iletilir.
+    compression_policy (parallel_zip.CompressionPolicy) verilirse zaten
+    sıkıştırılmış dosyalar ZIP_STORED olarak eklenir; hangi üyelerin
+    saklandığı başarı bildirimine iletilir.
+    differential True ise klasörün en yeni yedeğine göre yalnızca yeni ve
+    değişen dosyalar yazılır, silinen dosyalar manifest'e kaydedilir; önceki
+    yedek yoksa tam yedek alınır. Her yedeğe bir manifest yazılır.
+    """
     
     # ExclusionManager oluştur
     exclusion_manager = ExclusionManager(exclusion_pattern)
@@ -27,62 +114,128 @@ def perform_compression_in_thread(app_instance, abs_source_folder_path, include_
     print(f"🔧 DEBUG: Klasör pattern'leri: {debug_info['dir_patterns']}")
     print(f"🔧 DEBUG: Dosya pattern'leri: {debug_info['file_patterns']}")
     
+    added_count = 0
+    unchanged_count = 0
+    seen_arcnames = set()
+    base_zip_path = None
+    base_snapshot = {}
+    progress = None
+    
+    def report_progress():
+        if progress_callback is not None:
+            progress_callback(progress.format_text(), progress.snapshot()["fraction"])
+    
+    def report_added(zinfo):
+        nonlocal added_count
+        added_count += 1
+        progress.member_written(zinfo)
+        report_progress()
+    
+    def add_file(writer, file_path, arcname, file_size):
+        """Dosyayı ZIP'e ekler; fark yedeğinde temel yedekten beri değişmediyse atlar."""
+        nonlocal unchanged_count
+        zip_arcname = arcname.replace(os.sep, "/")
+        seen_arcnames.add(zip_arcname)
+        if base_zip_path is not None and differential_backup.is_unchanged(base_snapshot.get(zip_arcname), file_path,
+                                                                          cancel_token=cancel_token):
+            unchanged_count += 1
+            progress.skip(file_size)
+            report_progress()
+            return
+        writer.add(file_path, arcname)
+    
     try:
+        # Ön tarama: ilerleme oranı ve kalan süre için toplam dosya sayısı ve boyutu
+        if progress_callback is not None:
+            progress_callback("Dosyalar taranıyor...")
+        files_to_add = list(iter_compression_files(abs_source_folder_path, include_subfolders, file_pattern,
+                                                   exclusion_manager, normcase_abs_zip_file_path,
+                                                   normcase_abs_backup_dir_path, cancel_token))
+        progress = CompressionProgress(len(files_to_add), sum(file_size for _, _, file_size in files_to_add))
+        print(f"🔧 DEBUG: Ön tarama: {progress.total_files} dosya, {progress.total_bytes} bayt")
+        
+        if differential:
+            if progress_callback is not None:
+                progress_callback("Önceki yedek okunuyor...")
+            # Temel yedek yoksa veya zinciri kullanılamıyorsa tam yedek alınır
+            base_zip_path, base_snapshot = differential_backup.load_base_snapshot(
+                abs_backup_dir_path, abs_source_folder_path, exclude_path=abs_zip_file_path)
+            if base_zip_path is not None:
+                print(f"🔧 DEBUG: Fark yedeği temeli: {base_zip_path} ({len(base_snapshot)} dosya)")
+        
         with zipfile.ZipFile(abs_zip_file_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
-            if include_subfolders:
-                for root, dirs, files in os.walk(abs_source_folder_path, topdown=True):
-                    abs_current_root = os.path.abspath(root)
-                    if backup_dir_name in dirs:
-                        potential_backup_path_in_dirs = os.path.abspath(os.path.join(abs_current_root, backup_dir_name))
-                        if os.path.normcase(potential_backup_path_in_dirs) == normcase_abs_backup_dir_path:
-                            dirs.remove(backup_dir_name)
-                    
-                    # Hariç tutulan klasörleri dirs listesinden çıkar
-                    dirs_to_remove = []
-                    for dir_name in dirs:
-                        if exclusion_manager.should_exclude_dir(dir_name):
-                            dirs_to_remove.append(dir_name)
-                            rel_dir_path = os.path.relpath(os.path.join(abs_current_root, dir_name), abs_source_folder_path)
-                            print(f"🔧 DEBUG: Klasör hariç tutuluyor: {rel_dir_path}")
-                    
-                    for d in dirs_to_remove:
-                        dirs.remove(d)
-                    
-                    for file_name in files:
-                        if fnmatch.fnmatch(file_name, file_pattern): # Dosya deseni kontrolü
-                            file_path_to_add = os.path.abspath(os.path.join(abs_current_root, file_name))
-                            if os.path.normcase(file_path_to_add) == normcase_abs_zip_file_path:
-                                continue
-                            # Exclusion kontrolü
-                            if exclusion_manager.should_exclude_file(file_name):
-                                continue
-                            arcname = os.path.relpath(file_path_to_add, abs_source_folder_path)
-                            zf.write(file_path_to_add, arcname)
-            else:
-                for item_name in os.listdir(abs_source_folder_path):
-                    item_path_to_check = os.path.join(abs_source_folder_path, item_name)
-                    abs_item_path_to_check = os.path.abspath(item_path_to_check)
-                    if os.path.normcase(abs_item_path_to_check) == normcase_abs_backup_dir_path:
-                        continue
-                    if os.path.normcase(abs_item_path_to_check) == normcase_abs_zip_file_path:
-                        continue
-                    if os.path.isfile(abs_item_path_to_check):
-                        if fnmatch.fnmatch(item_name, file_pattern): # Dosya deseni kontrolü
-                            # Exclusion kontrolü
-                            if exclusion_manager.should_exclude_file(item_name):
-                                continue
-                            zf.write(abs_item_path_to_check, item_name)
+            with ParallelZipWriter(zf, compresslevel=6, max_workers=compression_workers, cancel_token=cancel_token,
+                                   on_member_written=report_added, policy=compression_policy) as writer:
+                for file_path_to_add, arcname, file_size in files_to_add:
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
+                    add_file(writer, file_path_to_add, arcname, file_size)
+
+            # Silinen dosyalar ve temel yedek manifest'e yazılır; geri yükleme zinciri buradan çözülür
+            deleted_arcnames = set(base_snapshot) - seen_arcnames if base_zip_path is not None else set()
+            manifest = differential_backup.build_manifest(abs_source_folder_path, base_zip_path, deleted_arcnames,
+                                                          unchanged_count)
+            zf.writestr(differential_backup.MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2))
         
         print(f"🔧 DEBUG: Sıkıştırma tamamlandı: {abs_zip_file_path}")
-        app_instance.after(0, app_instance._handle_compression_success, folder_name, abs_zip_file_path, abs_backup_dir_path)
+        compression_stats = dict(writer.stats)
+        compression_stats["differential"] = {
+            "requested": differential,
+            "base": os.path.basename(base_zip_path) if base_zip_path else None,
+            "added": added_count,
+            "unchanged": unchanged_count,
+            "deleted": len(deleted_arcnames),
+        }
+        compression_stats["throughput"] = progress.snapshot()
+        compression_stats["throughput"]["zip_size"] = os.path.getsize(abs_zip_file_path)
+        app_instance.after(0, app_instance._handle_compression_success, folder_name, abs_zip_file_path, abs_backup_dir_path,
+                           compression_stats)
+
+    except OperationCancelled:
+        print(f"🔧 DEBUG: Sıkıştırma iptal edildi: {abs_zip_file_path}")
+        app_instance.after(0, app_instance._handle_compression_cancelled, folder_name, abs_zip_file_path)
 
     except Exception as e:
         print(f"🔧 DEBUG: Sıkıştırma hatası: {e}")
         app_instance.after(0, app_instance._handle_compression_error, folder_name, e, abs_zip_file_path)
 
+def perform_store_backup_in_thread(app_instance, abs_source_folder_path, include_subfolders, snapshot_name,
+                                   abs_store_path, normcase_abs_backup_dir_path, folder_name, file_pattern="*.*",
+                                   exclusion_pattern="", cancel_token=None, progress_callback=None,
+                                   compression_policy=None):
+    """Klasörü içerik adresli yedek deposuna (backup_store.BackupStore) anlık görüntü olarak kaydeder.
+    
+    Dosya seçimi ZIP yedeğiyle aynıdır; yalnızca depoda olmayan içerikler
+    sıkıştırılıp yazılır. Sonuç action_manager'a arayüz thread'inde iletilir.
+    """
+    exclusion_manager = ExclusionManager(exclusion_pattern)
+    store = BackupStore(abs_store_path)
+    print(f"🔧 DEBUG: Depo yedeği başladı: {abs_source_folder_path} -> {abs_store_path} ({snapshot_name})")
+    try:
+        files = ((file_path, arcname) for file_path, arcname, _size in
+                 iter_compression_files(abs_source_folder_path, include_subfolders, file_pattern, exclusion_manager,
+                                        None, normcase_abs_backup_dir_path, cancel_token))
+        stats = store.create_snapshot(snapshot_name, abs_source_folder_path, files, policy=compression_policy,
+                                      cancel_token=cancel_token, progress_callback=progress_callback)
+        print(f"🔧 DEBUG: Depo yedeği tamamlandı: {stats}")
+        app_instance.after(0, app_instance.action_manager._handle_store_backup_success, folder_name, snapshot_name,
+                           stats)
+    
+    except OperationCancelled:
+        print(f"🔧 DEBUG: Depo yedeği iptal edildi: {snapshot_name}")
+        app_instance.after(0, app_instance.action_manager._handle_compression_cancelled, folder_name, None)
+    
+    except Exception as e:
+        print(f"🔧 DEBUG: Depo yedeği hatası: {e}")
+        app_instance.after(0, app_instance.action_manager._handle_compression_error, folder_name, e, None)
+
 # --- EXE'ye Çevirme İşlemleri ---
-def perform_exe_conversion_in_thread(app_instance, py_file_path, pyinstaller_executable):
-    """PyInstaller kullanarak .py dosyasını .exe'ye çevirir."""
+def perform_exe_conversion_in_thread(app_instance, py_file_path, pyinstaller_executable, cancel_token=None,
+                                     progress_callback=None):
+    """PyInstaller kullanarak .py dosyasını .exe'ye çevirir.
+    
+    cancel_token iptal edilirse PyInstaller süreci sonlandırılır.
+    """
     py_file_dir = os.path.dirname(py_file_path)
     py_file_basename = os.path.basename(py_file_path)
     py_file_name_no_ext = os.path.splitext(py_file_basename)[0]
@@ -100,8 +253,20 @@ def perform_exe_conversion_in_thread(app_instance, py_file_path, pyinstaller_exe
             py_file_path
         ]
         
-        process = subprocess.run(cmd, capture_output=True, text=True, check=False, encoding='utf-8', 
-                                 creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0)
+        if progress_callback is not None:
+            progress_callback("PyInstaller çalışıyor...")
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8', 
+                                   creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0)
+        # Süreç bitene kadar iptal isteğini kontrol ederek bekle
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=0.2)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel_token is not None and cancel_token.is_cancelled:
+                    process.kill()
+                    process.communicate()
+                    raise OperationCancelled()
 
         if process.returncode == 0:
             exe_name = f"{py_file_name_no_ext}.exe"
@@ -109,12 +274,15 @@ def perform_exe_conversion_in_thread(app_instance, py_file_path, pyinstaller_exe
             if os.path.exists(final_exe_path):
                 app_instance.after(0, app_instance._handle_exe_conversion_success, py_file_basename, final_exe_path)
             else:
-                error_msg = f"PyInstaller başarıyla tamamlandı ancak beklenen EXE dosyası ({final_exe_path}) bulunamadı.\n\nPyInstaller Çıktısı:\n{process.stdout}\n{process.stderr}"
+                error_msg = f"PyInstaller başarıyla tamamlandı ancak beklenen EXE dosyası ({final_exe_path}) bulunamadı.\n\nPyInstaller Çıktısı:\n{stdout}\n{stderr}"
                 app_instance.after(0, app_instance._handle_exe_conversion_error, py_file_basename, error_msg)
         else:
-            error_msg = f"PyInstaller hatası (Kod: {process.returncode}):\n{process.stderr}\n\nStdout:\n{process.stdout}"
+            error_msg = f"PyInstaller hatası (Kod: {process.returncode}):\n{stderr}\n\nStdout:\n{stdout}"
             app_instance.after(0, app_instance._handle_exe_conversion_error, py_file_basename, error_msg)
 
+    except OperationCancelled:
+        print(f"🔧 DEBUG: EXE çevirme iptal edildi: {py_file_path}")
+        app_instance.after(0, app_instance._handle_exe_conversion_cancelled, py_file_basename)
     except Exception as e:
         app_instance.after(0, app_instance._handle_exe_conversion_error, py_file_basename, f"EXE çevirme sırasında beklenmedik hata: {e}")
     finally:
@@ -156,87 +324,258 @@ def perform_search_in_thread_OLD(app_instance, pattern, root_folder):
 
     app_instance.after(0, app_instance._show_search_results, found_files_details, pattern, root_folder)
 
-def perform_search_in_thread(app, search_pattern, search_root_folder, file_size=None, size_operator=None, search_in_excluded=False):
-    """Dosya aramayı thread içinde gerçekleştirir ve dosya boyutu filtresi uygular.
+def _build_search_result(file_path, file_size_bytes, mtime, exclusion_manager, search_root_folder):
+    """Dosya arama sonuç penceresinin beklediği sonuç sözlüğünü oluşturur.
+    
+    Exclusion bayrağı burada bir kez hesaplanır; sonuç penceresi sadece filtreler.
+    """
+    return {
+        'path': file_path,
+        'size_kb': round(file_size_bytes / 1024, 2),
+        'modified': datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S"),
+        'excluded': exclusion_manager.is_file_excluded(os.path.basename(file_path), file_path, search_root_folder)
+    }
+
+def _iter_excluded_dir_matches(file_index, search_root_folder, search_pattern, file_size=None, size_operator=None,
+                               cancel_token=None):
+    """İndekslenmeyen (hariç tutulan) klasörlerde desene ve boyut filtresine uyan dosyaları tarar.
+    
+    Hariç tutulan klasörler indekse alınmadığından yalnızca bu klasörlerde
+    de aranması istendiğinde diskten paralel olarak taranır.
+    
+    Yields:
+        tuple: (dosya_yolu, boyut_byte, mtime)
+    """
+    for excluded_dir in file_index.iter_excluded_dirs(search_root_folder):
+        for _dir_path, _dir_entries, file_entries in parallel_walk(excluded_dir, stat_files=False):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            for entry in file_entries:
+                # Boyut gerekmeden önce sadece adı kontrol et, stat'ı eşleşen dosyalar için al
+                if not file_index.matches(entry.name, 0, search_pattern):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if file_index.matches(entry.name, st.st_size, search_pattern, file_size, size_operator):
+                    yield entry.path, st.st_size, st.st_mtime
+
+def perform_search_in_thread(app, result_queue, search_pattern, search_root_folder, file_size=None, size_operator=None, search_in_excluded=False,
+                             cancel_token=None, progress_callback=None):
+    """Dosya aramayı thread içinde kalıcı dosya indeksi üzerinden gerçekleştirir.
+    
+    Bulunan dosyalar toplu halde (liste) result_queue kuyruğuna yazılır; arama
+    bittiğinde kuyruğa None gönderilir. Böylece sonuç penceresi ilk eşleşmeyi
+    arama bitmeden gösterebilir.
+    
+    Kök klasör daha önce indekslenmişse sonuçlar hemen indeksten gönderilir;
+    indeksin yenilenmesi ve sonuçların diskle doğrulanması ardından düşük
+    öncelikli bir arka plan işinde (refresh_search_results) yapılır ve
+    düzeltmeler aynı kuyruğa yazılır. İndeks yoksa oluşturulurken bulunan
+    eşleşmeler anında gönderilir. Boyut filtresi indeks üzerinde aralık
+    sorgusu olarak çalışır.
     
     Args:
+        result_queue: Sonuç gruplarının yazılacağı thread-safe kuyruk (queue.Queue)
         search_in_excluded: True ise hariç tutulan klasör ve dosyalarda da arar
+        cancel_token: Klasörler ve dosyalar arasında kontrol edilen CancellationToken.
+                      İptal edilirse o ana kadar bulunanlar gönderilir ve arama biter.
+        progress_callback: Her sonuç grubunda progress_callback(metin) ile bulunan
+                           dosya sayısını bildirir (opsiyonel).
     """
+    stats = {"count": 0, "first_result_seconds": None, "cancelled": False}
+    started_at = time.perf_counter()
+    batch = []
+    last_flush = [started_at]
+    shown = {} # Pencereye gönderilen sonuçlar (arka plan düzeltmeleri için)
+    
+    def flush(force=False):
+        """Biriken sonuçları kuyruğa gönderir (en geç SEARCH_BATCH_INTERVAL saniyede bir)."""
+        now = time.perf_counter()
+        if batch and (force or len(batch) >= SEARCH_BATCH_SIZE or now - last_flush[0] >= SEARCH_BATCH_INTERVAL):
+            if stats["first_result_seconds"] is None:
+                stats["first_result_seconds"] = now - started_at
+            result_queue.put(list(batch))
+            batch.clear()
+            last_flush[0] = now
+            if progress_callback is not None:
+                progress_callback(f"{stats['count']} dosya bulundu")
+    
     try:
-        found_files_details = []
-        
         # ExclusionManager oluştur
         global_exclusion = app.db.get_global_exclusion_list() or ""
         exclusion_manager = ExclusionManager(global_exclusion)
         
         print(f"🔧 DEBUG: Dosya arama başladı - search_in_excluded: {search_in_excluded}")
         
-        # Dosyaları tarar
-        for root, dirs, files in os.walk(search_root_folder, topdown=True):
-            # Hariç tutulan klasörleri atla (eğer search_in_excluded False ise)
-            if not search_in_excluded:
-                dirs[:] = [d for d in dirs if not exclusion_manager.should_exclude_dir(d)]
+        def add_result(file_path, file_size_bytes, mtime):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            file_info = _build_search_result(file_path, file_size_bytes, mtime, exclusion_manager, search_root_folder)
             
-            for file in files:
-                # Dosya adı desenini kontrol et
-                if fnmatch.fnmatch(file.lower(), search_pattern.lower()):
-                    file_path = os.path.join(root, file)
-                    
-                    # Hariç tutulan dosyaları atla (eğer search_in_excluded False ise)
-                    if not search_in_excluded and exclusion_manager.is_file_excluded(file, file_path, search_root_folder):
-                        continue
-                    
-                    # Dosya boyutu kontrolü (eğer belirtilmişse)
-                    if file_size is not None:
-                        try:
-                            file_size_kb = os.path.getsize(file_path) / 1024  # KB cinsine çevir
-                            
-                            if size_operator == "büyük" and file_size_kb <= file_size:
-                                continue
-                            elif size_operator == "eşit" and abs(file_size_kb - file_size) > 0.1:  # 0.1 KB tolerans
-                                continue
-                            elif size_operator == "küçük" and file_size_kb >= file_size:
-                                continue
-                        except OSError:
-                            continue  # Dosya boyutu alınamıyorsa atla
-                    
-                    try:
-                        # Dosya detaylarını topla
-                        stat = os.stat(file_path)
-                        file_size_bytes = stat.st_size
-                        file_size_kb = round(file_size_bytes / 1024, 2)
-                        modification_time = datetime.datetime.fromtimestamp(stat.st_mtime)
-                        
-                        found_files_details.append({
-                            'path': file_path,
-                            'size_kb': file_size_kb,
-                            'modified': modification_time.strftime("%Y-%m-%d %H:%M:%S")
-                        })
-                    except OSError:
-                        continue  # Dosya bilgileri alınamıyorsa atla
+            # Hariç tutulan dosyaları atla (eğer search_in_excluded False ise)
+            if file_info['excluded'] and not search_in_excluded:
+                return
+            
+            batch.append(file_info)
+            shown[file_path] = file_info
+            stats["count"] += 1
+            flush()
         
-        print(f"🔧 DEBUG: Dosya arama tamamlandı - {len(found_files_details)} dosya bulundu")
+        file_index = app.file_index
+        refresh_scheduled = False
+        if file_index.has_root(search_root_folder):
+            # Sonuçlar beklemeden indeksten gönderilir; yenileme arka planda yapılır
+            try:
+                for file_path, file_size_bytes, mtime in file_index.search(search_root_folder, search_pattern, file_size, size_operator):
+                    add_result(file_path, file_size_bytes, mtime)
+            except OperationCancelled:
+                stats["cancelled"] = True
+            flush(force=True)
+            
+            if not stats["cancelled"]:
+                # Yenileme işi aramadan sonra kuyruğa yazar ve aramayı None ile bitirir
+                app.job_scheduler.submit(
+                    f"İndeks yenileme: {os.path.basename(search_root_folder)}",
+                    lambda job: refresh_search_results(app, result_queue, shown, search_pattern, search_root_folder,
+                                                       file_size, size_operator, search_in_excluded, cancel_token,
+                                                       job.cancel_token, job.report_progress),
+                    priority=PRIORITY_LOW)
+                refresh_scheduled = True
+        else:
+            print(f"🔧 DEBUG: '{search_root_folder}' için dosya indeksi oluşturuluyor...")
+            
+            def on_files(rows):
+                # İndeks oluşturulurken her klasörün eşleşen dosyalarını hemen gönder
+                for file_path, name, size, mtime in rows:
+                    if file_index.matches(name, size, search_pattern, file_size, size_operator):
+                        add_result(file_path, size, mtime)
+                flush()
+            
+            try:
+                file_index.refresh(search_root_folder, on_files=on_files, cancel_token=cancel_token)
+                if search_in_excluded:
+                    # Hariç tutulan klasörler indekse alınmaz; istenirse diskten taranır
+                    for file_path, file_size_bytes, mtime in _iter_excluded_dir_matches(
+                            file_index, search_root_folder, search_pattern, file_size, size_operator, cancel_token):
+                        add_result(file_path, file_size_bytes, mtime)
+            except OperationCancelled:
+                stats["cancelled"] = True
+        flush(force=True)
         
-        # Ana thread'e sonucu gönder
-        def show_results():
-            app.search_manager._show_search_results(found_files_details, search_pattern, search_root_folder)
+        stats["elapsed_seconds"] = time.perf_counter() - started_at
+        print(f"🔧 DEBUG: Dosya arama {'iptal edildi' if stats['cancelled'] else 'tamamlandı'} - {stats['count']} dosya bulundu, "
+              f"ilk sonuç: {stats['first_result_seconds']} sn, toplam: {stats['elapsed_seconds']:.2f} sn")
         
-        app.after(0, show_results)
+        # Pencereye aramanın bittiğini bildir (yenileme işi varsa o bildirir), istatistikleri ana thread'e gönder
+        if not refresh_scheduled:
+            result_queue.put(None)
+        
+        def finish_search():
+            app.search_manager._on_search_finished(search_pattern, search_root_folder, stats, result_queue)
+        
+        app.after(0, finish_search)
         
     except Exception as e:
         # Hata mesajını yakalayıp güvenli şekilde gönder
         error_message = str(e)
         def handle_error():
-            app.search_manager._handle_search_error(error_message)
+            app.search_manager._handle_search_error(error_message, result_queue)
         
         app.after(0, handle_error)
 
+def refresh_search_results(app, result_queue, shown, search_pattern, search_root_folder, file_size=None, size_operator=None,
+                           search_in_excluded=False, search_cancel_token=None, cancel_token=None, progress_callback=None):
+    """İndeksten gösterilen dosya arama sonuçlarını arka planda diskle eşitler.
+    
+    Kökün indeksi yenilenir (yalnızca mtime değeri değişen klasörler), desene
+    uyan dosyalar diskle doğrulanır ve sorgu tekrarlanır. Yeni bulunan
+    dosyalar sonuç grubu olarak, silinen veya boyutu/tarihi değişen dosyalar
+    ise {'removed': yollar, 'updated': sonuçlar} düzeltme sözlüğü olarak
+    result_queue kuyruğuna yazılır. Hariç tutulanlarda da aranıyorsa
+    indekslenmeyen hariç tutulan klasörler de taranır. Sonunda (hata veya
+    iptal durumunda da) kuyruğa None yazılır.
+    
+    Args:
+        shown: Pencereye gönderilmiş sonuçlar ({dosya_yolu: sonuç sözlüğü}).
+        search_cancel_token: Aramanın CancellationToken'ı; sonuç penceresinden arama
+                             durdurulursa düzeltmeler de durur (opsiyonel).
+        cancel_token: Bu işin CancellationToken'ı (opsiyonel).
+        progress_callback: İşin ilerlemesini progress_callback(metin) ile bildirir (opsiyonel).
+    """
+    def raise_if_cancelled():
+        for token in (search_cancel_token, cancel_token):
+            if token is not None:
+                token.raise_if_cancelled()
+    
+    try:
+        raise_if_cancelled()
+        exclusion_manager = ExclusionManager(app.db.get_global_exclusion_list() or "")
+        file_index = app.file_index
+        
+        if progress_callback is not None:
+            progress_callback("Dosya indeksi güncelleniyor...")
+        file_index.refresh(search_root_folder, cancel_token=cancel_token)
+        raise_if_cancelled()
+        # Yerinde düzenlenen dosyalar klasör mtime değerini değiştirmez; desene uyan
+        # dosyaların boyutları boyut filtresinden önce diskle doğrulanır
+        file_index.verify_files(search_root_folder,
+                                [path for path, _size, _mtime in file_index.search(search_root_folder, search_pattern)],
+                                cancel_token)
+        raise_if_cancelled()
+        
+        current = {}
+        for file_path, file_size_bytes, mtime in file_index.search(search_root_folder, search_pattern, file_size, size_operator):
+            file_info = _build_search_result(file_path, file_size_bytes, mtime, exclusion_manager, search_root_folder)
+            if file_info['excluded'] and not search_in_excluded:
+                continue
+            current[file_path] = file_info
+        
+        removed = [path for path in shown if path not in current]
+        updated = [file_info for path, file_info in current.items()
+                   if path in shown and (shown[path]['size_kb'], shown[path]['modified']) != (file_info['size_kb'], file_info['modified'])]
+        added = [file_info for path, file_info in current.items() if path not in shown]
+        if removed or updated:
+            result_queue.put({'removed': removed, 'updated': updated})
+        for start in range(0, len(added), SEARCH_BATCH_SIZE):
+            result_queue.put(added[start:start + SEARCH_BATCH_SIZE])
+        print(f"🔧 DEBUG: Arama sonuçları indeksle eşitlendi - {len(added)} yeni, {len(removed)} silinen, "
+              f"{len(updated)} değişen dosya")
+        
+        if search_in_excluded:
+            # Hariç tutulan klasörler indekse alınmaz; istenirse diskten taranır
+            if progress_callback is not None:
+                progress_callback("Hariç tutulan klasörler taranıyor...")
+            batch = []
+            for file_path, file_size_bytes, mtime in _iter_excluded_dir_matches(
+                    file_index, search_root_folder, search_pattern, file_size, size_operator, cancel_token):
+                raise_if_cancelled()
+                batch.append(_build_search_result(file_path, file_size_bytes, mtime, exclusion_manager, search_root_folder))
+                if len(batch) >= SEARCH_BATCH_SIZE:
+                    result_queue.put(batch)
+                    batch = []
+            if batch:
+                result_queue.put(batch)
+    finally:
+        result_queue.put(None)
+
 # --- Kelime Arama İşlemleri ---
-def perform_word_search_in_thread(app, search_word, search_root_folder, file_size=None, size_operator=None, search_in_excluded=False):
+def perform_word_search_in_thread(app, search_word, search_root_folder, file_size=None, size_operator=None, search_in_excluded=False,
+                                  cancel_token=None, progress_callback=None):
     """Kelime aramayı thread içinde gerçekleştirir ve dosya boyutu filtresi uygular.
     
+    .py dosyaları kalıcı dosya indeksinden alınır. İçerik trigram indeksi
+    sayesinde sadece kelimeyi içerebilecek aday dosyalar açılıp satır satır
+    doğrulanır; sonuçlar tüm dosyaları taramakla aynıdır. Hariç tutulan
+    klasörler indekste olmadığından, bu klasörlerde de aranıyorsa dosyaları
+    diskten taranır ve hepsi açılır.
+    
     Args:
         search_in_excluded: True ise hariç tutulan klasör ve dosyalarda da arar
+        cancel_token: Klasörler ve dosyalar arasında kontrol edilen CancellationToken (opsiyonel)
+        progress_callback: İncelenen aday dosya ve eşleşme sayısını progress_callback(metin)
+                           ile bildirir (opsiyonel)
     """
     try:
         found_items = []
@@ -247,44 +586,91 @@ def perform_word_search_in_thread(app, search_word, search_root_folder, file_siz
         
         print(f"🔧 DEBUG: Kelime arama başladı - search_in_excluded: {search_in_excluded}")
         
-        # Python dosyalarını tarar
-        for root, dirs, files in os.walk(search_root_folder, topdown=True):
-            # Hariç tutulan klasörleri atla (eğer search_in_excluded False ise)
-            if not search_in_excluded:
-                dirs[:] = [d for d in dirs if not exclusion_manager.should_exclude_dir(d)]
+        file_index = app.file_index
+        if progress_callback is not None:
+            progress_callback("Dosya indeksi yenileniyor...")
+        file_index.refresh(search_root_folder, cancel_token=cancel_token)
+        
+        # Python dosyalarını klasör ağacı sırasıyla (önce klasörün kendi dosyaları, sonra alt klasörler) listele.
+        # Hariç tutulan klasörler indekse alınmadığından bu dosyaların hiçbiri hariç tutulan bir klasörde değildir.
+        py_files = sorted(
+            ((file_path, dir_path, file, size, mtime)
+             for file_path, dir_path, file, size, mtime, _lines in file_index.iter_files(search_root_folder)
+             if file.endswith('.py')),
+            key=lambda item: (os.path.normcase(item[1]).split(os.sep), os.path.normcase(item[2])))
+        
+        # Yerinde düzenlenen dosyalar klasör mtime değerini değiştirmez; boyut filtresi ve içerik
+        # imzaları güncel değerlerle çalışsın diye .py dosyaları diskle doğrulanır
+        changes = file_index.verify_files(search_root_folder, [item[0] for item in py_files], cancel_token)
+        if changes:
+            verified_files = []
+            for file_path, dir_path, file, size, mtime in py_files:
+                if file_path in changes:
+                    if changes[file_path] is None:
+                        continue  # Dosya silinmiş
+                    size, mtime = changes[file_path]
+                verified_files.append((file_path, dir_path, file, size, mtime))
+            py_files = verified_files
+        
+        searchable_files = []
+        excluded_files = set() # Hariç tutulanlarda da aranıyorsa, hariç tutulan dosyalar
+        for file_path, _dir_path, file, size, mtime in py_files:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            # Exclusion bayrağı dosya başına bir kez hesaplanır ve sonuçlarla birlikte gönderilir
+            if exclusion_manager.is_file_excluded(file, file_path, search_root_folder):
+                # Hariç tutulan dosyaları atla (eğer search_in_excluded False ise)
+                if not search_in_excluded:
+                    continue
+                excluded_files.add(file_path)
             
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    
-                    # Hariç tutulan dosyaları atla (eğer search_in_excluded False ise)
-                    if not search_in_excluded and exclusion_manager.is_file_excluded(file, file_path, search_root_folder):
-                        continue
-                    
-                    # Dosya boyutu kontrolü (eğer belirtilmişse)
-                    if file_size is not None:
-                        try:
-                            file_size_kb = os.path.getsize(file_path) / 1024  # KB cinsine çevir
-                            
-                            if size_operator == "büyük" and file_size_kb <= file_size:
-                                continue
-                            elif size_operator == "eşit" and abs(file_size_kb - file_size) > 0.1:  # 0.1 KB tolerans
-                                continue
-                            elif size_operator == "küçük" and file_size_kb >= file_size:
-                                continue
-                        except OSError:
-                            continue  # Dosya boyutu alınamıyorsa atla
+            # Dosya boyutu kontrolü (eğer belirtilmişse)
+            if file_size is not None:
+                file_size_kb = size / 1024  # KB cinsine çevir
+                
+                if size_operator == "büyük" and file_size_kb <= file_size:
+                    continue
+                elif size_operator == "eşit" and abs(file_size_kb - file_size) > 0.1:  # 0.1 KB tolerans
+                    continue
+                elif size_operator == "küçük" and file_size_kb >= file_size:
+                    continue
+            
+            # Boyut ve mtime indeksten gelir; yukarıda diskle doğrulandı
+            searchable_files.append((file_path, size, mtime))
+        
+        # İndeksteki dosyalardan sadece adaylar açılır
+        candidate_files = file_index.content_candidates(search_root_folder, searchable_files, search_word, cancel_token)
+        if search_in_excluded:
+            # Hariç tutulan klasörlerin içerik imzası yoktur; .py dosyalarının hepsi aday sayılır
+            if progress_callback is not None:
+                progress_callback("Hariç tutulan klasörler taranıyor...")
+            for file_path, _size, _mtime in _iter_excluded_dir_matches(file_index, search_root_folder, "*.py", file_size,
+                                                                          size_operator, cancel_token):
+                if not file_path.endswith('.py'):
+                    continue
+                candidate_files.append(file_path)
+                excluded_files.add(file_path)
+        
+        # Sadece aday dosyaları aç ve satırları doğrula
+        search_word_lower = search_word.lower()
+        checked_count = 0
+        for file_path in candidate_files:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            checked_count += 1
+            if progress_callback is not None:
+                progress_callback(f"{checked_count} aday dosya, {len(found_items)} eşleşme")
+            try:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    lines = f.readlines()
                     
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = f.readlines()
-                            
-                        for line_num, line in enumerate(lines, 1):
-                            if search_word.lower() in line.lower():
-                                # UI_dialogs.py'nin beklediği tuple formatında ekle
-                                found_items.append((file_path, line_num, line.strip()))
-                    except (UnicodeDecodeError, PermissionError, FileNotFoundError):
-                        continue  # Dosya okunamıyorsa atla
+                is_excluded = file_path in excluded_files
+                for line_num, line in enumerate(lines, 1):
+                    if search_word_lower in line.lower():
+                        # UI_dialogs.py'nin beklediği tuple formatında ekle
+                        found_items.append((file_path, line_num, line.strip(), is_excluded))
+            except (UnicodeDecodeError, PermissionError, FileNotFoundError):
+                continue  # Dosya okunamıyorsa atla
         
         print(f"🔧 DEBUG: Kelime arama tamamlandı - {len(found_items)} eşleşme bulundu")
         
@@ -294,6 +680,10 @@ def perform_word_search_in_thread(app, search_word, search_root_folder, file_siz
         
         app.after(0, show_word_results)
         
+    except OperationCancelled:
+        print("🔧 DEBUG: Kelime arama iptal edildi")
+        app.after(0, app.search_manager._handle_word_search_cancelled)
+        
     except Exception as e:
         # Hata mesajını yakalayıp güvenli şekilde gönder
         error_message = str(e)
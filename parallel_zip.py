@@ -0,0 +1,484 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel Zip - Paralel ZIP Sıkıştırma Modülü
+
+zipfile.ZipFile.write dosyaları tek thread'de sırayla sıkıştırır. Bu modül
+dosya üyelerini bir thread havuzunda birbirinden bağımsız DEFLATE akışları
+olarak sıkıştırır; tek bir yazıcı (çağıran thread) bu hazır akışları
+sırasıyla ZIP dosyasına ekler. zlib sıkıştırma sırasında GIL'i bıraktığından
+thread'ler gerçekten paralel çalışır ve hız çekirdek sayısıyla artar.
+
+Üretilen dosya standart bir ZIP'tir; zipfile ve show_zip_contents ile
+okunabilir.
+
+CompressionPolicy verilirse zaten sıkıştırılmış dosyalar (zip, mp3, png,
+exe, db, ...) uzantıya ve ilk bloğun entropisine göre ZIP_STORED olarak,
+sıkıştırılmadan eklenir; DEFLATE bu dosyalarda neredeyse hiç kazanç
+sağlamadan CPU zamanının çoğunu harcar.
+
+Hazır akışlar zipfile'ın belgelenmemiş iç alanları (fp, start_dir,
+_writecheck, ...) üzerinden yazılır. Bu alanların denendiği Python
+sürümlerinin (SPLICE_PYTHON_VERSIONS) dışında veya alanlar bulunamazsa
+üyeler ZipFile.write ile tek thread'de yazılır; sonuç yine aynı ZIP'tir.
+
+Kullanım:
+    import zipfile
+    from parallel_zip import ParallelZipWriter
+
+    with zipfile.ZipFile("yedek.zip", "w", zipfile.ZIP_DEFLATED) as zf:
+        with ParallelZipWriter(zf, compresslevel=6) as writer:
+            for path, arcname in files:
+                writer.add(path, arcname)
+        print(writer.stats["stored_members"])
+"""
+
+import os
+import sys
+import math
+import time
+import zlib
+import zipfile
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+DEFAULT_COMPRESSION_WORKERS = os.cpu_count() or 1
+READ_CHUNK_SIZE = 1024 * 1024            # Dosyalar bu boyutta parçalar halinde okunur
+SPOOL_MAX_MEMORY = 16 * 1024 * 1024      # Bundan büyük sıkıştırılmış akışlar geçici dosyaya taşar
+PENDING_PER_WORKER = 4                   # Yazılmayı bekleyen en fazla üye sayısı (worker başına)
+
+# Hazır akışların zipfile iç alanları üzerinden yazılmasının denendiği Python sürümleri (dahil)
+SPLICE_PYTHON_VERSIONS = ((3, 7), (3, 13))
+_SPLICE_ATTRIBUTES = ("fp", "start_dir", "filelist", "NameToInfo", "_writecheck", "_didModify", "_allowZip64")
+
+# Sıkıştırma politikası varsayılanları
+ENTROPY_PROBE_SIZE = 16 * 1024           # Entropisi ölçülecek ilk blok boyutu
+ENTROPY_STORE_THRESHOLD = 7.5            # Bayt başına bit; bunun üzerindeki dosyalar sıkıştırılmaz
+MIN_PROBE_FILE_SIZE = 4 * 1024           # Bundan küçük dosyalarda entropi ölçümü anlamsızdır, sıkıştırılır
+
+# Zaten sıkıştırılmış formatlar: DEFLATE burada neredeyse hiç kazanç sağlamaz
+STORED_EXTENSIONS = frozenset({
+    # Arşivler
+    ".zip", ".7z", ".rar", ".gz", ".tgz", ".bz2", ".xz", ".lzma", ".zst", ".cab", ".jar", ".whl", ".egg",
+    ".apk", ".nupkg",
+    # Ses / video
+    ".mp3", ".aac", ".m4a", ".ogg", ".opus", ".flac", ".wma", ".mp4", ".m4v", ".mkv", ".avi", ".mov",
+    ".webm", ".wmv",
+    # Görüntü
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".heic", ".avif",
+    # Belgeler (içi ZIP olan ofis dosyaları dahil)
+    ".pdf", ".docx", ".xlsx", ".pptx", ".odt", ".ods", ".odp", ".epub",
+    # Derlenmiş / paketlenmiş dosyalar ve veritabanları
+    ".exe", ".dll", ".pyd", ".so", ".msi", ".db", ".sqlite", ".sqlite3",
+})
+
+
+def shannon_entropy(block):
+    """Bloğun bayt başına Shannon entropisini (0-8 bit) döndürür."""
+    if not block:
+        return 0.0
+    length = len(block)
+    entropy = 0.0
+    for byte_value in range(256):
+        count = block.count(byte_value)
+        if count:
+            probability = count / length
+            entropy -= probability * math.log2(probability)
+    return entropy
+
+
+class CompressionPolicy:
+    """Her dosya için ZIP_STORED veya ZIP_DEFLATED seçen politika.
+
+    Uzantısı STORED_EXTENSIONS içinde olan dosyalar doğrudan saklanır. Diğer
+    dosyalarda ilk bloğun entropisi ölçülür; rastgele veriye yakın (zaten
+    sıkıştırılmış veya şifrelenmiş) içerik saklanır.
+
+    Attributes:
+        stored_extensions: Her zaman saklanacak uzantılar (küçük harf, noktalı).
+        entropy_threshold: Bayt başına bit cinsinden saklama eşiği.
+    """
+
+    def __init__(self, stored_extensions=STORED_EXTENSIONS, entropy_threshold=ENTROPY_STORE_THRESHOLD):
+        """CompressionPolicy'yi başlatır.
+
+        Args:
+            stored_extensions: Her zaman saklanacak uzantılar.
+            entropy_threshold: Bayt başına bit cinsinden saklama eşiği.
+        """
+        self.stored_extensions = frozenset(ext.lower() for ext in stored_extensions)
+        self.entropy_threshold = entropy_threshold
+
+    def choose(self, file_name, first_block):
+        """Dosya için sıkıştırma yöntemini seçer.
+
+        Args:
+            file_name: Dosya adı (uzantı kontrolü için).
+            first_block: Dosyanın ilk bloğu (en fazla ENTROPY_PROBE_SIZE bayt kullanılır).
+
+        Returns:
+            int: zipfile.ZIP_STORED veya zipfile.ZIP_DEFLATED.
+        """
+        if os.path.splitext(file_name)[1].lower() in self.stored_extensions:
+            return zipfile.ZIP_STORED
+        probe = first_block[:ENTROPY_PROBE_SIZE]
+        if len(probe) >= MIN_PROBE_FILE_SIZE and shannon_entropy(probe) >= self.entropy_threshold:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+
+def _format_bytes(size_bytes):
+    """Bayt sayısını kısa, okunabilir biçimde döndürür (örn: '12.3 MB')."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size_bytes < 1024 or unit == "GB":
+            return f"{size_bytes:.0f} {unit}" if unit == "B" else f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024
+
+
+def _format_duration(seconds):
+    """Süreyi 'sa:dd:ss' veya 'dd:ss' biçiminde döndürür."""
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+class CompressionProgress:
+    """Ön tarama toplamlarına göre sıkıştırma ilerlemesini, hızını ve kalan süreyi hesaplar.
+
+    ParallelZipWriter'ın on_member_written bildirimiyle beslenir. Fark
+    yedeğinde yazılmayan dosyalar skip() ile işlenmiş sayılır.
+
+    Attributes:
+        total_files: Ön taramada bulunan dosya sayısı.
+        total_bytes: Ön taramada bulunan toplam bayt.
+        files_done: İşlenen (yazılan veya atlanan) dosya sayısı.
+        bytes_done: İşlenen toplam bayt.
+        compressed_bytes: Yazılan üyelerin ZIP içindeki toplam boyutu.
+        written_bytes: Yazılan üyelerin sıkıştırılmamış toplam boyutu.
+    """
+
+    def __init__(self, total_files, total_bytes):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.files_done = 0
+        self.bytes_done = 0
+        self.compressed_bytes = 0
+        self.written_bytes = 0
+        self.started_at = time.perf_counter()
+
+    def member_written(self, zinfo):
+        """Yazılan bir ZIP üyesini sayar."""
+        self.files_done += 1
+        self.bytes_done += zinfo.file_size
+        self.written_bytes += zinfo.file_size
+        self.compressed_bytes += zinfo.compress_size
+
+    def skip(self, size):
+        """Yazılmadan geçilen (değişmemiş) bir dosyayı işlenmiş sayar."""
+        self.files_done += 1
+        self.bytes_done += size
+
+    def snapshot(self):
+        """Anlık ölçümleri döndürür.
+
+        Returns:
+            dict: 'elapsed_seconds', 'files_done', 'total_files', 'bytes_done',
+                  'total_bytes', 'bytes_per_second', 'files_per_second',
+                  'eta_seconds' (bilinmiyorsa None), 'compression_ratio'
+                  (sıkıştırılmış / orijinal, yazılan üye yoksa None) ve 'fraction'.
+        """
+        elapsed = max(time.perf_counter() - self.started_at, 1e-6)
+        bytes_per_second = self.bytes_done / elapsed
+        files_per_second = self.files_done / elapsed
+        if self.total_bytes:
+            fraction = min(self.bytes_done / self.total_bytes, 1.0)
+        elif self.total_files:
+            fraction = min(self.files_done / self.total_files, 1.0)
+        else:
+            fraction = 1.0
+        eta_seconds = None
+        if bytes_per_second > 0 and self.total_bytes:
+            eta_seconds = max(self.total_bytes - self.bytes_done, 0) / bytes_per_second
+        elif files_per_second > 0 and self.total_files:
+            eta_seconds = max(self.total_files - self.files_done, 0) / files_per_second
+        return {
+            "elapsed_seconds": elapsed,
+            "files_done": self.files_done,
+            "total_files": self.total_files,
+            "bytes_done": self.bytes_done,
+            "total_bytes": self.total_bytes,
+            "bytes_per_second": bytes_per_second,
+            "files_per_second": files_per_second,
+            "eta_seconds": eta_seconds,
+            "compression_ratio": self.compressed_bytes / self.written_bytes if self.written_bytes else None,
+            "fraction": fraction,
+        }
+
+    def format_text(self):
+        """İşler paneli için ilerleme metnini oluşturur."""
+        metrics = self.snapshot()
+        text = (f"{metrics['files_done']}/{metrics['total_files']} dosya, "
+                f"{_format_bytes(metrics['bytes_per_second'])}/sn, {metrics['files_per_second']:.1f} dosya/sn")
+        if metrics["eta_seconds"] is not None:
+            text += f", kalan ~{_format_duration(metrics['eta_seconds'])}"
+        if metrics["compression_ratio"] is not None:
+            text += f", oran %{metrics['compression_ratio'] * 100:.0f}"
+        return text
+
+
+def splice_supported(zip_file):
+    """Hazır akışların bu Python sürümünde ve bu ZipFile üzerinde doğrudan yazılıp yazılamayacağını döndürür."""
+    oldest, newest = SPLICE_PYTHON_VERSIONS
+    if not oldest <= sys.version_info[:2] <= newest:
+        return False
+    return all(hasattr(zip_file, name) for name in _SPLICE_ATTRIBUTES)
+
+
+class _CompressedMember:
+    """Bir worker'ın sıkıştırdığı, yazılmaya hazır ZIP üyesi."""
+
+    def __init__(self, zinfo, data_file, file_path):
+        self.zinfo = zinfo
+        self.data_file = data_file
+        self.file_path = file_path
+
+
+class ParallelZipWriter:
+    """Dosyaları thread havuzunda sıkıştırıp tek yazıcıyla ZIP'e ekleyen sınıf.
+
+    Üyeler eklenme sırasıyla yazılır. Bellek kullanımını sınırlamak için
+    yazılmayı bekleyen üye sayısı max_workers * PENDING_PER_WORKER ile
+    sınırlıdır; büyük sıkıştırılmış akışlar geçici dosyada tutulur. Hazır
+    akışlar yazılamıyorsa (splice_supported) üyeler ZipFile.write ile sırayla
+    eklenir.
+
+    Attributes:
+        zip_file: Yazma modunda açılmış zipfile.ZipFile.
+        compresslevel: DEFLATE seviyesi (0-9).
+        max_workers: Sıkıştırma thread sayısı.
+        cancel_token: Okuma ve yazma arasında kontrol edilen CancellationToken (opsiyonel).
+        on_member_written: Her üye yazıldıktan sonra ZipInfo ile çağrılır (opsiyonel).
+        policy: Üye başına STORED/DEFLATED seçen CompressionPolicy (None: hepsi sıkıştırılır).
+        stats: 'stored_members', 'stored_bytes', 'deflated_bytes' ve
+               'estimated_saved_seconds' (saklanan dosyaları sıkıştırmanın
+               tahmini süresi) anahtarlı sözlük.
+    """
+
+    def __init__(self, zip_file, compresslevel=6, max_workers=None, cancel_token=None, on_member_written=None,
+                 policy=None):
+        """ParallelZipWriter'ı başlatır.
+
+        Args:
+            zip_file: Yazma modunda açılmış zipfile.ZipFile.
+            compresslevel: DEFLATE seviyesi (0-9).
+            max_workers: Sıkıştırma thread sayısı (varsayılan DEFAULT_COMPRESSION_WORKERS).
+            cancel_token: İptal kontrolü için CancellationToken (opsiyonel).
+            on_member_written: Her üye yazıldığında çağrılacak fonksiyon (opsiyonel).
+            policy: Üye başına sıkıştırma yöntemi seçen CompressionPolicy (opsiyonel).
+        """
+        self.zip_file = zip_file
+        self.compresslevel = compresslevel
+        self.max_workers = max_workers or DEFAULT_COMPRESSION_WORKERS
+        self.cancel_token = cancel_token
+        self.on_member_written = on_member_written
+        self.policy = policy
+        self.stats = {"stored_members": [], "stored_bytes": 0, "deflated_bytes": 0, "estimated_saved_seconds": 0.0}
+        self._stats_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="zip")
+        self._pending = deque()
+        self._splice = splice_supported(zip_file)
+        if not self._splice:
+            print(f"🔸 UYARI: Python {sys.version_info[0]}.{sys.version_info[1]} için paralel ZIP yazımı "
+                  "denenmedi, dosyalar sırayla sıkıştırılacak")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.finish()
+        else:
+            self.abort()
+        return False
+
+    def add(self, file_path, arcname):
+        """Dosyayı sıkıştırılmak üzere kuyruğa ekler.
+
+        Bekleyen üye sayısı sınırı aşarsa en eski üye yazılana kadar bekler.
+
+        Args:
+            file_path: Eklenecek dosyanın yolu.
+            arcname: Dosyanın ZIP içindeki adı.
+        """
+        self._check_cancelled()
+        if not self._splice:
+            self._write_with_zipfile(file_path, arcname)
+            return
+        self._pending.append(self._executor.submit(self._compress_member, file_path, arcname))
+        while len(self._pending) >= self.max_workers * PENDING_PER_WORKER:
+            self._write_next()
+
+    def finish(self):
+        """Bekleyen tüm üyeleri yazar ve thread havuzunu kapatır."""
+        try:
+            while self._pending:
+                self._write_next()
+        except BaseException:
+            self.abort()
+            raise
+        self._executor.shutdown(wait=True)
+
+    def abort(self):
+        """Bekleyen üyeleri iptal eder, geçici dosyaları temizler ve havuzu kapatır."""
+        for future in self._pending:
+            future.cancel()
+        for future in self._pending:
+            if not future.cancelled():
+                try:
+                    future.result().data_file.close()
+                except BaseException:
+                    pass
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+
+    def _check_cancelled(self):
+        """İptal istenmişse OperationCancelled fırlatır."""
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+
+    def _compress_member(self, file_path, arcname):
+        """Dosyayı bağımsız bir DEFLATE akışına sıkıştırır veya olduğu gibi saklar (worker thread'i).
+
+        Returns:
+            _CompressedMember: CRC ve boyutları doldurulmuş ZipInfo ve (sıkıştırılmış) veri.
+        """
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        data_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+        crc = 0
+        file_size = 0
+        try:
+            with open(file_path, "rb") as src:
+                chunk = src.read(READ_CHUNK_SIZE)
+                if self.policy is not None:
+                    zinfo.compress_type = self.policy.choose(os.path.basename(file_path), chunk)
+                else:
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                compressor = None
+                if zinfo.compress_type == zipfile.ZIP_DEFLATED:
+                    compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, -15)
+                while chunk:
+                    self._check_cancelled()
+                    file_size += len(chunk)
+                    crc = zlib.crc32(chunk, crc)
+                    data_file.write(compressor.compress(chunk) if compressor is not None else chunk)
+                    chunk = src.read(READ_CHUNK_SIZE)
+            if compressor is not None:
+                data_file.write(compressor.flush())
+        except BaseException:
+            data_file.close()
+            raise
+
+        zinfo.file_size = file_size
+        zinfo.CRC = crc
+        zinfo.compress_size = data_file.tell()
+        data_file.seek(0)
+        self._record_member_stats(zinfo, file_path)
+        return _CompressedMember(zinfo, data_file, file_path)
+
+    def _record_member_stats(self, zinfo, file_path):
+        """Saklanan/sıkıştırılan bayt sayılarını ve kazanılan tahmini süreyi kaydeder.
+
+        Saklanan bir dosyanın sıkıştırılma süresi, ilk bloğunun sıkıştırılma
+        süresinden dosya boyutuna oranlanarak tahmin edilir.
+        """
+        saved_seconds = 0.0
+        if zinfo.compress_type == zipfile.ZIP_STORED and zinfo.file_size:
+            try:
+                with open(file_path, "rb") as src:
+                    probe = src.read(ENTROPY_PROBE_SIZE)
+            except OSError:
+                probe = b""
+            if probe:
+                started_at = time.perf_counter()
+                zlib.compress(probe, self.compresslevel)
+                saved_seconds = (time.perf_counter() - started_at) * zinfo.file_size / len(probe)
+
+        with self._stats_lock:
+            if zinfo.compress_type == zipfile.ZIP_STORED:
+                self.stats["stored_members"].append(zinfo.filename)
+                self.stats["stored_bytes"] += zinfo.file_size
+                self.stats["estimated_saved_seconds"] += saved_seconds
+            else:
+                self.stats["deflated_bytes"] += zinfo.file_size
+
+    def _write_next(self):
+        """Sıradaki sıkıştırılmış üyeyi bekler ve ZIP dosyasına ekler."""
+        future = self._pending.popleft()
+        member = future.result()
+        try:
+            self._check_cancelled()
+            if self._splice:
+                try:
+                    self._splice_member(member)
+                except AttributeError as e:
+                    # zipfile iç yapısı değişmiş; bu ve sonraki üyeler ZipFile.write ile yazılır
+                    print(f"🔸 UYARI: Paralel ZIP yazımı desteklenmiyor ({e}), dosyalar sırayla sıkıştırılacak")
+                    self._splice = False
+            if not self._splice:
+                self._write_with_zipfile(member.file_path, member.zinfo.filename, member.zinfo.compress_type)
+                return
+        finally:
+            member.data_file.close()
+        if self.on_member_written is not None:
+            self.on_member_written(member.zinfo)
+
+    def _write_with_zipfile(self, file_path, arcname, compress_type=None):
+        """Dosyayı ZipFile.write ile (çağıran thread'de) ekler; doğrudan yazım desteklenmediğinde kullanılır."""
+        if compress_type is None:
+            compress_type = zipfile.ZIP_DEFLATED
+            if self.policy is not None:
+                with open(file_path, "rb") as src:
+                    compress_type = self.policy.choose(os.path.basename(file_path), src.read(READ_CHUNK_SIZE))
+            stats_pending = True
+        else:
+            stats_pending = False # Worker'da sıkıştırılırken zaten sayıldı
+        self.zip_file.write(file_path, arcname, compress_type=compress_type, compresslevel=self.compresslevel)
+        zinfo = self.zip_file.filelist[-1]
+        if stats_pending:
+            self._record_member_stats(zinfo, file_path)
+        if self.on_member_written is not None:
+            self.on_member_written(zinfo)
+
+    def _splice_member(self, member):
+        """Hazır DEFLATE akışını yerel başlığıyla birlikte ZIP dosyasına yazar.
+
+        zipfile'ın kendi yazma yolunda (ZipFile.open(..., 'w')) yaptığı kayıt
+        işlemleri burada tekrarlanır; CRC ve boyutlar önceden bilindiği için
+        başlık tek seferde doğru yazılır.
+        """
+        zf = self.zip_file
+        zinfo = member.zinfo
+        zinfo.flag_bits = 0x00
+        if not zinfo.external_attr:
+            zinfo.external_attr = 0o600 << 16
+
+        zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+        if zip64 and not zf._allowZip64:
+            raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+
+        zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.fp.tell()
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zf.fp.write(zinfo.FileHeader(zip64))
+        while True:
+            chunk = member.data_file.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            zf.fp.write(chunk)
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
@@ -11,6 +11,9 @@ from datetime import datetime
 import importlib.util
 from typing import Dict, List, Set, Tuple
 
+from cancellation import OperationCancelled
+from job_scheduler import PRIORITY_NORMAL
+
 # Modern alternatif: importlib.metadata (Python 3.8+)
 try:
     from importlib.metadata import distributions
@@ -21,7 +24,11 @@ except ImportError:
 
 
 class DependencyAnalyzer:
-    def __init__(self):
+    # Yerel modül taramasında atlanacak klasörler
+    SKIPPED_DIRS = {'__pycache__', '.git', '.vscode', 'venv', '.venv', 'env', '__pypackages__'}
+
+    def __init__(self, file_index=None):
+        self.file_index = file_index  # Varsa kalıcı dosya indeksi (FileIndex) üzerinden tarama yapılır
         self.builtin_modules = set(sys.builtin_module_names)
         self.stdlib_modules = self._get_stdlib_modules()
         self.installed_packages = self._get_installed_packages()
@@ -73,20 +80,10 @@ class DependencyAnalyzer:
             if module_name != '__init__':  # __init__.py dosyalarını hariç tut
                 local_modules.add(module_name)
         
-        # Alt klasörlerdeki tüm Python dosyalarını da yerel modül olarak ekle
-        if base_dir:
-            for root, dirs, files in os.walk(base_dir):
-                # __pycache__, .git, venv gibi klasörleri atla
-                dirs[:] = [d for d in dirs if d not in ['__pycache__', '.git', '.vscode', 'venv', '.venv', 'env', '__pypackages__']]
-                
-                for file in files:
-                    if file.endswith('.py') and file != '__init__.py':
-                        module_name = os.path.splitext(file)[0]
-                        local_modules.add(module_name)
-                
-                # Alt klasör isimlerini de yerel modül olarak ekle (paket olabilirler)
-                for dir_name in dirs:
-                    local_modules.add(dir_name)
+        # Alt klasörlerdeki tüm Python dosyalarını ve klasör isimlerini (paket olabilirler) yerel modül olarak ekle
+        local_file_names, local_dir_names = self._collect_local_names(base_dir) if base_dir else (set(), set())
+        local_modules.update(os.path.splitext(name)[0] for name in local_file_names if name != '__init__.py')
+        local_modules.update(local_dir_names)
         
         # Her dosyadan import'ları çıkar
         for file_path in project_files:
@@ -103,7 +100,7 @@ class DependencyAnalyzer:
                 continue  # Yerel modülleri atla
             
             # Yerel dizin/klasör kontrolü - recursive arama ile
-            is_local_module = self._is_local_module(import_name, base_dir, project_dirs)
+            is_local_module = self._is_local_module(import_name, base_dir, project_dirs, local_file_names, local_dir_names)
             
             if is_local_module:
                 continue  # Yerel modülleri/klasörleri atla
@@ -128,7 +125,41 @@ class DependencyAnalyzer:
             'pip_install_command': self._generate_pip_command(missing_packages)
         }
     
-    def _is_local_module(self, import_name: str, base_dir: str, project_dirs: set) -> bool:
+    def _collect_local_names(self, base_dir: str) -> Tuple[Set[str], Set[str]]:
+        """Proje ağacındaki .py dosya adlarını ve klasör adlarını tek taramada toplar.
+        
+        Dosya indeksi varsa ağaç yeniden gezilmez; indeks artımlı olarak
+        yenilenir ve isimler indeksten okunur.
+        """
+        file_names = set()
+        dir_names = set()
+        
+        if self.file_index is not None:
+            self.file_index.refresh(base_dir)
+            abs_base = os.path.abspath(base_dir)
+            skipped_dirs = set()
+            for dir_path in self.file_index.iter_dirs(base_dir):
+                if dir_path == abs_base:
+                    continue
+                dir_name = os.path.basename(dir_path)
+                if os.path.dirname(dir_path) in skipped_dirs or dir_name in self.SKIPPED_DIRS:
+                    skipped_dirs.add(dir_path)
+                else:
+                    dir_names.add(dir_name)
+            for _path, dir_path, name, _size, _mtime, _lines in self.file_index.iter_files(base_dir):
+                if name.endswith('.py') and dir_path not in skipped_dirs:
+                    file_names.add(name)
+            return file_names, dir_names
+        
+        for root, dirs, files in os.walk(base_dir):
+            # __pycache__, .git, venv gibi klasörleri atla
+            dirs[:] = [d for d in dirs if d not in self.SKIPPED_DIRS]
+            file_names.update(f for f in files if f.endswith('.py'))
+            dir_names.update(dirs)
+        return file_names, dir_names
+    
+    def _is_local_module(self, import_name: str, base_dir: str, project_dirs: set,
+                         local_file_names: Set[str], local_dir_names: Set[str]) -> bool:
         """Import'ın yerel bir modül olup olmadığını kontrol eder - alt klasörler dahil."""
         if not base_dir:
             return False
@@ -145,21 +176,8 @@ class DependencyAnalyzer:
             if os.path.isdir(potential_package):
                 return True
         
-        # Alt klasörlerde recursive arama yap
-        for root, dirs, files in os.walk(base_dir):
-            # __pycache__, .git, venv gibi klasörleri atla
-            dirs[:] = [d for d in dirs if d not in ['__pycache__', '.git', '.vscode', 'venv', '.venv', 'env', '__pypackages__']]
-            
-            # .py dosyası ara
-            target_file = f"{import_name}.py"
-            if target_file in files:
-                return True
-            
-            # Klasör olarak ara
-            if import_name in dirs:
-                return True
-        
-        return False
+        # Alt klasörlerde ara (önceden toplanmış isimler üzerinden, ağaç yeniden gezilmez)
+        return f"{import_name}.py" in local_file_names or import_name in local_dir_names
     
     def _extract_imports_from_file(self, file_path: str) -> Set[str]:
         """Dosyadan import'ları çıkar"""
@@ -381,27 +399,58 @@ class PythonAnalyzer:
                 messagebox.showerror("Hata", "Sadece Python dosyaları (.py) analiz edilebilir.", parent=self.app)
                 return
             
+            # Keşif ve analiz iş zamanlayıcısında, sonuç penceresi arayüz thread'inde
+            self.app.job_scheduler.submit(f"Python analizi: {os.path.basename(file_path)}",
+                                          lambda job: self._run_analysis_job(job, file_path),
+                                          root=os.path.dirname(os.path.abspath(file_path)), priority=PRIORITY_NORMAL)
+            self.app.status_label.config(text=f"'{os.path.basename(file_path)}' analiz ediliyor...")
+            
+        except Exception as e:
+            messagebox.showerror("Analiz Hatası", f"Dosya analizi sırasında bir hata oluştu:\n{e}", parent=self.app)
+
+    def _run_analysis_job(self, job, file_path):
+        """Proje dosyalarını keşfeder ve analiz eder (iş zamanlayıcısı thread'inde çalışır)."""
+        try:
             # Tüm bağımlı dosyaları bul
             print(f"[DEBUG] Bağımlı dosyalar keşfediliyor...")
+            job.report_progress("Bağımlı dosyalar keşfediliyor...")
             all_project_files = self._discover_project_files(file_path)
             print(f"[DEBUG] Bulunan dosya sayısı: {len(all_project_files)}")
+            job.cancel_token.raise_if_cancelled()
             
             # Dosyaları analiz et
             print(f"[DEBUG] Proje analizi yapılıyor...")
+            job.report_progress(f"{len(all_project_files)} dosya analiz ediliyor...")
             analysis_results = self._perform_project_analysis(file_path, all_project_files)
             print(f"[DEBUG] Analiz tamamlandı. Toplam satır: {analysis_results['project_stats']['total_lines']}")
-            
-            # Sonuçları göster
-            print(f"[DEBUG] Sonuçlar penceresi açılıyor...")
-            self._show_analysis_results(file_path, analysis_results)
-            print(f"[DEBUG] Python Proje Analizi başarıyla tamamlandı!")
+            job.cancel_token.raise_if_cancelled()
+        except OperationCancelled:
+            self.app.after(0, lambda: self.app.status_label.config(text="Python analizi iptal edildi."))
+            raise
+        except Exception as e:
+            error_message = str(e)
+            self.app.after(0, lambda: self._handle_analysis_error(error_message))
+            raise
+        
+        self.app.after(0, self._finish_analysis, file_path, analysis_results)
 
-            # History'ye kaydet
-            self.app.db.add_history(f"Python Dosya Analizi: {file_path}", "method_analysis")            
+    def _finish_analysis(self, file_path, analysis_results):
+        """Analiz sonuçlarını gösterir ve geçmişe kaydeder (arayüz thread'i)."""
+        self.app.status_label.config(text="Hazır.")
+        
+        # Sonuçları göster
+        print(f"[DEBUG] Sonuçlar penceresi açılıyor...")
+        self._show_analysis_results(file_path, analysis_results)
+        print(f"[DEBUG] Python Proje Analizi başarıyla tamamlandı!")
+
+        # History'ye kaydet
+        self.app.db.add_history(f"Python Dosya Analizi: {file_path}", "method_analysis")
+
+    def _handle_analysis_error(self, error_message):
+        """Analiz hatasını kullanıcıya gösterir (arayüz thread'i)."""
+        self.app.status_label.config(text="Hazır.")
+        messagebox.showerror("Analiz Hatası", f"Dosya analizi sırasında bir hata oluştu:\n{error_message}", parent=self.app)
 
-            
-        except Exception as e:
-            messagebox.showerror("Analiz Hatası", f"Dosya analizi sırasında bir hata oluştu:\n{e}", parent=self.app)    
     def _analyze_ast(self, tree, results):
         """AST kullanarak kod yapısını analiz eder."""
         for node in ast.walk(tree):
@@ -3,18 +3,20 @@
 import tkinter as tk
 from tkinter import simpledialog, messagebox, ttk
 import os
-import threading # Arama thread'leri için
+import queue # Akışlı arama sonuçları için
 
 # Yerel modüllerden importlar (App'den çağrılacakları için App'in importlarına benzer)
 from ui_dialogs import SearchResultsWindow, WordSearchResultsWindow
 import operations # operations.py'deki fonksiyonları kullanmak için
+from job_scheduler import PRIORITY_HIGH # Aramalar etkileşimli olduğundan öncelikli çalışır
 
 class SearchManager:
     """Dosya ve kelime arama işlemlerini yönetir.
     
     Bu sınıf, klasörler içinde dosya arama ve dosya içeriklerinde
-    kelime/metin arama işlevlerini sağlar. Arama işlemleri arka planda
-    thread olarak çalıştırılır.
+    kelime/metin arama işlevlerini sağlar. Arama işlemleri uygulamanın
+    iş zamanlayıcısına (JobScheduler) yüksek öncelikli iş olarak gönderilir;
+    farklı klasörlerdeki aramalar aynı anda çalışabilir.
     
     Attributes:
         app: Ana uygulama referansı (App).
@@ -30,6 +32,7 @@ class SearchManager:
             app_instance: Ana uygulama referansı.
         """
         self.app = app_instance
+        self.search_results_windows = {}  # Sonuç kuyruğu -> akış halinde sonuç alan arama penceresi
 
     def prompt_search_OLD(self):
         """Kullanıcıdan arama kriterlerini alır ve dosya aramasını başlatır."""
@@ -56,26 +59,16 @@ class SearchManager:
             messagebox.showerror("Hata", f"Seçili klasör bilgisi alınırken bir hata oluştu:\n{e}", parent=self.app)
             return
 
-        if self.app.long_operation_in_progress:
-            messagebox.showwarning("İşlem Devam Ediyor", "Başka bir uzun süreli işlem zaten devam ediyor.", parent=self.app)
-            return
-
         search_pattern = simpledialog.askstring("Dosya Ara",
                                                 f"'{os.path.basename(search_root_folder)}' klasöründe ve alt klasörlerinde aranacak dosya adı/deseni:\n(Örn: *.txt, rapor*, *config*)",
                                                 parent=self.app)
         if search_pattern:
             self.app.status_label.config(text=f"'{search_pattern}' deseni '{os.path.basename(search_root_folder)}' içinde aranıyor...")
-            self.app.activity_progressbar.pack(side=tk.RIGHT, padx=5, pady=2)
-            self.app.activity_progressbar.start(10)
-            self.app.update_idletasks()
-            self.app.long_operation_in_progress = True
-
-            thread = threading.Thread(target=operations.perform_search_in_thread,
-                                       args=(self.app, search_pattern, search_root_folder))
-            thread.daemon = True
             history_message = f"Arandı: '{search_pattern}' ({os.path.basename(search_root_folder)})"
             self.app.db.add_history(f"Dosya arandı: {history_message}", event_type="search_initiated")
-            thread.start()
+            self.app.job_scheduler.submit(f"Dosya arama: {search_pattern}",
+                                          lambda job: operations.perform_search_in_thread_OLD(self.app, search_pattern, search_root_folder),
+                                          root=search_root_folder, priority=PRIORITY_HIGH)
 
     def prompt_search(self):
         """Kullanıcıdan arama kriterlerini alır ve dosya aramasını başlatır."""
@@ -102,10 +95,6 @@ class SearchManager:
             messagebox.showerror("Hata", f"Seçili klasör bilgisi alınırken bir hata oluştu:\n{e}", parent=self.app)
             return
 
-        if self.app.long_operation_in_progress:
-            messagebox.showwarning("İşlem Devam Ediyor", "Başka bir uzun süreli işlem zaten devam ediyor.", parent=self.app)
-            return
-
         # Özel dialog penceresi oluştur
         dialog = tk.Toplevel(self.app)
         dialog.title("Dosya Ara")
@@ -205,15 +194,18 @@ class SearchManager:
         # Sonuç kontrolü
         if result["search_pattern"]:
             self.app.status_label.config(text=f"'{result['search_pattern']}' deseni '{os.path.basename(search_root_folder)}' içinde aranıyor...")
-            self.app.activity_progressbar.pack(side=tk.RIGHT, padx=5, pady=2)
-            self.app.activity_progressbar.start(10)
-            self.app.update_idletasks()
-            self.app.long_operation_in_progress = True
 
-            thread = threading.Thread(target=operations.perform_search_in_thread,
-                                    args=(self.app, result["search_pattern"], search_root_folder, 
-                                            result["file_size"], result["size_operator"], result["search_in_excluded"]))
-            thread.daemon = True
+            # Arama iş olarak gönderilir; sonuç penceresi hemen açılır ve kuyruktan gelen sonuçlarla doldurulur
+            result_queue = queue.Queue()
+            job = self.app.job_scheduler.submit(
+                f"Dosya arama: {result['search_pattern']}",
+                lambda job: operations.perform_search_in_thread(self.app, result_queue, result["search_pattern"], search_root_folder,
+                                                                result["file_size"], result["size_operator"],
+                                                                result["search_in_excluded"], job.cancel_token,
+                                                                job.report_progress),
+                root=search_root_folder, priority=PRIORITY_HIGH)
+            self.search_results_windows[result_queue] = SearchResultsWindow(self.app, [], result["search_pattern"], search_root_folder,
+                                                                            result_queue=result_queue, cancel_token=job.cancel_token)
             
             size_info = ""
             if result["file_size"] is not None:
@@ -222,19 +214,48 @@ class SearchManager:
             history_message = f"'{result['search_pattern']}' ({os.path.basename(search_root_folder)}){size_info}"
             print(f"✨ Search Completed: {search_root_folder=}  {size_info=}")
             self.app.db.add_history(f"Dosya arandı: {history_message}", event_type="search_initiated")
-            thread.start()
 
     def _finalize_search_ui(self):
-        """Arama işlemi bittikten sonra (başarılı veya başarısız) UI'ı sıfırlar."""
-        self.app.activity_progressbar.stop()
-        self.app.activity_progressbar.pack_forget()
+        """Arama işlemi bittikten sonra (başarılı veya başarısız) durum çubuğunu sıfırlar.
+        
+        İlerleme çubuğu zamanlayıcıdaki işlere göre UIManager tarafından yönetilir.
+        """
         self.app.status_label.config(text="Hazır.")
         self.app.update_idletasks()
-        self.app.long_operation_in_progress = False
 
-    def _handle_search_error(self, error):
-        """Arama sırasında bir hata oluşursa kullanıcıyı bilgilendirir."""
+    def _on_search_finished(self, pattern, root_folder_searched, stats, result_queue=None):
+        """Akışlı dosya araması bittiğinde UI'ı sıfırlar ve arama ölçümlerini kaydeder.
+        
+        Args:
+            pattern: Aranan desen.
+            root_folder_searched: Aramanın yapıldığı kök klasör.
+            stats: 'count', 'first_result_seconds' ve 'elapsed_seconds' anahtarlı sözlük.
+            result_queue: Biten aramanın sonuç kuyruğu.
+        """
+        self._finalize_search_ui()
+        self.search_results_windows.pop(result_queue, None)
+        
+        # İlk sonuca kadar geçen süre (time-to-first-result) geçmişe kaydedilir
+        first_result = stats.get("first_result_seconds")
+        first_result_text = f"{first_result:.2f} sn" if first_result is not None else "-"
+        status_text = "iptal edildi" if stats.get("cancelled") else "tamamlandı"
+        self.app.db.add_history(f"Dosya araması {status_text}: '{pattern}' ({os.path.basename(root_folder_searched)}) - "
+                                f"{stats['count']} dosya, ilk sonuç: {first_result_text}, "
+                                f"toplam: {stats['elapsed_seconds']:.2f} sn",
+                                event_type="search_completed")
+
+    def _handle_search_error(self, error, result_queue=None):
+        """Arama sırasında bir hata oluşursa kullanıcıyı bilgilendirir.
+        
+        Args:
+            error: Hata mesajı.
+            result_queue: Hata alan aramanın sonuç kuyruğu (akışlı aramalarda).
+        """
         self._finalize_search_ui()
+        # Yarım kalan akışlı sonuç penceresini kapat
+        results_window = self.search_results_windows.pop(result_queue, None)
+        if results_window is not None and results_window.winfo_exists():
+            results_window.destroy()
         messagebox.showerror("Arama Hatası", f"Dosya arama sırasında bir hata oluştu:\n{error}", parent=self.app)
         print(f"Arama hatası: {error}")  # Hata mesajını konsola yazdırır
 
@@ -267,10 +288,6 @@ class SearchManager:
             messagebox.showerror("Hata", f"Seçili klasör bilgisi alınırken bir hata oluştu:\n{e}", parent=self.app)
             return
 
-        if self.app.long_operation_in_progress:
-            messagebox.showwarning("İşlem Devam Ediyor", "Başka bir uzun süreli işlem zaten devam ediyor.", parent=self.app)
-            return
-
         # Özel dialog penceresi oluştur
         dialog = tk.Toplevel(self.app)
         dialog.title("Kelime Ara")
@@ -366,15 +383,13 @@ class SearchManager:
         # Sonuç kontrolü
         if result["search_word"]:
             self.app.status_label.config(text=f"'{result['search_word']}' kelimesi '{os.path.basename(search_root_folder)}' içinde aranıyor...")
-            self.app.activity_progressbar.pack(side=tk.RIGHT, padx=5, pady=2)
-            self.app.activity_progressbar.start(10)
-            self.app.update_idletasks()
-            self.app.long_operation_in_progress = True
-            
-            thread = threading.Thread(target=operations.perform_word_search_in_thread,
-                                    args=(self.app, result["search_word"], search_root_folder, 
-                                            result["file_size"], result["size_operator"], result["search_in_excluded"]))
-            thread.daemon = True
+            self.app.job_scheduler.submit(
+                f"Kelime arama: {result['search_word']}",
+                lambda job: operations.perform_word_search_in_thread(self.app, result["search_word"], search_root_folder,
+                                                                     result["file_size"], result["size_operator"],
+                                                                     result["search_in_excluded"], job.cancel_token,
+                                                                     job.report_progress),
+                root=search_root_folder, priority=PRIORITY_HIGH)
             
             size_info = ""
             if result["file_size"] is not None:
@@ -382,13 +397,17 @@ class SearchManager:
             
             history_message = f"'{result['search_word']}' ({os.path.basename(search_root_folder)}){size_info}"
             self.app.db.add_history(f"Kelime arandı: {history_message}", event_type="word_search_initiated")
-            thread.start()
 
 
     def _finalize_word_search_ui(self):
         """Kelime arama işlemi bittikten sonra UI'ı sıfırlar."""
         self._finalize_search_ui() # Reuses the same finalization logic
 
+    def _handle_word_search_cancelled(self):
+        """Kelime arama kullanıcı tarafından iptal edildiğinde UI'ı sıfırlar."""
+        self._finalize_word_search_ui()
+        self.app.status_label.config(text="Kelime arama iptal edildi.")
+
     def _handle_word_search_error(self, error):
         """Kelime arama sırasında bir hata oluşursa kullanıcıyı bilgilendirir."""
         self._finalize_word_search_ui()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Dir Walker Testleri
+
+ParallelDirWalker çıktısının os.walk ile birebir aynı klasör ve dosya
+kümesini ürettiğini, thread geçişleri sıklaştırılmış geniş ağaçlarda
+tekrar tekrar doğrular. Alt klasörlerin kuyruğa eklenmesi yapay olarak
+yavaşlatılarak iş çalma ile bekleyen iş sayacı arasındaki yarış da
+zorlanır.
+
+Çalıştırma:
+    python -m unittest test_dir_walker
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from collections import deque
+from unittest import mock
+
+import dir_walker
+from dir_walker import parallel_walk
+
+
+class _SlowExtendDeque(deque):
+    """Alt klasörleri ekledikten sonra bekleyerek diğer thread'lere çalma fırsatı veren kuyruk."""
+
+    def extend(self, items):
+        super().extend(items)
+        if items:
+            time.sleep(0.002)
+
+
+class ParallelWalkStressTest(unittest.TestCase):
+    """Geniş bir ağaçta parallel_walk çıktısını os.walk ile karşılaştırır."""
+
+    WIDTH = 12
+    DEPTH = 3
+    FILES_PER_DIR = 2
+    ROUNDS = 200
+    SLOW_ROUNDS = 20
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.mkdtemp(prefix="dir_walker_test_")
+        cls._build(cls.root, cls.DEPTH)
+        cls.expected = cls._walk_with_os(cls.root)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root, ignore_errors=True)
+
+    @classmethod
+    def _build(cls, dir_path, depth):
+        for i in range(cls.FILES_PER_DIR):
+            with open(os.path.join(dir_path, f"dosya_{i}.txt"), "w", encoding="utf-8") as f:
+                f.write(str(i))
+        if depth == 0:
+            return
+        for i in range(cls.WIDTH if depth == cls.DEPTH else 3):
+            sub_dir = os.path.join(dir_path, f"klasor_{i}")
+            os.mkdir(sub_dir)
+            cls._build(sub_dir, depth - 1)
+
+    @staticmethod
+    def _walk_with_os(root):
+        dirs = set()
+        files = set()
+        for dir_path, _, file_names in os.walk(root):
+            dirs.add(dir_path)
+            files.update(os.path.join(dir_path, name) for name in file_names)
+        return dirs, files
+
+    @staticmethod
+    def _walk_in_parallel(root):
+        dirs = set()
+        files = set()
+        for dir_path, _, file_entries in parallel_walk(root, stat_files=False):
+            dirs.add(dir_path)
+            files.update(entry.path for entry in file_entries)
+        return dirs, files
+
+    def test_matches_os_walk_under_frequent_thread_switches(self):
+        old_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for round_no in range(self.ROUNDS):
+                dirs, files = self._walk_in_parallel(self.root)
+                self.assertEqual(dirs, self.expected[0], f"{round_no}. turda klasör eksik")
+                self.assertEqual(files, self.expected[1], f"{round_no}. turda dosya eksik")
+        finally:
+            sys.setswitchinterval(old_interval)
+
+    def test_matches_os_walk_when_sub_dirs_are_stolen_immediately(self):
+        with mock.patch.object(dir_walker, "deque", _SlowExtendDeque):
+            for round_no in range(self.SLOW_ROUNDS):
+                dirs, files = self._walk_in_parallel(self.root)
+                self.assertEqual(dirs, self.expected[0], f"{round_no}. turda klasör eksik")
+                self.assertEqual(files, self.expected[1], f"{round_no}. turda dosya eksik")
+
+    def test_early_exit_stops_cleanly(self):
+        walk = parallel_walk(self.root, stat_files=False)
+        first = next(walk)
+        walk.close()
+        self.assertEqual(first[0], self.root)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,11 +9,15 @@ import tempfile
 import zipfile
 import subprocess
 import platform
+import queue
+import time
 from tkinter import messagebox, filedialog
 
 from python_editor import PythonEditor  
 from db_manager import DatabaseManager
 from exclusion_utils import ExclusionManager # Merkezi exclusion yönetimi
+from custom_widgets import VirtualTreeview # Çok sayıda sonuç için sanal liste
+from job_scheduler import PRIORITY_NAMES
 
 
 @staticmethod
@@ -30,34 +34,46 @@ def format_file_size(size_bytes):
 
 # --- Arama Sonuçları Penceresi Sınıfı ---
 class SearchResultsWindow(tk.Toplevel):
-    def __init__(self, parent, found_files_details, pattern, root_folder_searched):
+    # Akış modunda kuyruğun kontrol edilme aralığı (ms) ve her kontrolde işlenecek en fazla grup sayısı
+    STREAM_POLL_MS = 100
+    STREAM_MAX_BATCHES_PER_POLL = 20
+
+    def __init__(self, parent, found_files_details, pattern, root_folder_searched, result_queue=None, cancel_token=None):
+        """Arama sonuçları penceresini oluşturur.
+        
+        Args:
+            parent: Ana uygulama referansı.
+            found_files_details: Bulunan dosyaların listesi ('path', 'size_kb', 'modified' ve arama
+                                 thread'inde hesaplanan 'excluded' anahtarlı sözlükler).
+            pattern: Aranan desen.
+            root_folder_searched: Aramanın yapıldığı kök klasör.
+            result_queue: Verilirse pencere hemen açılır ve arama thread'inin bu kuyruğa
+                          yazdığı sonuç grupları geldikçe listeye eklenir (None: arama bitti).
+                          Sözlük olarak gelen {'removed': yollar, 'updated': sonuçlar}
+                          öğeleri, indeks yenilendikten sonra gösterilen sonuçları düzeltir.
+            cancel_token: Akış modunda "Aramayı Durdur" butonunun ve pencereyi kapatmanın
+                          iptal edeceği CancellationToken (opsiyonel).
+        """
         super().__init__(parent)
         self.parent = parent
-        self.found_files_details = found_files_details
+        self.found_files_details = list(found_files_details)
         self.pattern = pattern
         self.root_folder_searched = root_folder_searched
+        self.result_queue = result_queue
+        self.cancel_token = cancel_token
+        self.stream_started_at = time.perf_counter()
+        self.first_result_seconds = None
+        self._poll_job = None
         
-        # Global exclusion list'i al
-        self.global_exclusion = parent.db.get_global_exclusion_list() or ""
-        self.exclusion_patterns = [p.strip() for p in self.global_exclusion.split(',') if p.strip()]
+        self._exclusion_manager = None # Sadece 'excluded' bilgisi olmayan sonuçlar için oluşturulur
         
-        # Hariç tutulan dosya sayısını hesapla
-        self.excluded_count = 0
-        for file_info in self.found_files_details:
-            file_path = file_info['path']
-            file_name = os.path.basename(file_path)
-            if self._is_excluded(file_path, file_name):
-                self.excluded_count += 1
+        # Hariç tutulan dosya sayısı (bayrak arama sırasında hesaplanmıştır)
+        self.excluded_count = sum(1 for file_info in self.found_files_details if self._is_excluded(file_info))
         
-        # Pencere başlığı (hariç tutulan sayısı dahil)
-        total_count = len(found_files_details)
-        if self.excluded_count > 0:
-            title_text = f"Arama Sonuçları - '{pattern}' (Toplam {total_count} eşleşme, {self.excluded_count} tanesi hariç tutulan dosyalarda)"
-        else:
-            title_text = f"Arama Sonuçları - '{pattern}' ({total_count} eşleşme)"
-        self.title(title_text)
         self.transient(parent)
-        self.grab_set()
+        # Akışlı aramada pencere modal değildir; arama sürerken başka işler başlatılabilir
+        if self.result_queue is None:
+            self.grab_set()
 
         self.parent.load_or_center_window("search_results", self, 800, 500)
 
@@ -72,12 +88,10 @@ class SearchResultsWindow(tk.Toplevel):
         top_frame = ttk.Frame(main_frame)
         top_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Bilgi etiketi
-        if self.excluded_count > 0:
-            info_text = f"'{pattern}' deseni için '{os.path.basename(root_folder_searched)}' klasöründe {total_count} dosya bulundu ({self.excluded_count} tanesi hariç tutulan)."
-        else:
-            info_text = f"'{pattern}' deseni için '{os.path.basename(root_folder_searched)}' klasöründe {total_count} dosya bulundu."
-        ttk.Label(top_frame, text=info_text).pack(side=tk.LEFT)
+        # Bilgi etiketi (pencere başlığı ile birlikte _update_summary tarafından doldurulur)
+        self.info_label = ttk.Label(top_frame)
+        self.info_label.pack(side=tk.LEFT)
+        self._update_summary()
         
         # Hariç tutulanları gizle checkbox'ı
         self.hide_excluded_var = tk.BooleanVar(value=False)
@@ -88,13 +102,16 @@ class SearchResultsWindow(tk.Toplevel):
         tree_frame = ttk.Frame(main_frame)
         tree_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Treeview oluştur
+        # Sanal liste: sadece görünen satırlar Treeview'a eklenir
         columns = ("Dosya Adı", "Yol", "Boyut", "Değiştirilme Tarihi")
-        self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=20)
+        self.result_view = VirtualTreeview(tree_frame, self._build_row, columns=columns, show="headings", height=20)
+        self.tree = self.result_view.tree
 
-        # Sütun başlıklarını ayarla
+        # Sütun başlıklarını ayarla (başlığa tıklamak sıralar)
+        self.sort_column = None
+        self.sort_ascending = True
         for col in columns:
-            self.tree.heading(col, text=col)
+            self.tree.heading(col, text=col, command=lambda c=col: self._sort_by_column(c))
             if col == "Dosya Adı":
                 self.tree.column(col, width=200)
             elif col == "Yol":
@@ -107,13 +124,7 @@ class SearchResultsWindow(tk.Toplevel):
         # Exclusion list'e uyan dosyalar için açık kırmızı arka plan rengi
         self.tree.tag_configure("excluded_file", background="#FFCCCC")
         
-        # Scrollbar ekle
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack tree ve scrollbar
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.result_view.pack(fill=tk.BOTH, expand=True)
         
         # Verileri ekle
         self._populate_tree()
@@ -126,46 +137,189 @@ class SearchResultsWindow(tk.Toplevel):
         ttk.Button(button_frame, text="Dosyayı Aç", command=self.open_selected_file).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="Klasörü Aç", command=self.open_containing_folder).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="Kapat", command=self.destroy).pack(side=tk.RIGHT)
+        self.stop_button = None
+        if self.result_queue is not None and self.cancel_token is not None:
+            self.stop_button = ttk.Button(button_frame, text="Aramayı Durdur", command=self._stop_search)
+            self.stop_button.pack(side=tk.RIGHT, padx=(0, 5))
         
         self.tree.bind("<Button-3>", self.show_context_menu)
         self.tree.bind("<Double-1>", lambda e: self.open_selected_file())
+        
+        # Akış modunda sonuç kuyruğunu dinlemeye başla
+        if self.result_queue is not None:
+            self._poll_job = self.after(self.STREAM_POLL_MS, self._poll_result_queue)
+
+    def _update_summary(self):
+        """Pencere başlığını ve bilgi etiketini güncel sayılarla yeniler."""
+        total_count = len(self.found_files_details)
+        folder_name = os.path.basename(self.root_folder_searched)
+        
+        if self.result_queue is not None:
+            # Arama sürüyor: canlı sayaç ve hız
+            elapsed = max(time.perf_counter() - self.stream_started_at, 0.001)
+            first_result_text = f", ilk sonuç {self.first_result_seconds:.2f} sn" if self.first_result_seconds is not None else ""
+            self.title(f"Arama Sonuçları - '{self.pattern}' (aranıyor... {total_count} eşleşme)")
+            self.info_label.config(text=f"'{self.pattern}' deseni '{folder_name}' klasöründe aranıyor... "
+                                        f"{total_count} dosya bulundu ({total_count / elapsed:,.0f} dosya/sn{first_result_text}).")
+            return
+        
+        # Pencere başlığı (hariç tutulan sayısı dahil)
+        if self.excluded_count > 0:
+            title_text = f"Arama Sonuçları - '{self.pattern}' (Toplam {total_count} eşleşme, {self.excluded_count} tanesi hariç tutulan dosyalarda)"
+            info_text = f"'{self.pattern}' deseni için '{folder_name}' klasöründe {total_count} dosya bulundu ({self.excluded_count} tanesi hariç tutulan)."
+        else:
+            title_text = f"Arama Sonuçları - '{self.pattern}' ({total_count} eşleşme)"
+            info_text = f"'{self.pattern}' deseni için '{folder_name}' klasöründe {total_count} dosya bulundu."
+        if self.cancel_token is not None and self.cancel_token.is_cancelled:
+            info_text += " (Arama iptal edildi, sonuçlar eksik olabilir.)"
+        self.title(title_text)
+        self.info_label.config(text=info_text)
 
-    def _populate_tree(self):
-        """Treeview'a dosyaları ekler."""
-        # Mevcut öğeleri temizle
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _poll_result_queue(self):
+        """Arama thread'inin kuyruğa yazdığı sonuç gruplarını ağaca ekler."""
+        self._poll_job = None
+        finished = False
+        for _ in range(self.STREAM_MAX_BATCHES_PER_POLL):
+            try:
+                batch = self.result_queue.get_nowait()
+            except queue.Empty:
+                break
+            if batch is None:
+                finished = True
+                break
+            if isinstance(batch, dict):
+                self._apply_corrections(batch)
+                continue
+            if self.first_result_seconds is None and batch:
+                self.first_result_seconds = time.perf_counter() - self.stream_started_at
+            self._add_results(batch)
         
-        hide_excluded = self.hide_excluded_var.get()
+        if finished:
+            self._on_stream_finished()
+            return
+        self._update_summary()
+        self._poll_job = self.after(self.STREAM_POLL_MS, self._poll_result_queue)
+
+    def _stop_search(self):
+        """Süren aramayı iptal eder; o ana kadar bulunan sonuçlar pencerede kalır."""
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+        if self.stop_button is not None:
+            self.stop_button.config(state=tk.DISABLED)
+
+    def _on_stream_finished(self):
+        """Arama bittiğinde son sayıları gösterir; sonuç yoksa pencereyi kapatır."""
+        self.result_queue = None
+        if self.stop_button is not None:
+            self.stop_button.destroy()
+            self.stop_button = None
+        cancelled = self.cancel_token is not None and self.cancel_token.is_cancelled
+        if not self.found_files_details:
+            self.destroy()
+            if cancelled:
+                return
+            messagebox.showinfo("Arama Sonucu",
+                                f"'{self.pattern}' deseni için '{os.path.basename(self.root_folder_searched)}' klasöründe ve alt klasörlerinde dosya bulunamadı.",
+                                parent=self.parent)
+            return
+        self._update_summary()
+
+    def _add_results(self, batch):
+        """Akışla gelen bir sonuç grubunu (gizleme seçeneğine uyarak) listeye ekler."""
+        self.found_files_details.extend(batch)
+        excluded_in_batch = sum(1 for file_info in batch if self._is_excluded(file_info))
+        self.excluded_count += excluded_in_batch
+        if self.hide_excluded_var.get() and excluded_in_batch:
+            batch = [file_info for file_info in batch if not file_info['excluded']]
+        self.result_view.append_records(batch)
+
+    def _apply_corrections(self, corrections):
+        """İndeks yenilendikten sonra silinen sonuçları çıkarır, değişenleri günceller.
         
+        Görünüm konumu ve seçili sonuç korunur.
+        """
+        removed = set(corrections.get('removed', ()))
+        updated = {file_info['path']: file_info for file_info in corrections.get('updated', ())}
+        if not removed and not updated:
+            return
+        details = []
         for file_info in self.found_files_details:
-            file_path = file_info['path']
-            file_name = os.path.basename(file_path)
-            file_size = format_file_size(file_info['size_kb']*1024)
-            modified_date = file_info['modified']
-            
-            # Exclusion kontrolü
-            is_excluded = self._is_excluded(file_path, file_name)
-            
-            # Hariç tutulanları gizle seçili ise ve dosya hariç tutulmuşsa atla
-            if hide_excluded and is_excluded:
+            path = file_info['path']
+            if path in removed:
                 continue
-            
-            tags = ("excluded_file",) if is_excluded else ()
-            self.tree.insert("", tk.END, values=(file_name, file_path, file_size, modified_date), tags=tags)
+            if path in updated:
+                # Aynı sözlük güncellenir; seçili kayıt referansı geçerli kalır
+                file_info.update(updated[path])
+            details.append(file_info)
+        self.found_files_details = details
+        self.excluded_count = sum(1 for file_info in details if self._is_excluded(file_info))
+        
+        selected = self.result_view.selected_record()
+        offset = self.result_view.offset
+        self._populate_tree()
+        self.result_view.offset = offset
+        if selected is not None and selected['path'] not in removed:
+            self.result_view.selected_index = next(
+                (index for index, file_info in enumerate(self.result_view.records) if file_info is selected), None)
+        self.result_view.refresh()
+
+    def _build_row(self, file_info):
+        """Sanal listenin görünen bir satırını sonuç sözlüğünden oluşturur."""
+        file_path = file_info['path']
+        return {
+            "values": (os.path.basename(file_path), file_path, format_file_size(file_info['size_kb']*1024), file_info['modified']),
+            "tags": ("excluded_file",) if file_info['excluded'] else (),
+        }
+
+    def _populate_tree(self):
+        """Sonuçları (hariç tutulanları gizle seçeneğine göre) sanal listeye yükler."""
+        # Exclusion bayrağı arama sırasında hesaplandı; burada sadece filtrelenir
+        if self.hide_excluded_var.get():
+            records = [file_info for file_info in self.found_files_details if not self._is_excluded(file_info)]
+        else:
+            records = self.found_files_details
+        self.result_view.set_records(records)
+
+    def _sort_by_column(self, column):
+        """Başlığa tıklanan sütuna göre sıralar; aynı sütuna tekrar tıklamak yönü değiştirir."""
+        if self.sort_column == column:
+            self.sort_ascending = not self.sort_ascending
+        else:
+            self.sort_column = column
+            self.sort_ascending = True
+        sort_keys = {
+            "Dosya Adı": lambda f: os.path.basename(f['path']).lower(),
+            "Yol": lambda f: f['path'].lower(),
+            "Boyut": lambda f: f['size_kb'],
+            "Değiştirilme Tarihi": lambda f: f['modified'],
+        }
+        self.result_view.sort_by(sort_keys[column], reverse=not self.sort_ascending)
+        for col in sort_keys:
+            indicator = (" ▲" if self.sort_ascending else " ▼") if col == column else ""
+            self.tree.heading(col, text=col + indicator)
+
+    def _selected_path(self):
+        """Seçili sonucun dosya yolunu döndürür (seçim yoksa None)."""
+        file_info = self.result_view.selected_record()
+        return file_info['path'] if file_info is not None else None
 
     def _toggle_excluded_visibility(self):
         """Hariç tutulanları gizle/göster."""
         self._populate_tree()
 
-    def _is_excluded(self, file_path, file_name):
-        """Dosyanın exclusion list'e uyup uymadığını kontrol eder."""
-        if not self.exclusion_patterns:
-            return False
+    def _is_excluded(self, file_info):
+        """Sonucun exclusion list'e uyup uymadığını döndürür.
         
-        # Merkezi ExclusionManager kullan
-        exclusion_manager = ExclusionManager(self.global_exclusion)
-        return exclusion_manager.is_file_excluded(file_name, file_path, self.root_folder_searched)
+        Bayrak normalde arama thread'inde hesaplanıp 'excluded' anahtarında gelir.
+        Gelmediyse (eski arama yolu) bir kez hesaplanıp sonuca yazılır.
+        """
+        if 'excluded' not in file_info:
+            if self._exclusion_manager is None:
+                self._exclusion_manager = ExclusionManager(self.parent.db.get_global_exclusion_list() or "")
+            file_path = file_info['path']
+            file_info['excluded'] = self._exclusion_manager.is_file_excluded(os.path.basename(file_path), file_path,
+                                                                              self.root_folder_searched)
+        return file_info['excluded']
 
     # @staticmethod
     # def format_file_size(size_bytes):
@@ -190,11 +344,10 @@ class SearchResultsWindow(tk.Toplevel):
     def open_file_location(self):
         """Seçilen dosyanın bulunduğu klasörü aç"""
         try:
-            selection = self.tree.selection()
-            if not selection:
+            selected_item = self._selected_path()
+            if not selected_item:
                 return
 
-            selected_item = self.tree.item(selection[0])["values"][1]  # Yol sütunu
             print(f"⚡ Seçilen Dosya: {selected_item}")
             self.parent.file_browser.go_to_file(selected_item)
 
@@ -203,8 +356,9 @@ class SearchResultsWindow(tk.Toplevel):
 
     def open_file_in_editor(self):
         print("⚡ Seçilen dosya Pyton editörde açılıyor...")
-        selection = self.tree.selection()
-        selected_item = self.tree.item(selection[0])["values"][1]  # Yol sütunu
+        selected_item = self._selected_path()
+        if not selected_item:
+            return
 
         self.grab_release()
 
@@ -219,12 +373,11 @@ class SearchResultsWindow(tk.Toplevel):
 
     def open_selected_file(self):
         """Seçili dosyayı varsayılan uygulamayla aç"""
-        selected = self.tree.selection()
-        if not selected:
+        file_path = self._selected_path()
+        if not file_path:
             messagebox.showwarning("Seçim Yok", "Lütfen açılacak bir dosya seçin.", parent=self)
             return
         
-        file_path = self.tree.item(selected[0])["values"][1]  # Yol sütunu
         try:
             os.startfile(file_path)
         except Exception as e:
@@ -232,12 +385,11 @@ class SearchResultsWindow(tk.Toplevel):
     
     def open_containing_folder(self):
         """Seçili dosyanın bulunduğu klasörü aç"""
-        selected = self.tree.selection()
-        if not selected:
+        file_path = self._selected_path()
+        if not file_path:
             messagebox.showwarning("Seçim Yok", "Lütfen bir dosya seçin.", parent=self)
             return
         
-        file_path = self.tree.item(selected[0])["values"][1]  # Yol sütunu
         folder_path = os.path.dirname(file_path)
         try:
             os.startfile(folder_path)
@@ -250,25 +402,26 @@ class SearchResultsWindow(tk.Toplevel):
         self.parent.db.save_window_geometry("search_results", geom)
         self.destroy()
 
+    def destroy(self):
+        """Pencere kapanırken bekleyen kuyruk kontrolünü ve (sürüyorsa) aramayı iptal eder."""
+        if self.result_queue is not None and self.cancel_token is not None:
+            self.cancel_token.cancel()
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
+        super().destroy()
+
 # --- Kelime Arama Sonuçları Penceresi Sınıfı ---
 class WordSearchResultsWindow(tk.Toplevel):
     def __init__(self, app_instance, found_items, search_word, root_folder_searched):
         super().__init__(app_instance)
         self.app = app_instance
         self.root_folder_searched = root_folder_searched
-        self.found_items = found_items  # Verileri sakla
+        self.found_items = found_items  # Verileri sakla: (dosya_yolu, satır_no, satır, hariç_tutuldu_mu)
         self.search_word = search_word
         
-        # Global exclusion list'i al
-        self.global_exclusion = app_instance.db.get_global_exclusion_list() or ""
-        self.exclusion_patterns = [p.strip() for p in self.global_exclusion.split(',') if p.strip()]
-        
-        # Hariç tutulan eşleşme sayısını hesapla
-        self.excluded_count = 0
-        for file_path, line_num, line_content in found_items:
-            file_name = os.path.basename(file_path)
-            if self._is_excluded(file_path, file_name):
-                self.excluded_count += 1
+        # Hariç tutulan eşleşme sayısı (bayrak arama thread'inde hesaplanmıştır)
+        self.excluded_count = sum(1 for item in found_items if item[3])
         
         # Pencere başlığı (hariç tutulan sayısı dahil)
         total_count = len(found_items)
@@ -305,11 +458,14 @@ class WordSearchResultsWindow(tk.Toplevel):
                        variable=self.hide_excluded_var,
                        command=self._toggle_excluded_visibility).pack(side=tk.RIGHT)
 
-        # Sütunlar: Dosya Yolu, Satır No, Satır İçeriği
-        self.results_tree = ttk.Treeview(main_frame, columns=("line_no", "line_content"))
-        self.results_tree.heading("#0", text="Dosya Yolu", anchor='w')
-        self.results_tree.heading("line_no", text="Satır No", anchor='w')
-        self.results_tree.heading("line_content", text="Satır İçeriği", anchor='w')
+        # Sütunlar: Dosya Yolu, Satır No, Satır İçeriği (sanal liste: sadece görünen satırlar Treeview'a eklenir)
+        self.result_view = VirtualTreeview(main_frame, self._build_row, columns=("line_no", "line_content"))
+        self.results_tree = self.result_view.tree
+        self.sort_column = None
+        self.sort_ascending = True
+        self.column_titles = {"#0": "Dosya Yolu", "line_no": "Satır No", "line_content": "Satır İçeriği"}
+        for col_id, title in self.column_titles.items():
+            self.results_tree.heading(col_id, text=title, anchor='w', command=lambda c=col_id: self._sort_by_column(c))
 
         self.results_tree.column("#0", width=300, stretch=tk.YES, anchor='w')
         self.results_tree.column("line_no", width=80, stretch=tk.NO, anchor='center')
@@ -335,10 +491,7 @@ class WordSearchResultsWindow(tk.Toplevel):
             except json.JSONDecodeError as e:
                 print(f"HATA: Kayıtlı kelime arama sütun genişlikleri okunamadı (JSON): {e}")
 
-        self.results_tree.grid(row=1, column=0, sticky='nsew')
-        scrollbar_y = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=self.results_tree.yview)
-        self.results_tree.configure(yscrollcommand=scrollbar_y.set)
-        scrollbar_y.grid(row=1, column=1, sticky='ns')
+        self.result_view.grid(row=1, column=0, columnspan=2, sticky='nsew')
 
         scrollbar_x = ttk.Scrollbar(main_frame, orient=tk.HORIZONTAL, command=self.results_tree.xview)
         self.results_tree.configure(xscrollcommand=scrollbar_x.set)
@@ -355,51 +508,53 @@ class WordSearchResultsWindow(tk.Toplevel):
         self.wait_window(self)
 
     def _populate_tree(self):
-        """Treeview'a sonuçları ekler."""
-        # Mevcut öğeleri temizle
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        hide_excluded = self.hide_excluded_var.get()
-        
-        for file_path, line_num, line_content in self.found_items:
-            icon_to_use = self.app.file_icon if self.app.file_icon else None
-            
-            # Exclusion kontrolü
-            file_name = os.path.basename(file_path)
-            is_excluded = self._is_excluded(file_path, file_name)
-            
-            # Hariç tutulanları gizle seçili ise ve dosya hariç tutulmuşsa atla
-            if hide_excluded and is_excluded:
-                continue
-            
-            tags = ("excluded_file",) if is_excluded else ()
-            self.results_tree.insert("", tk.END, text=file_path, image=icon_to_use,
-                                     values=(line_num, line_content), tags=tags)
+        """Sonuçları (hariç tutulanları gizle seçeneğine göre) sanal listeye yükler."""
+        if self.hide_excluded_var.get():
+            records = [item for item in self.found_items if not item[3]]
+        else:
+            records = self.found_items
+        self.result_view.set_records(records)
+
+    def _build_row(self, item):
+        """Sanal listenin görünen bir satırını (yol, satır no, satır, hariç) kaydından oluşturur."""
+        file_path, line_num, line_content, is_excluded = item
+        return {
+            "text": file_path,
+            "image": self.app.file_icon or "",
+            "values": (line_num, line_content),
+            "tags": ("excluded_file",) if is_excluded else (),
+        }
+
+    def _sort_by_column(self, column):
+        """Başlığa tıklanan sütuna göre sıralar; aynı sütuna tekrar tıklamak yönü değiştirir."""
+        if self.sort_column == column:
+            self.sort_ascending = not self.sort_ascending
+        else:
+            self.sort_column = column
+            self.sort_ascending = True
+        sort_keys = {
+            "#0": lambda item: (item[0].lower(), item[1]),
+            "line_no": lambda item: item[1],
+            "line_content": lambda item: item[2].lower(),
+        }
+        self.result_view.sort_by(sort_keys[column], reverse=not self.sort_ascending)
+        for col_id, title in self.column_titles.items():
+            indicator = (" ▲" if self.sort_ascending else " ▼") if col_id == column else ""
+            self.results_tree.heading(col_id, text=title + indicator)
 
     def _toggle_excluded_visibility(self):
         """Hariç tutulanları gizle/göster."""
         self._populate_tree()
 
-    def _is_excluded(self, file_path, file_name):
-        """Dosyanın exclusion list'e uyup uymadığını kontrol eder."""
-        if not self.exclusion_patterns:
-            return False
-        
-        # Merkezi ExclusionManager kullan
-        exclusion_manager = ExclusionManager(self.global_exclusion)
-        return exclusion_manager.is_file_excluded(file_name, file_path, self.root_folder_searched)
-
     def _on_double_click(self, event):
         """Liste öğesine çift tıklandığında dosyayı editörde aç."""
 
         # print("⚡ Kelime arama sonuçlarına çift tıklandı.")
-        selected_item_id = event.widget.focus()
-        if selected_item_id:
-            item_data = event.widget.item(selected_item_id)
-            selected_item = item_data['values']
-            dosya = item_data['text']
-            satir = selected_item[0]
+        # Sanal listede satırın kaydı backing array'den alınır
+        record = self.result_view.record_at(event.y)
+        if record is not None:
+            dosya = record[0]
+            satir = record[1]
             print(f"   📂 Dosya: {dosya}")
             print(f"   ⚡ Satır: {satir}")
             line_number = int(satir)
@@ -740,6 +895,364 @@ class ZipContentsWindow(tk.Toplevel):
             messagebox.showerror("Çıkartma Hatası", f"Dosya çıkartılırken hata oluştu:\n{e}", parent=self.app)
 
 
+# --- İşler Paneli Sınıfı ---
+class JobsWindow(tk.Toplevel):
+    """JobScheduler'daki bekleyen, çalışan ve son biten işleri gösteren pencere.
+
+    Pencere modal değildir; işler sürerken açık kalabilir. Liste, zamanlayıcı
+    bildirimleriyle ve aktif iş varken süreleri güncellemek için saniyede bir
+    yenilenir.
+    """
+    REFRESH_MS = 1000
+
+    def __init__(self, app_instance):
+        super().__init__(app_instance)
+        self.app = app_instance
+        self.scheduler = app_instance.job_scheduler
+        self.title("İşler")
+        self.transient(app_instance)
+        self._refresh_after_id = None
+        self._jobs_by_item = {}
+
+        self.app.load_or_center_window("jobs_window", self, 750, 350)
+
+        self.protocol("WM_DELETE_WINDOW", self._on_closing)
+        self.bind("<Escape>", lambda e: self._on_closing())
+
+        main_frame = ttk.Frame(self, padding="10")
+        main_frame.pack(expand=True, fill=tk.BOTH)
+        main_frame.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+
+        self.jobs_tree = ttk.Treeview(main_frame, columns=("root", "priority", "status", "progress", "elapsed"),
+                                      selectmode="extended")
+        self.jobs_tree.heading("#0", text="İş", anchor='w')
+        self.jobs_tree.heading("root", text="Klasör", anchor='w')
+        self.jobs_tree.heading("priority", text="Öncelik", anchor='w')
+        self.jobs_tree.heading("status", text="Durum", anchor='w')
+        self.jobs_tree.heading("progress", text="İlerleme", anchor='w')
+        self.jobs_tree.heading("elapsed", text="Süre", anchor='e')
+
+        self.jobs_tree.column("#0", width=220, stretch=tk.YES, anchor='w')
+        self.jobs_tree.column("root", width=180, stretch=tk.YES, anchor='w')
+        self.jobs_tree.column("priority", width=70, stretch=tk.NO, anchor='w')
+        self.jobs_tree.column("status", width=90, stretch=tk.NO, anchor='w')
+        self.jobs_tree.column("progress", width=140, stretch=tk.NO, anchor='w')
+        self.jobs_tree.column("elapsed", width=70, stretch=tk.NO, anchor='e')
+
+        self.jobs_tree.tag_configure("running", foreground="#061875")
+        self.jobs_tree.tag_configure("failed", foreground="red")
+        self.jobs_tree.tag_configure("finished", foreground="gray")
+
+        self.jobs_tree.grid(row=0, column=0, sticky='nsew')
+        scrollbar_y = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=self.jobs_tree.yview)
+        self.jobs_tree.configure(yscrollcommand=scrollbar_y.set)
+        scrollbar_y.grid(row=0, column=1, sticky='ns')
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=1, column=0, columnspan=2, sticky='ew', pady=(10, 0))
+        ttk.Button(button_frame, text="Seçilenleri İptal Et", command=self._cancel_selected).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Tümünü İptal Et", command=self.scheduler.cancel_all).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(button_frame, text="Kapat", command=self._on_closing).pack(side=tk.RIGHT)
+
+        self.scheduler.add_listener(self._refresh)
+        self._refresh()
+        self.focus_set()
+
+    def _refresh(self):
+        """İş listesini zamanlayıcıdaki güncel durumla yeniden doldurur."""
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+
+        selected_ids = {self._jobs_by_item[item].job_id for item in self.jobs_tree.selection()
+                        if item in self._jobs_by_item}
+        self.jobs_tree.delete(*self.jobs_tree.get_children())
+        self._jobs_by_item = {}
+
+        has_active = False
+        for job in self.scheduler.get_jobs():
+            if job.status == job.STATUS_FAILED:
+                progress_text = job.error or ""
+            elif job.progress is not None and job.is_active:
+                progress_text = f"%{job.progress * 100:.0f} {job.progress_text}".strip()
+            else:
+                progress_text = job.progress_text
+            if job.cancel_token.is_cancelled and job.is_active:
+                status_text = "İptal ediliyor"
+            else:
+                status_text = job.STATUS_NAMES.get(job.status, job.status)
+
+            if job.status == job.STATUS_RUNNING:
+                tag = "running"
+            elif job.status == job.STATUS_FAILED:
+                tag = "failed"
+            elif not job.is_active:
+                tag = "finished"
+            else:
+                tag = ""
+            has_active = has_active or job.is_active
+
+            item = self.jobs_tree.insert("", tk.END, text=job.title, tags=(tag,),
+                                         values=(job.root or "", PRIORITY_NAMES.get(job.priority, job.priority),
+                                                 status_text, progress_text, f"{job.elapsed_seconds:.1f} sn"))
+            self._jobs_by_item[item] = job
+            if job.job_id in selected_ids:
+                self.jobs_tree.selection_add(item)
+
+        # Süreler akmaya devam etsin
+        if has_active:
+            self._refresh_after_id = self.after(self.REFRESH_MS, self._refresh)
+
+    def _cancel_selected(self):
+        """Seçili aktif işleri iptal eder."""
+        for item in self.jobs_tree.selection():
+            job = self._jobs_by_item.get(item)
+            if job is not None and job.is_active:
+                job.cancel()
+
+    def _on_closing(self):
+        """Pencere kapatılırken dinleyiciyi kaldırır ve geometriyi kaydeder."""
+        self.scheduler.remove_listener(self._refresh)
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        geom = self.winfo_geometry()
+        self.app.db.save_window_geometry("jobs_window", geom)
+        self.destroy()
+
+
+# --- Yedek Deposu Pencereleri ---
+class BackupStoreWindow(tk.Toplevel):
+    """İçerik adresli yedek deposundaki anlık görüntüleri listeleyen pencere.
+
+    Anlık görüntüler ZIP yedekleri gibi açılıp içerikleri görülebilir,
+    geri yüklenebilir veya silinebilir. Silme ve geri yükleme arka plan işi
+    olarak çalışır.
+    """
+
+    def __init__(self, app_instance, store):
+        super().__init__(app_instance)
+        self.app = app_instance
+        self.store = store
+        self.title("Yedek Deposu")
+        self.transient(app_instance)
+
+        self.app.load_or_center_window("backup_store", self, 800, 400)
+
+        self.protocol("WM_DELETE_WINDOW", self._on_closing)
+        self.bind("<Escape>", lambda e: self._on_closing())
+
+        main_frame = ttk.Frame(self, padding="10")
+        main_frame.pack(expand=True, fill=tk.BOTH)
+        main_frame.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+
+        self.snapshot_tree = ttk.Treeview(main_frame, columns=("source", "created", "files", "size", "new_data"),
+                                          selectmode="browse")
+        self.snapshot_tree.heading("#0", text="Anlık Görüntü", anchor='w')
+        self.snapshot_tree.heading("source", text="Kaynak Klasör", anchor='w')
+        self.snapshot_tree.heading("created", text="Tarih", anchor='w')
+        self.snapshot_tree.heading("files", text="Dosya", anchor='e')
+        self.snapshot_tree.heading("size", text="Toplam Boyut", anchor='e')
+        self.snapshot_tree.heading("new_data", text="Yeni Veri", anchor='e')
+
+        self.snapshot_tree.column("#0", width=200, stretch=tk.YES, anchor='w')
+        self.snapshot_tree.column("source", width=220, stretch=tk.YES, anchor='w')
+        self.snapshot_tree.column("created", width=140, stretch=tk.NO, anchor='w')
+        self.snapshot_tree.column("files", width=70, stretch=tk.NO, anchor='e')
+        self.snapshot_tree.column("size", width=90, stretch=tk.NO, anchor='e')
+        self.snapshot_tree.column("new_data", width=90, stretch=tk.NO, anchor='e')
+
+        self.snapshot_tree.grid(row=0, column=0, sticky='nsew')
+        scrollbar_y = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=self.snapshot_tree.yview)
+        self.snapshot_tree.configure(yscrollcommand=scrollbar_y.set)
+        scrollbar_y.grid(row=0, column=1, sticky='ns')
+
+        self.summary_label = ttk.Label(main_frame, text="")
+        self.summary_label.grid(row=1, column=0, columnspan=2, sticky='w', pady=(5, 0))
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=2, column=0, columnspan=2, sticky='ew', pady=(10, 0))
+        ttk.Button(button_frame, text="İçeriği Göster", command=self._show_selected).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Geri Yükle...", command=self._restore_selected).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(button_frame, text="Sil", command=self._delete_selected).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(button_frame, text="Yenile", command=self._refresh).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(button_frame, text="Kapat", command=self._on_closing).pack(side=tk.RIGHT)
+
+        self.snapshot_tree.bind("<Double-1>", lambda e: self._show_selected())
+
+        self._refresh()
+        self.focus_set()
+
+    def _refresh(self):
+        """Anlık görüntü listesini depodan yeniden okur."""
+        self.snapshot_tree.delete(*self.snapshot_tree.get_children())
+        snapshots = self.store.list_snapshots()
+        for snapshot in snapshots:
+            self.snapshot_tree.insert("", tk.END, iid=snapshot["name"], text=snapshot["name"],
+                                      values=(snapshot["source"], snapshot["created"].replace("T", " "),
+                                              f"{snapshot['file_count']:,}", format_file_size(snapshot["total_size"]),
+                                              format_file_size(snapshot["new_blob_bytes"])))
+        total_size = sum(snapshot["total_size"] for snapshot in snapshots)
+        stored_size = sum(snapshot["new_blob_bytes"] for snapshot in snapshots)
+        self.summary_label.config(text=f"{len(snapshots)} anlık görüntü, toplam {format_file_size(total_size)} veri "
+                                       f"depoda {format_file_size(stored_size)} yer kaplıyor.")
+
+    def _selected_name(self):
+        """Seçili anlık görüntünün adını döndürür (seçim yoksa None)."""
+        selection = self.snapshot_tree.selection()
+        return selection[0] if selection else None
+
+    def _show_selected(self):
+        snapshot_name = self._selected_name()
+        if snapshot_name:
+            SnapshotContentsWindow(self.app, self.store, snapshot_name)
+
+    def _restore_selected(self):
+        snapshot_name = self._selected_name()
+        if snapshot_name:
+            self.app.action_manager.restore_store_snapshot(self.store, snapshot_name, parent=self)
+
+    def _delete_selected(self):
+        snapshot_name = self._selected_name()
+        if not snapshot_name:
+            return
+        if not messagebox.askyesno("Anlık Görüntüyü Sil",
+                                   f"'{snapshot_name}' silinsin mi?\n\nBaşka bir anlık görüntünün kullanmadığı "
+                                   "içerikler de depodan temizlenecek.", parent=self):
+            return
+        self.snapshot_tree.delete(snapshot_name)
+        self.app.action_manager.delete_store_snapshot(self.store, snapshot_name, on_deleted=self._refresh_if_open)
+
+    def _refresh_if_open(self):
+        if self.winfo_exists():
+            self._refresh()
+
+    def _on_closing(self):
+        geom = self.winfo_geometry()
+        self.app.db.save_window_geometry("backup_store", geom)
+        self.destroy()
+
+
+class SnapshotContentsWindow(tk.Toplevel):
+    """Depodaki bir anlık görüntünün dosyalarını ZipContentsWindow gibi listeleyen pencere."""
+
+    def __init__(self, app_instance, store, snapshot_name):
+        super().__init__(app_instance)
+        self.app = app_instance
+        self.store = store
+        self.snapshot_name = snapshot_name
+        try:
+            self.entries = store.load_snapshot(snapshot_name).get("files", [])
+        except Exception as e:
+            self.destroy()
+            messagebox.showerror("Depo Okuma Hatası", str(e), parent=app_instance)
+            return
+        self.title(f"Anlık Görüntü: {snapshot_name} ({len(self.entries)} öğe)")
+
+        self.app.load_or_center_window("snapshot_contents", self, 700, 500)
+
+        self.protocol("WM_DELETE_WINDOW", self._on_closing)
+        self.bind("<Escape>", lambda e: self._on_closing())
+
+        main_frame = ttk.Frame(self, padding="10")
+        main_frame.pack(expand=True, fill=tk.BOTH)
+        main_frame.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+
+        # Sütunlar: Ad, Tür, Boyut, Değiştirme Tarihi (ZipContentsWindow ile aynı)
+        self.contents_tree = ttk.Treeview(main_frame, columns=("type", "size", "modified"))
+        self.contents_tree.heading("#0", text="Ad", anchor='w')
+        self.contents_tree.heading("type", text="Tür", anchor='w')
+        self.contents_tree.heading("size", text="Boyut", anchor='e')
+        self.contents_tree.heading("modified", text="Değiştirilme Tarihi", anchor='w')
+
+        self.contents_tree.column("#0", width=300, stretch=tk.YES, anchor='w')
+        self.contents_tree.column("type", width=80, stretch=tk.NO, anchor='w')
+        self.contents_tree.column("size", width=100, stretch=tk.NO, anchor='e')
+        self.contents_tree.column("modified", width=150, stretch=tk.NO, anchor='w')
+
+        self.contents_tree.grid(row=0, column=0, sticky='nsew')
+        scrollbar_y = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=self.contents_tree.yview)
+        self.contents_tree.configure(yscrollcommand=scrollbar_y.set)
+        scrollbar_y.grid(row=0, column=1, sticky='ns')
+
+        scrollbar_x = ttk.Scrollbar(main_frame, orient=tk.HORIZONTAL, command=self.contents_tree.xview)
+        self.contents_tree.configure(xscrollcommand=scrollbar_x.set)
+        scrollbar_x.grid(row=1, column=0, sticky='ew')
+
+        for index, entry in enumerate(self.entries):
+            modified = datetime.fromtimestamp(entry["mtime"]).strftime("%Y-%m-%d %H:%M:%S")
+            self.contents_tree.insert("", tk.END, iid=str(index), text=entry["path"],
+                                      image=self._icon_for(entry["path"]) or "",
+                                      values=("Dosya", format_file_size(entry["size"]), modified))
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=(10, 0))
+        ttk.Button(button_frame, text="Tümünü Geri Yükle...",
+                   command=lambda: self.app.action_manager.restore_store_snapshot(store, snapshot_name, parent=self)
+                   ).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Kapat", command=self._on_closing).pack(side=tk.LEFT, padx=5)
+
+        self.contents_tree.bind("<Button-3>", self.show_context_menu)
+        self.contents_tree.bind("<Double-1>", lambda e: self.extract_file())
+        self.focus_set()
+
+    def _icon_for(self, path):
+        """Dosya türüne uygun ikonu döndürür (ZipContentsWindow ile aynı kurallar)."""
+        filename_lower = path.lower()
+        if filename_lower.endswith(".py"):
+            return self.app.file_icon
+        if filename_lower.endswith(".zip"):
+            return self.app.zip_icon
+        if filename_lower.endswith(".exe"):
+            return self.app.exe_icon
+        if filename_lower.endswith(".db"):
+            return self.app.db_icon
+        return self.app.unknown_icon
+
+    def show_context_menu(self, event):
+        """Sağ tık menüsünü gösterir."""
+        item = self.contents_tree.identify_row(event.y)
+        if not item:
+            return
+        self.contents_tree.selection_set(item)
+        self.contents_tree.focus(item)
+        context_menu = tk.Menu(self, tearoff=0)
+        context_menu.add_command(label="Çıkart...", command=self.extract_file)
+        try:
+            context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            context_menu.grab_release()
+
+    def extract_file(self):
+        """Seçili dosyayı depodan kullanıcının seçtiği konuma çıkartır."""
+        selected_item = self.contents_tree.focus()
+        if not selected_item:
+            return
+        entry = self.entries[int(selected_item)]
+        filename = entry["path"].rsplit("/", 1)[-1]
+        save_path = filedialog.asksaveasfilename(title=f"'{filename}' dosyasını nereye çıkartmak istiyorsunuz?",
+                                                 initialfile=filename, parent=self)
+        if not save_path:
+            return
+        try:
+            self.store.extract_file(entry, save_path)
+        except Exception as e:
+            print(f"HATA: Depodan dosya çıkartılırken hata oluştu: {e}")
+            messagebox.showerror("Çıkartma Hatası", f"Dosya çıkartılırken hata oluştu:\n{e}", parent=self)
+            return
+        messagebox.showinfo("Başarılı", f"'{filename}' dosyası başarıyla çıkartıldı:\n{save_path}", parent=self)
+        self.app.db.add_history(f"Depodan dosya çıkartıldı: '{entry['path']}' ({self.snapshot_name}) -> {save_path}",
+                                event_type="zip_extraction")
+
+    def _on_closing(self):
+        geom = self.winfo_geometry()
+        self.app.db.save_window_geometry("snapshot_contents", geom)
+        self.destroy()
+
+
 # --- Genel Ayarlar Penceresi Sınıfı ---
 class GeneralSettingsWindow(tk.Toplevel):
     """Program geneli ayarlar için pencere sınıfı."""
@@ -751,7 +1264,7 @@ class GeneralSettingsWindow(tk.Toplevel):
         self.grab_set()
         self.resizable(True, True)
 
-        self.app.load_or_center_window("general_settings", self, 500, 450)
+        self.app.load_or_center_window("general_settings", self, 500, 560)
 
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
         self.bind("<Escape>", lambda e: self._on_closing())
@@ -792,6 +1305,22 @@ class GeneralSettingsWindow(tk.Toplevel):
                                    font=("TkDefaultFont", 10), foreground="#045A5F")
         examples_label.pack(anchor=tk.W, pady=(0, 15))
 
+        # Geçmiş saklama süresi
+        ttk.Label(main_frame, text="Geçmiş Kayıtları",
+                  font=("TkDefaultFont", 11, "bold")).pack(anchor=tk.W, pady=(0, 5))
+        ttk.Label(main_frame,
+                  text="Bu süreden eski kayıtlar günlük özetlere dönüştürülür;\n"
+                       "istatistikler tüm zamanları kapsamaya devam eder.",
+                  font=("TkDefaultFont", 9),
+                  foreground="#061875").pack(anchor=tk.W, pady=(0, 5))
+        retention_frame = ttk.Frame(main_frame)
+        retention_frame.pack(fill=tk.X, pady=(0, 15))
+        ttk.Label(retention_frame, text="Saklama süresi (gün, 0 = sınırsız):").pack(side=tk.LEFT)
+        self.saved_retention_days = self.app.db.get_history_retention_days()
+        self.retention_var = tk.StringVar(value=str(self.saved_retention_days))
+        ttk.Spinbox(retention_frame, from_=0, to=36500, increment=30, width=8,
+                    textvariable=self.retention_var).pack(side=tk.LEFT, padx=(5, 0))
+
         # Butonlar
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(10, 0))
@@ -804,6 +1333,14 @@ class GeneralSettingsWindow(tk.Toplevel):
 
     def _on_save(self):
         """Ayarları kaydet ve pencereyi kapat."""
+        try:
+            retention_days = int(self.retention_var.get().strip())
+            if retention_days < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Hata", "Saklama süresi 0 veya pozitif bir tam sayı olmalıdır.", parent=self)
+            return
+
         exclusion_list = self.exclusion_text.get("1.0", tk.END).strip()
         # Virgüllerle ayrılmış değerleri normalize et
         if exclusion_list:
@@ -812,6 +1349,11 @@ class GeneralSettingsWindow(tk.Toplevel):
         
         self.app.db.set_global_exclusion_list(exclusion_list)
         print(f"🔧 DEBUG: Global exclusion list kaydedildi: '{exclusion_list}'")
+        if retention_days != self.saved_retention_days:
+            self.app.db.set_history_retention_days(retention_days)
+            print(f"🔧 DEBUG: Geçmiş saklama süresi kaydedildi: {retention_days} gün")
+            # Yeni süre hemen uygulansın
+            self.app.history_manager.schedule_history_compaction(force=True, delay_ms=0)
         messagebox.showinfo("Bilgi", "Genel ayarlar başarıyla kaydedildi.", parent=self)
         self._on_closing()
 
@@ -34,11 +34,13 @@ class UIManager:
         self.app.file_frame.columnconfigure(0, weight=1)
         self.app.file_frame.rowconfigure(0, weight=1)
 
-        self.app.file_list = ttk.Treeview(self.app.file_frame, columns=("description", "date_modified", "fullpath"), displaycolumns=("description", "date_modified"))
+        self.app.file_list = ttk.Treeview(self.app.file_frame, columns=("description", "date_modified", "fullpath", "size"), displaycolumns=("description", "size", "date_modified"))
         self.app.file_list.heading("#0", text="Dosya Adı", 
                                    command=lambda: self.app.sort_file_list_by_column("#0"))
         self.app.file_list.heading("description", text="Açıklama",
                                    command=lambda: self.app.sort_file_list_by_column("description"))
+        self.app.file_list.heading("size", text="Boyut",
+                                   command=lambda: self.app.sort_file_list_by_column("size"))
         self.app.file_list.heading("date_modified", text="Değiştirme Tarihi",
                                    command=lambda: self.app.sort_file_list_by_column("date_modified"))
         # self.app.file_list.heading("#0", text="Dosya Adı")
@@ -47,6 +49,7 @@ class UIManager:
 
         self.app.file_list.column("#0", width=250, stretch=tk.YES, anchor='w')
         self.app.file_list.column("description", width=300, stretch=tk.YES, anchor='w')
+        self.app.file_list.column("size", width=90, stretch=tk.NO, anchor='e')
         self.app.file_list.column("date_modified", width=150, stretch=tk.NO, anchor='w')
 
         # Sütun genişliklerinin yüklenmesi artık FileBrowser.populate_file_list içinde yapılacak.
@@ -136,7 +139,16 @@ class UIManager:
         # activity_progressbar her zaman sağda kalacak şekilde en son pack edilecek.
         self.app.activity_progressbar.pack(side=tk.RIGHT, padx=5, pady=2)
 
-        self.app.long_operation_in_progress = False
+        # İlerleme çubuğunun yanında, sadece iş sürerken görünen İptal ve İşler butonları
+        self.app.cancel_operation_button = ttk.Button(self.app.status_bar_frame, text="İptal",
+                                                      command=self.cancel_current_operation)
+        self.app.jobs_button = ttk.Button(self.app.status_bar_frame, text="İşler",
+                                          command=self.app.open_jobs_window)
+
+        # İlerleme çubuğu ve butonlar zamanlayıcıdaki işlere göre güncellenir
+        self._progress_mode = None # None: gizli, 'determinate' veya 'indeterminate'
+        self.app.job_scheduler.add_listener(self._on_jobs_changed)
+        self._on_jobs_changed()
         self.app._mp3_polling_active = False
         self.app._user_is_seeking_mp3 = False # Kullanıcı seek bar'ı aktif olarak kullanıyor mu?
 
@@ -165,6 +177,8 @@ class UIManager:
         self.app.menu_bar.add_cascade(label="Görünüm", menu=view_menu)
         view_menu.add_command(label="Favoriler Panelini Göster/Gizle", command=self.app.favorites_manager._toggle_favorites_panel, accelerator="Ctrl+B")
         view_menu.add_command(label="Geçmiş İşlemler...", command=self.app.history_manager.show_history, accelerator="Ctrl+H")
+        view_menu.add_command(label="İşler...", command=self.app.open_jobs_window)
+        view_menu.add_command(label="Yedek Deposu...", command=self.app.open_backup_store_window)
         theme_menu = tk.Menu(view_menu, tearoff=0)
         view_menu.add_cascade(label="Temalar", menu=theme_menu)
         theme_menu.add_command(label="Tema Yönetimi...", command=self.app.theme_manager.manage_themes, accelerator="Ctrl+T")
@@ -176,6 +190,58 @@ class UIManager:
 
         self.app.bind('<F5>', lambda e: self._refresh_selected_folder())
 
+    def _on_jobs_changed(self):
+        """Zamanlayıcıdaki işler değiştiğinde ilerleme çubuğunu ve butonları günceller.
+
+        Tek bir iş çalışıyorsa ve ilerleme oranı biliniyorsa çubuk oranı gösterir,
+        aksi halde belirsiz modda döner. İş kalmadığında çubuk ve butonlar gizlenir.
+        """
+        active_jobs = self.app.job_scheduler.get_active_jobs()
+        progressbar = self.app.activity_progressbar
+
+        if not active_jobs:
+            progressbar.stop()
+            progressbar.pack_forget()
+            self.app.cancel_operation_button.pack_forget()
+            self.app.jobs_button.pack_forget()
+            self._progress_mode = None
+            return
+
+        if self._progress_mode is None:
+            progressbar.pack(side=tk.RIGHT, padx=5, pady=2)
+            self.app.cancel_operation_button.pack(side=tk.RIGHT, padx=(5, 0), pady=2)
+            self.app.jobs_button.pack(side=tk.RIGHT, padx=(5, 0), pady=2)
+
+        running = [job for job in active_jobs if job.status == job.STATUS_RUNNING]
+        if len(running) == 1 and running[0].progress is not None:
+            if self._progress_mode != 'determinate':
+                progressbar.stop()
+                progressbar.config(mode='determinate', maximum=100)
+                self._progress_mode = 'determinate'
+            progressbar.config(value=running[0].progress * 100)
+        elif self._progress_mode != 'indeterminate':
+            progressbar.config(mode='indeterminate', value=0)
+            progressbar.start(10)
+            self._progress_mode = 'indeterminate'
+
+        self.app.jobs_button.config(text=f"İşler ({len(active_jobs)})")
+        # İptal edilebilecek iş kalmadıysa İptal butonu pasif olur
+        cancellable = any(not job.cancel_token.is_cancelled for job in active_jobs)
+        self.app.cancel_operation_button.config(state=tk.NORMAL if cancellable else tk.DISABLED)
+
+    def cancel_current_operation(self):
+        """En son başlatılan aktif işi iptal eder; iş bir sonraki kontrol noktasında durur.
+
+        Diğer işler İşler panelinden tek tek iptal edilebilir.
+        """
+        active_jobs = [job for job in self.app.job_scheduler.get_active_jobs() if not job.cancel_token.is_cancelled]
+        if not active_jobs:
+            return
+        newest = max(active_jobs, key=lambda job: job.job_id)
+        newest.cancel()
+        self.app.status_label.config(text=f"İptal ediliyor: {newest.title}")
+        print(f"🔧 DEBUG: İş iptali istendi #{newest.job_id}: {newest.title}")
+
     def _refresh_selected_folder(self):
         """Seçili olan klasörün içeriğini yeniden günceller."""
         # selected_item = self.app.dir_tree.focus()
@@ -185,7 +251,9 @@ class UIManager:
 
         folder_path = self.app.current_folder
         print(f"✨ Güncellenen klasör: {folder_path}")
-        
+
+        # Yenileme istendiğinde önbellekteki listelemelere güvenilmez
+        self.app.file_browser.listing_cache.clear()
         self.app.file_browser.populate_tree(self.app.current_folder) # Kendi içindeki populate_tree'yi çağırır
         # Yeni kök seçildiğinde dosya listesini temizle (file_list App'de olduğu için App üzerinden)
         for i in self.app.file_list.get_children():
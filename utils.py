@@ -2,7 +2,9 @@
 
 # --- Sabitler ---
 BACKUP_FOLDER_BASENAME = "backups" # Yedekleme klasörünün temel adı
+BACKUP_STORE_DIRNAME = "store" # Yedekleme klasörü içindeki içerik adresli yedek deposu
 DB_NAME = "program_manager_data.db"
+FILE_INDEX_DB_NAME = "program_manager_index.db" # Dosya arama indeksi (ayrı SQLite dosyası)
 
 DEFAULT_DARK_THEME_COLORS = {
     "main_bg": "#2E3B4E",          # Ana pencere arka planı